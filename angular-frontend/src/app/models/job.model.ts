@@ -14,6 +14,7 @@ export interface Job {
   location?: string;
   region?: string;
   city?: string;
+  country?: string;
   salary_min?: number;
   salary_max?: number;
   description?: string;
@@ -0,0 +1,89 @@
+"""
+Cleaning engine benchmark: original mappers vs the engine, row-wise and vectorized.
+
+Builds a synthetic raw frame per source by tiling the sample rows in
+src/Data (links made unique) up to --rows rows, then times, in rows per
+second:
+
+  - baseline: the original map_*_to_standard, one Series.apply per column
+    (copied in src/benchmarks/baseline);
+  - row-wise: the engine's map_*_to_standard with vectorized=False, its
+    per-value reference implementation;
+  - vectorized: the engine's map_*_to_standard as the cleaners run it.
+
+The speedup is vectorized over baseline.
+
+    python -m src.benchmarks.bench_cleaning_engine --rows 1000000
+"""
+import time
+import argparse
+import pandas as pd
+from src.cleaning.keejobs_cleaning import map_keejob_to_standard
+from src.cleaning.emploisTunisie_cleaning import map_emploitunisie_to_standard
+from src.cleaning.optioncarrier_cleaning import map_optioncarriere_to_standard
+from src.benchmarks.baseline import keejobs_cleaning, emploisTunisie_cleaning, optioncarrier_cleaning
+
+
+def sample_keejob():
+    return pd.read_csv("src/Data/rawData/job_keejobs.csv", encoding="utf-8-sig")
+
+
+def sample_optioncarriere():
+    return pd.read_csv("src/Data/rawData/jobs_optioncarriere.csv", encoding="utf-8-sig",
+                       engine="python", escapechar="\\", on_bad_lines="skip")
+
+
+def sample_emploitunisie():
+    # pas de brut versionné pour EmploiTunisie : on repart du fichier nettoyé
+    df = pd.read_csv("src/Data/cleanedData/job_emploisTunisie_cleaned.csv", encoding="utf-8-sig")
+    df = df.rename(columns={"availability": "remote"})
+    df["title"] = df["title"] + " - " + df["city"].fillna("")
+    # salaire en texte, comme le scraper l'écrit
+    df["salary"] = df["salary_max"].map("{:g}".format, na_action="ignore")
+    return df
+
+
+# (source, sample, engine mapper, original mapper)
+SOURCES = [
+    ("keejob", sample_keejob, map_keejob_to_standard, keejobs_cleaning.map_keejob_to_standard),
+    ("emploitunisie", sample_emploitunisie, map_emploitunisie_to_standard,
+     emploisTunisie_cleaning.map_emploitunisie_to_standard),
+    ("optioncarriere", sample_optioncarriere, map_optioncarriere_to_standard,
+     optioncarrier_cleaning.map_optioncarriere_to_standard),
+]
+
+
+def tile(df, rows):
+    df = pd.concat([df] * (rows // len(df) + 1), ignore_index=True).iloc[:rows]
+    df["detail_link"] = df["detail_link"].astype(str) + "?n=" + pd.Series(range(len(df))).astype(str)
+    return df
+
+
+def rows_per_sec(mapper, df, **kwargs):
+    start = time.perf_counter()
+    mapper(df, **kwargs)
+    return len(df) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--skip-rowwise", action="store_true",
+                        help="ne mesure que le moteur vectorisé (ni baseline ni row-wise)")
+    args = parser.parse_args()
+
+    print(f"{'source':16} {'rows':>9} {'baseline r/s':>13} {'row-wise r/s':>13} "
+          f"{'vectorized r/s':>15} {'speedup':>8}")
+    for name, sample, mapper, original in SOURCES:
+        df = tile(sample(), args.rows)
+        vec = rows_per_sec(mapper, df)
+        if args.skip_rowwise:
+            print(f"{name:16} {len(df):>9} {'-':>13} {'-':>13} {vec:>15,.0f} {'-':>8}")
+            continue
+        base = rows_per_sec(original, df)
+        ref = rows_per_sec(mapper, df, vectorized=False)
+        print(f"{name:16} {len(df):>9} {base:>13,.0f} {ref:>13,.0f} {vec:>15,.0f} {vec / base:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
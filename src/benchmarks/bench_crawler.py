@@ -0,0 +1,129 @@
+"""
+Detail page crawler benchmark: one page at a time vs the asyncio crawler.
+
+Serves --pages detail pages per source from a local fixture server
+(fixture_server.py) with --latency seconds of simulated server time, then
+measures pages per second of fetching and parsing them one after another
+(fetch.fetch_page + the scraper's parser) and through crawler.Crawler at
+each --concurrency, with --delay seconds between two request starts on
+the host (0 by default: this measures the engine, not the politeness
+limit). Every parsed record is compared with the raw row its page was
+rendered from, and any mismatch exits with an error. The browser line is
+the ceiling of the old Selenium loop, which slept DETAIL_DELAY seconds per
+page whatever the server time.
+
+    python -m src.benchmarks.bench_crawler --pages 200 --latency 0.2
+    python -m src.benchmarks.bench_crawler --error-rate 0.05 --pages 20 --crawl-delay 1
+"""
+import sys
+import time
+import asyncio
+import argparse
+from src.scrapers import fetch, crawler
+from src.scrapers import keejobs, emploisTunisie, optioncarrier
+from src.benchmarks.fixture_server import FixtureServer
+
+# time.sleep per detail page of the Selenium scrapers
+DETAIL_DELAY = 2
+
+# source: (parser, ready selector, fields compared with the raw row)
+PARSERS = {
+    "keejob": (keejobs.parse_details, keejobs.DETAIL_READY,
+               ["sector", "contract_type", "date_publication", "location", "salary",
+                "study_level", "experience", "availability", "description"]),
+    "emploitunisie": (emploisTunisie.parse_details, emploisTunisie.DETAIL_READY,
+                      ["sector", "contract_type", "region", "city", "salary", "study_level",
+                       "experience", "remote", "description", "skills"]),
+    "optioncarriere": (optioncarrier.parse_detail_page, optioncarrier.DETAIL_READY,
+                       ["title", "company", "location", "contract", "work_type",
+                        "posted_relative", "raw_content"]),
+}
+
+
+def _value(value):
+    # absent field: None in the row, None or "" from the parser
+    return None if value is None or value != value or value == "" else str(value)
+
+
+def field_mismatches(label, record, expected, fields):
+    """Printable differences between a parsed record and the expected values of its fields."""
+    if record is None:
+        return [f"  {label}: not parsed"]
+    return [f"  {label} {field}: expected {expected.get(field)!r}, got {record.get(field)!r}"
+            for field in fields if _value(record.get(field)) != _value(expected.get(field))]
+
+
+def mismatches(server, source, records):
+    """Printable mismatches between parsed records {n: record} and their rows."""
+    fields = PARSERS[source][2]
+    errors = []
+    for n, record in records.items():
+        errors += field_mismatches(f"{source}/{n}", record, server.row(source, n), fields)
+    return errors
+
+
+def sequential(server, source, pages):
+    parse, ready, _ = PARSERS[source]
+    records = {}
+    for n in range(pages):
+        page = fetch.fetch_page(server.url(source, n))
+        records[n] = parse(page) if fetch.is_ready(page, ready) else None
+    return records
+
+
+def concurrent(server, source, pages, concurrency, args):
+    parse, ready, _ = PARSERS[source]
+    engine = crawler.Crawler(parse, ready, concurrency=concurrency, per_host=concurrency,
+                             delay=args.delay, retries=args.retries, backoff=args.backoff)
+    urls = {server.url(source, n): n for n in range(pages)}
+
+    async def run():
+        return {urls[url]: record async for url, record in engine.crawl(urls)}
+
+    records = asyncio.run(run())
+    return records, engine.retried
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=200, help="pages per source")
+    parser.add_argument("--latency", type=float, default=0.2, help="simulated server seconds per page")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--sources", nargs="+", choices=list(PARSERS), default=list(PARSERS))
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds between requests per host")
+    parser.add_argument("--crawl-delay", type=int, help="Crawl-delay served in robots.txt (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 answers")
+    parser.add_argument("--retries", type=int, default=crawler.RETRIES)
+    parser.add_argument("--backoff", type=float, default=0.05)
+    args = parser.parse_args()
+
+    errors = []
+    with FixtureServer(args.pages, args.latency, args.crawl_delay, args.error_rate) as server:
+        print(f"{args.pages} pages per source, {args.latency * 1000:.0f} ms server time, "
+              f"{args.error_rate:.0%} errors")
+        print(f"{'source':15} {'mode':16} {'pages/s':>9} {'speedup':>8} {'retries':>8}")
+        for source in args.sources:
+            print(f"{source:15} {'browser (sleep)':16} {1 / DETAIL_DELAY:>9.1f}")
+            if not args.error_rate:  # without retries, errors would fail the check
+                start = time.perf_counter()
+                records = sequential(server, source, args.pages)
+                base = args.pages / (time.perf_counter() - start)
+                errors += mismatches(server, source, records)
+                print(f"{source:15} {'http sequential':16} {base:>9.1f} {base * DETAIL_DELAY:>7.1f}x")
+            for concurrency in args.concurrency:
+                start = time.perf_counter()
+                records, retried = concurrent(server, source, args.pages, concurrency, args)
+                rate = args.pages / (time.perf_counter() - start)
+                errors += mismatches(server, source, records)
+                print(f"{source:15} {f'crawler x{concurrency}':16} {rate:>9.1f} "
+                      f"{rate * DETAIL_DELAY:>7.1f}x {retried:>8}")
+
+    if errors:
+        print(f"\n{len(errors)} field mismatches:")
+        print("\n".join(errors[:50]))
+        sys.exit(1)
+    print("\nall parsed records match their fixture rows")
+
+
+if __name__ == "__main__":
+    main()
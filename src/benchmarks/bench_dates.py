@@ -0,0 +1,91 @@
+"""
+Publication date benchmark: row-wise parser vs the vectorized date engine.
+
+First checks both parsers against the golden cases in
+src/Data/reference/dates_golden.csv (value, scraped_at, expected; an empty
+scraped_at means "now", written TODAY or TODAY-n in expected) and exits
+with an error on any mismatch. Then builds --rows rows drawing values from
+the golden cases and the scraped samples, with --distinct distinct
+scraped_at instants, and prints rows per second for
+scalar.parse_relative_date (one row at a time) and vector.parse_dates.
+
+    python -m src.benchmarks.bench_dates --rows 1000000
+"""
+import sys
+import time
+import argparse
+import pandas as pd
+from datetime import datetime, timedelta
+from src.cleaning.engine import scalar, vector
+
+GOLDEN_PATH = "src/Data/reference/dates_golden.csv"
+
+
+def golden_cases():
+    df = pd.read_csv(GOLDEN_PATH, dtype=str, keep_default_na=False)
+    today = datetime.now()
+    for n in range(0, 31):
+        token = "TODAY" if n == 0 else f"TODAY-{n}"
+        df["expected"] = df["expected"].replace(token, (today - timedelta(days=n)).strftime("%Y-%m-%d"))
+    df["scraped_at"] = df["scraped_at"].where(df["scraped_at"] != "")
+    return df
+
+
+def check_golden(df):
+    """Mismatches of both parsers, as printable lines."""
+    vec = vector.parse_dates(df["value"], reference=df["scraped_at"])
+    errors = []
+    for value, ref, expected, got_vec in zip(df["value"], df["scraped_at"], df["expected"], vec):
+        got_row = scalar.parse_relative_date(value, ref)
+        if not expected == got_vec == got_row:
+            errors.append(f"  {value!r} @ {ref}: expected {expected!r}, "
+                          f"vectorized {got_vec!r}, row-wise {got_row!r}")
+    return errors
+
+
+def synthetic(golden, rows, distinct):
+    raw = pd.read_csv("src/Data/rawData/jobs_optioncarriere.csv", encoding="utf-8-sig",
+                      engine="python", escapechar="\\", on_bad_lines="skip")
+    pool = pd.concat([golden["value"], raw["posted_relative"].dropna()], ignore_index=True)
+    values = pool.sample(rows, replace=True, random_state=0).reset_index(drop=True)
+    start = pd.Timestamp("2025-11-01 08:00:00")
+    instants = (start + pd.to_timedelta(range(distinct), unit="min")).strftime("%Y-%m-%d %H:%M:%S")
+    scraped_at = pd.Series(instants).sample(rows, replace=True, random_state=1).reset_index(drop=True)
+    return values, scraped_at
+
+
+def rows_per_sec(fn, rows):
+    start = time.perf_counter()
+    fn()
+    return rows / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=10_000,
+                        help="nombre de scraped_at distincts")
+    parser.add_argument("--rowwise-rows", type=int, default=100_000,
+                        help="lignes mesurées pour le parseur ligne par ligne")
+    args = parser.parse_args()
+
+    golden = golden_cases()
+    errors = check_golden(golden)
+    if errors:
+        print(f"{len(errors)}/{len(golden)} golden cases failed:")
+        print("\n".join(errors))
+        sys.exit(1)
+    print(f"golden: {len(golden)}/{len(golden)} cases ok")
+
+    values, scraped_at = synthetic(golden, args.rows, args.distinct)
+    n_row = min(args.rowwise_rows, args.rows)
+    row_values, row_refs = values[:n_row].tolist(), scraped_at[:n_row].tolist()
+    ref = rows_per_sec(lambda: [scalar.parse_relative_date(v, r) for v, r in zip(row_values, row_refs)],
+                       n_row)
+    vec = rows_per_sec(lambda: vector.parse_dates(values, reference=scraped_at), args.rows)
+    print(f"{'rows':>9} {'row-wise r/s':>13} {'vectorized r/s':>15} {'speedup':>8}")
+    print(f"{args.rows:>9} {ref:>13,.0f} {vec:>15,.0f} {vec / ref:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
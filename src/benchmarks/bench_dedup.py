@@ -0,0 +1,83 @@
+"""
+Near-duplicate detection benchmark: MinHash + LSH on synthetic job postings.
+
+Builds --sizes documents from the vocabulary of the sample descriptions
+(random texts of 80-300 words), re-posts --dup-rate of them on another board
+with ~5% of the words changed, and times shingling + MinHash and LSH +
+clustering. Reports how many injected duplicates were found and how many
+clustered pairs were not injected. Time per document should stay flat as the
+corpus grows, since no step compares all pairs.
+
+    python -m src.benchmarks.bench_dedup --sizes 10000 100000
+"""
+import time
+import uuid
+import random
+import argparse
+import pandas as pd
+from src.loadDB import dedup
+
+
+def vocabulary():
+    words = set()
+    for path in ("src/Data/cleanedData/job_keejobs_cleaned.csv",
+                 "src/Data/cleanedData/jobs_optioncarriere_cleaned.csv"):
+        df = pd.read_csv(path, encoding="utf-8-sig", dtype=str)
+        for text in df["description"].dropna():
+            words.update(text.split())
+    return sorted(words)
+
+
+def synthetic_rows(n, dup_rate, vocab, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    n_dups = int(n * dup_rate)
+    for i in range(n - n_dups):
+        rows.append({
+            "id": i, "job_id": uuid.uuid4(), "source": rng.choice(["keejob", "emploitunisie"]),
+            "title": " ".join(rng.choices(vocab, k=5)), "company": rng.choice(vocab),
+            "description": " ".join(rng.choices(vocab, k=rng.randint(80, 300))),
+        })
+    originals = rng.sample(range(len(rows)), n_dups)
+    for k in originals:
+        words = rows[k]["description"].split()
+        for _ in range(len(words) // 20):
+            words[rng.randrange(len(words))] = rng.choice(vocab)
+        rows.append(dict(rows[k], id=len(rows), job_id=uuid.uuid4(), source="optioncarriere",
+                         description=" ".join(words)))
+    for row in rows:
+        for field in dedup.COMPLETENESS_FIELDS:
+            row.setdefault(field, None)
+    injected = {(rows[k]["job_id"], rows[n - n_dups + i]["job_id"]) for i, k in enumerate(originals)}
+    return rows, injected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--dup-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    vocab = vocabulary()
+    print(f"{'docs':>8} {'minhash s':>10} {'lsh s':>8} {'us/doc':>8} {'candidates':>11} "
+          f"{'found':>12} {'extra':>6}")
+    for n in args.sizes:
+        rows, injected = synthetic_rows(n, args.dup_rate, vocab)
+        meta = {"id": [], "job_id": [], "source": [], "completeness": []}
+
+        start = time.perf_counter()
+        sig = dedup.signatures_from_rows(rows, meta)
+        t_sig = time.perf_counter() - start
+        start = time.perf_counter()
+        clusters, n_candidates = dedup.find_clusters(meta, sig)
+        t_lsh = time.perf_counter() - start
+
+        cluster_of = {r["job_id"]: r["cluster_id"] for r in clusters}
+        found = sum(1 for a, b in injected if a in cluster_of and cluster_of[a] == cluster_of.get(b))
+        extra = len(clusters) - 2 * found
+        print(f"{n:>8} {t_sig:>10.2f} {t_lsh:>8.2f} {(t_sig + t_lsh) / n * 1e6:>8.0f} {n_candidates:>11} "
+              f"{found:>6}/{len(injected):<5} {extra:>6}")
+
+
+if __name__ == "__main__":
+    main()
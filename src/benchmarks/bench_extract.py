@@ -0,0 +1,89 @@
+"""
+In-browser extraction benchmark: WebDriver commands and time per detail page.
+
+Serves --pages detail pages per source from the local fixture server
+(fixture_server.py), loads each one in the lean headless Chrome
+(browser_profile.py) and reads it twice: with the chained find_element /
+.text lookups (the scraper's read_details) and with the site's single
+execute_script (DETAIL_SCRIPT). Page loads are not measured; for each way
+the WebDriver commands sent and the extraction wall time are counted, and
+both records are checked against the row the page was rendered from.
+Needs Chrome and chromedriver.
+
+    python -m src.benchmarks.bench_extract --pages 20
+"""
+import sys
+import time
+import argparse
+import statistics
+from src.scrapers import fetch, browser_profile
+from src.scrapers import keejobs, emploisTunisie, optioncarrier
+from src.benchmarks.fixture_server import FixtureServer
+from src.benchmarks.bench_crawler import PARSERS, mismatches
+
+# source: element by element reader of the scraper
+CHAINED = {
+    "keejob": keejobs.read_details,
+    "emploitunisie": emploisTunisie.read_details,
+    "optioncarriere": optioncarrier.read_detail_page,
+}
+
+
+class CommandCounter:
+    """Counts the WebDriver commands a driver sends (elements go through driver.execute too)."""
+
+    def __init__(self, driver):
+        self.count = 0
+        send = driver.execute
+
+        def execute(*args, **kwargs):
+            self.count += 1
+            return send(*args, **kwargs)
+
+        driver.execute = execute
+
+
+def measure(driver, counter, read):
+    """(record, WebDriver commands, seconds) of one read of the loaded page."""
+    counter.count = 0
+    start = time.perf_counter()
+    record = read(driver)
+    return record, counter.count, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=20, help="detail pages per source")
+    parser.add_argument("--sources", nargs="+", choices=list(PARSERS), default=list(PARSERS))
+    args = parser.parse_args()
+
+    errors = []
+    driver = browser_profile.new_driver()
+    counter = CommandCounter(driver)
+    print(f"{'source':15} {'extraction':11} {'commands':>9} {'ms/page':>8}")
+    try:
+        with FixtureServer(args.pages) as server:
+            for source in args.sources:
+                parse, ready, _ = PARSERS[source]
+                ways = {"chained": CHAINED[source], "script": parse}
+                results = {way: {} for way in ways}
+                for n in range(args.pages):
+                    fetch.browser_page(driver, server.url(source, n), ready)
+                    for way, read in ways.items():
+                        results[way][n] = measure(driver, counter, read)
+                for way, measures in results.items():
+                    errors += mismatches(server, source, {n: m[0] for n, m in measures.items()})
+                    commands = statistics.mean(m[1] for m in measures.values())
+                    ms = statistics.median(m[2] for m in measures.values()) * 1e3
+                    print(f"{source:15} {way:11} {commands:>9.1f} {ms:>8.1f}")
+    finally:
+        driver.quit()
+
+    if errors:
+        print(f"\n{len(errors)} field mismatches:")
+        print("\n".join(errors[:50]))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
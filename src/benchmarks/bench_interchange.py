@@ -0,0 +1,87 @@
+"""
+Cleaned-data interchange benchmark: CSV vs Parquet.
+
+For each cleaned CSV (tiled up to --rows rows so the numbers mean something)
+compares file size and the time the loader spends reading it back and
+converting it to jobs rows: the pd.read_csv(dtype=str) path, which re-parses
+every date/number from text, vs typed Arrow record batches from Parquet.
+
+Tiled rows repeat the same texts, so Parquet sizes here are a lower bound;
+titles and links are made unique to keep the key columns realistic.
+
+    python -m src.benchmarks.bench_interchange --rows 200000
+"""
+import os
+import time
+import argparse
+import tempfile
+import pandas as pd
+from src.cleaning.cleaned_io import write_cleaned, parquet_path_for, iter_parquet_records
+from src.loadDB.loadData import csv_files, CHUNK_SIZE, convert_records
+from src.loadDB.run_report import FileReport
+from src.identity import job_key
+
+
+def timed(fn):
+    start = time.perf_counter()
+    n = fn()
+    return time.perf_counter() - start, n
+
+
+def read_csv_rows(path, report):
+    n = 0
+    for chunk in pd.read_csv(path, encoding="utf-8-sig", dtype=str, chunksize=CHUNK_SIZE):
+        n += len(convert_records(chunk.fillna("").to_dict("records"), report))
+    return n
+
+
+def read_parquet_rows(path, report):
+    return sum(len(convert_records(batch, report)) for batch in iter_parquet_records(path, CHUNK_SIZE))
+
+
+def bench_file(csv_path, rows, tmp_dir):
+    df = pd.read_csv(csv_path, encoding="utf-8-sig", dtype=str)
+    if df.empty:
+        return None
+    df = pd.concat([df] * (rows // len(df) + 1), ignore_index=True).iloc[:rows]
+    suffix = pd.Series(range(len(df))).astype(str)
+    df["title"] = df["title"].fillna("") + " #" + suffix
+    df["detail_link"] = df["detail_link"].fillna("") + "/" + suffix
+    df["job_id"] = [str(job_key(link)) for link in df["detail_link"]]
+
+    out_csv = os.path.join(tmp_dir, os.path.basename(csv_path))
+    write_cleaned(df, out_csv, export_csv=True)
+    out_parquet = parquet_path_for(out_csv)
+
+    report = FileReport(out_csv)
+    csv_time, _ = timed(lambda: read_csv_rows(out_csv, report))
+    parquet_time, _ = timed(lambda: read_parquet_rows(out_parquet, report))
+    report.close()
+    return {
+        "file": os.path.basename(csv_path),
+        "rows": len(df),
+        "csv_mb": os.path.getsize(out_csv) / 1e6,
+        "parquet_mb": os.path.getsize(out_parquet) / 1e6,
+        "csv_read_s": csv_time,
+        "parquet_read_s": parquet_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'file':40} {'rows':>8} {'csv MB':>8} {'pq MB':>8} {'csv s':>8} {'pq s':>8} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for csv_path in csv_files:
+            r = bench_file(csv_path, args.rows, tmp_dir)
+            if r is None:
+                continue
+            print(f"{r['file']:40} {r['rows']:>8} {r['csv_mb']:>8.1f} {r['parquet_mb']:>8.1f} "
+                  f"{r['csv_read_s']:>8.2f} {r['parquet_read_s']:>8.2f} "
+                  f"{r['csv_read_s'] / r['parquet_read_s']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
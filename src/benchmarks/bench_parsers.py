@@ -0,0 +1,79 @@
+"""
+Offline parser benchmark: detail pages parsed per second, checked field by field.
+
+Runs each scraper's pure parser (HTML -> record: keejobs.details_from_html,
+emploisTunisie.details_from_html, optioncarrier.detail_from_html) over the
+pages recorded in src/Data/fixtures (record_fixtures.py) and over
+--synthetic pages rendered from synthetic rows with the sites' markup
+(fixture_server.py). No network, no browser: the time is HTML parsing and
+field extraction only, the best of --repeat passes. Every record is
+compared with its expected one (expected.json for a recorded page, the raw
+row for a synthetic one) and any mismatch exits with an error, so this is
+also the parsers' regression check.
+
+    python -m src.benchmarks.bench_parsers --synthetic 500
+"""
+import sys
+import time
+import argparse
+from src.benchmarks import synthetic
+from src.benchmarks.fixture_server import RENDERERS
+from src.benchmarks.bench_crawler import PARSERS, field_mismatches
+from src.benchmarks.record_fixtures import HTML_PARSERS, load_fixtures
+
+
+def synthetic_pages(source, pages, seed=0):
+    """[(label, url, html, expected record, compared fields)] rendered from synthetic rows."""
+    rows = synthetic.generate(source, pages, seed).to_dict("records")
+    return [(f"{source}/synthetic/{n}", f"http://fixtures.local/{source}/{n}", RENDERERS[source](row),
+             row, PARSERS[source][2]) for n, row in enumerate(rows)]
+
+
+def recorded_pages(source):
+    """[(label, url, html, expected record, compared fields)] of the recorded fixtures."""
+    return [(f"{source}/{f['file']}", f["url"], f["html"], f["record"], list(f["record"]))
+            for f in load_fixtures(source)]
+
+
+def run(parse, pages, repeat):
+    """(records, pages per second): best pass of `repeat`."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = [parse(html, url) for _, url, html, _, _ in pages]
+        best = min(best, time.perf_counter() - start)
+    return records, len(pages) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--synthetic", type=int, default=200, help="synthetic pages per source (0: none)")
+    parser.add_argument("--sources", nargs="+", choices=list(HTML_PARSERS), default=list(HTML_PARSERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    errors = []
+    print(f"{'source':15} {'pages':10} {'count':>6} {'pages/s':>9} {'ms/page':>8}")
+    for source in args.sources:
+        parse, _ = HTML_PARSERS[source]
+        sets = {"recorded": recorded_pages(source)}
+        if args.synthetic:
+            sets["synthetic"] = synthetic_pages(source, args.synthetic)
+        for kind, pages in sets.items():
+            if not pages:
+                print(f"{source:15} {kind:10} {0:>6} (none, see record_fixtures.py)")
+                continue
+            records, rate = run(parse, pages, args.repeat)
+            for (label, _, _, expected, fields), record in zip(pages, records):
+                errors += field_mismatches(label, record, expected, fields)
+            print(f"{source:15} {kind:10} {len(pages):>6} {rate:>9.0f} {1e3 / rate:>8.2f}")
+
+    if errors:
+        print(f"\n{len(errors)} field mismatches:")
+        print("\n".join(errors[:50]))
+        sys.exit(1)
+    print("\nall parsed records match their expected fields")
+
+
+if __name__ == "__main__":
+    main()
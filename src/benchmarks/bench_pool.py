@@ -0,0 +1,54 @@
+"""
+WebDriver pool benchmark: detail pages per second by pool size.
+
+Serves --pages detail pages of one source from the local fixture server
+(fixture_server.py) and loads them all through driver_pool.DriverPool at
+each --sizes (capped at driver_pool.MAX_SIZE, the CPU count), parsing each
+one with the scraper's parser, and checks the records against their rows.
+Chrome startup is not timed: the pool is warmed up with one page per
+worker first. Needs Chrome and chromedriver.
+
+    python -m src.benchmarks.bench_pool --sizes 1 2 4 --pages 40
+"""
+import sys
+import time
+import argparse
+from src.scrapers import fetch, driver_pool
+from src.benchmarks.fixture_server import FixtureServer
+from src.benchmarks.bench_crawler import PARSERS, mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--source", choices=list(PARSERS), default="keejob")
+    parser.add_argument("--latency", type=float, default=0.1, help="simulated server seconds per page")
+    args = parser.parse_args()
+
+    parse, ready, _ = PARSERS[args.source]
+    errors = []
+    with FixtureServer(args.pages, args.latency) as server:
+        urls = {server.url(args.source, n): n for n in range(args.pages)}
+
+        def load(driver, url):
+            return parse(fetch.browser_page(driver, url, ready))
+
+        print(f"{'size':>5} {'pages/s':>9} {'per worker':>11}")
+        for size in args.sizes:
+            with driver_pool.DriverPool(size=size) as pool:
+                list(pool.map(load, list(urls)[:pool.size]))  # Chrome startup, not timed
+                start = time.perf_counter()
+                records = {urls[url]: record for url, record in pool.map(load, urls)}
+                rate = args.pages / (time.perf_counter() - start)
+                errors += mismatches(server, args.source, records)
+                print(f"{pool.size:>5} {rate:>9.2f} {rate / pool.size:>11.2f}")
+
+    if errors:
+        print(f"\n{len(errors)} field mismatches:")
+        print("\n".join(errors[:50]))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
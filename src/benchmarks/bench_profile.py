@@ -0,0 +1,91 @@
+"""
+Browser profile benchmark: bytes and load time per detail page, plain vs lean Chrome.
+
+Loads --pages detail pages per site (links taken from the cleaned CSVs) in
+a plain headless Chrome and in the lean scraping profile
+(browser_profile.py). Both use the "normal" page load strategy, so each
+load covers the complete page. Chrome's performance log gives, per page,
+the bytes received (Network.loadingFinished encodedDataLength), the
+requests sent and the requests blocked; load time is the driver.get()
+wall time. Needs Chrome and network access.
+
+    python -m src.benchmarks.bench_profile --pages 6
+"""
+import json
+import time
+import argparse
+import statistics
+import pandas as pd
+from src.scrapers import browser_profile
+
+LINKS = {
+    "keejob": "src/Data/cleanedData/job_keejobs_cleaned.csv",
+    "emploitunisie": "src/Data/cleanedData/job_emploisTunisie_cleaned.csv",
+    "optioncarriere": "src/Data/cleanedData/jobs_optioncarriere_cleaned.csv",
+}
+
+
+def detail_links(source, pages):
+    df = pd.read_csv(LINKS[source], encoding="utf-8-sig", dtype=str, usecols=["detail_link"])
+    return df["detail_link"].dropna().drop_duplicates().head(pages).tolist()
+
+
+def profile_driver(lean):
+    options = browser_profile.chrome_options(lean)
+    options.page_load_strategy = "normal"
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return browser_profile.new_driver(lean, options)
+
+
+def network_events(driver):
+    """CDP Network events logged since the last call."""
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"].startswith("Network."):
+            yield message["method"], message["params"]
+
+
+def measure(driver, url):
+    """(seconds, bytes received, requests, blocked requests) of one page load."""
+    list(network_events(driver))  # events of the previous page
+    start = time.perf_counter()
+    driver.get(url)
+    seconds = time.perf_counter() - start
+    received = requests = blocked = 0
+    for method, params in network_events(driver):
+        if method == "Network.loadingFinished":
+            received += params.get("encodedDataLength", 0)
+        elif method == "Network.requestWillBeSent":
+            requests += 1
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            blocked += 1
+    return seconds, received, requests, blocked
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=6, help="detail pages per site (first one warms up)")
+    parser.add_argument("--sources", nargs="+", choices=list(LINKS), default=list(LINKS))
+    args = parser.parse_args()
+
+    print(f"{'source':15} {'profile':8} {'load s':>7} {'KB':>8} {'requests':>9} {'blocked':>8}")
+    for source in args.sources:
+        urls = detail_links(source, args.pages)
+        results = {}
+        for lean in (False, True):
+            driver = profile_driver(lean)
+            try:
+                driver.get(urls[0])  # warm-up (DNS, TLS), not measured
+                results[lean] = [measure(driver, url) for url in urls[1:] or urls]
+            finally:
+                driver.quit()
+            seconds, received, requests, blocked = (statistics.median(x) for x in zip(*results[lean]))
+            print(f"{source:15} {'lean' if lean else 'plain':8} {seconds:>7.2f} {received / 1e3:>8.0f} "
+                  f"{requests:>9.0f} {blocked:>8.0f}")
+        plain = [statistics.median(x) for x in zip(*results[False])]
+        lean = [statistics.median(x) for x in zip(*results[True])]
+        print(f"{source:15} {'saved':8} {1 - lean[0] / plain[0]:>7.0%} {1 - lean[1] / max(plain[1], 1):>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Skill extraction benchmark: one regex per skill vs the compiled taxonomy matcher.
+
+Builds taxonomies of 10, 1,000 and 10,000 skills (the shipped taxonomy
+topped up with synthetic skills of one to three tokens, two synonyms each)
+and times extraction over the descriptions of the sample data tiled up to
+--rows. The per-skill regex scan (the former extract_skills_from_description)
+is timed on the first --regex-rows descriptions only, and only up to
+--regex-max skills: past that it is too slow to wait for.
+
+    python -m src.benchmarks.bench_skills --rows 20000
+"""
+import re
+import time
+import random
+import argparse
+import pandas as pd
+from src.cleaning.engine.skills import SkillMatcher, load_taxonomy, normalize, MAX_SKILLS
+
+SIZES = [10, 1_000, 10_000]
+
+
+def sample_descriptions(rows):
+    texts = []
+    for path in ("src/Data/cleanedData/job_keejobs_cleaned.csv",
+                 "src/Data/cleanedData/jobs_optioncarriere_cleaned.csv"):
+        df = pd.read_csv(path, encoding="utf-8-sig", dtype=str)
+        texts += df["description"].dropna().tolist()
+    return (texts * (rows // len(texts) + 1))[:rows]
+
+
+def synthetic_taxonomy(size, seed=0):
+    """Taxonomie livrée complétée par des compétences inventées jusqu'à `size`."""
+    taxonomy = load_taxonomy()[:size]
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+
+    def word():
+        return "".join(rng.choice(letters) for _ in range(rng.randint(4, 9)))
+
+    while len(taxonomy) < size:
+        name = " ".join(word() for _ in range(rng.randint(1, 3)))
+        taxonomy.append((name, [name, word()]))
+    return taxonomy
+
+
+def regex_extractor(taxonomy):
+    """Ancienne approche : un pattern par compétence, un re.search chacun."""
+    patterns = [(skill, re.compile(r"\b(?:" + "|".join(re.escape(s) for s in synonyms) + r")\b"))
+                for skill, synonyms in taxonomy]
+
+    def extract(text):
+        text = normalize(text)
+        skills = [skill for skill, pattern in patterns if pattern.search(text)]
+        return ", ".join(skills[:MAX_SKILLS])
+    return extract
+
+
+def docs_per_sec(extract, texts):
+    start = time.perf_counter()
+    for text in texts:
+        extract(text)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--regex-rows", type=int, default=1_000)
+    parser.add_argument("--regex-max", type=int, default=1_000)
+    args = parser.parse_args()
+
+    texts = sample_descriptions(args.rows)
+    print(f"{'skills':>8} {'rows':>8} {'regex docs/s':>13} {'matcher docs/s':>15} {'build s':>8}")
+    for size in SIZES:
+        taxonomy = synthetic_taxonomy(size)
+        start = time.perf_counter()
+        matcher = SkillMatcher(taxonomy)
+        build = time.perf_counter() - start
+        fast = docs_per_sec(matcher.extract, texts)
+        if size <= args.regex_max:
+            slow = f"{docs_per_sec(regex_extractor(taxonomy), texts[:args.regex_rows]):>13,.0f}"
+        else:
+            slow = f"{'-':>13}"
+        print(f"{len(matcher):>8} {len(texts):>8} {slow} {fast:>15,.0f} {build:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
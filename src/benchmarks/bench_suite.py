@@ -0,0 +1,195 @@
+"""
+Cleaning benchmark suite: rows/s and peak memory per mapper, tracked across commits.
+
+Each map_*_to_standard runs on synthetic raw rows (see synthetic.py) at
+every --sizes, in its own subprocess so the peak RSS is its own. Generation
+is not timed. Timing is the median of --repeat runs. Peak memory is the RSS
+growth during the call above the RSS with the raw frame loaded, sampled
+every SAMPLE_INTERVAL seconds.
+
+Each run appends one record per (function, rows) to RESULTS_PATH, keyed by
+commit and host. Results are then compared with the latest record of the
+baseline commit on the same host: the previous recorded commit by default,
+or --baseline. A slowdown or memory growth beyond --threshold is flagged
+as a regression, and --fail-on-regression turns that into exit code 1.
+
+    python -m src.benchmarks.bench_suite --sizes 10000 100000
+    python -m src.benchmarks.bench_suite --sizes 1000000 --baseline 1efd20d
+"""
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import threading
+import statistics
+import subprocess
+from datetime import datetime
+import psutil
+import pandas as pd
+from src.benchmarks import synthetic
+from src.cleaning.keejobs_cleaning import map_keejob_to_standard
+from src.cleaning.emploisTunisie_cleaning import map_emploitunisie_to_standard
+from src.cleaning.optioncarrier_cleaning import map_optioncarriere_to_standard
+
+RESULTS_PATH = ".benchmarks/cleaning.jsonl"
+SAMPLE_INTERVAL = 0.01
+
+FUNCTIONS = {
+    "map_keejob_to_standard": ("keejob", map_keejob_to_standard),
+    "map_emploitunisie_to_standard": ("emploitunisie", map_emploitunisie_to_standard),
+    "map_optioncarriere_to_standard": ("optioncarriere", map_optioncarriere_to_standard),
+}
+
+
+class PeakRSS:
+    """Highest RSS of this process while the block runs (sampled in a thread)."""
+
+    def __enter__(self):
+        self.process = psutil.Process()
+        self.peak = self.process.memory_info().rss
+        self.running = True
+        self.thread = threading.Thread(target=self._sample, daemon=True)
+        self.thread.start()
+        return self
+
+    def _sample(self):
+        while self.running:
+            self.peak = max(self.peak, self.process.memory_info().rss)
+            time.sleep(SAMPLE_INTERVAL)
+
+    def __exit__(self, *exc):
+        self.running = False
+        self.thread.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+
+
+def run_one(name, rows, repeat):
+    """Measure in this process; prints a JSON {"rows_per_s", "peak_mb"}."""
+    source, mapper = FUNCTIONS[name]
+    df_raw = pd.concat(synthetic.iter_chunks(source, rows), ignore_index=True)
+    # warm-up: taxonomy, gazetteer and compiled patterns load on first use
+    mapper(df_raw.head(100))
+    times, peaks = [], []
+    for _ in range(repeat):
+        base = psutil.Process().memory_info().rss
+        with PeakRSS() as rss:
+            start = time.perf_counter()
+            df = mapper(df_raw)
+            times.append(time.perf_counter() - start)
+        peaks.append((rss.peak - base) / 1e6)
+        del df
+    print(json.dumps({"rows_per_s": rows / statistics.median(times),
+                      "peak_mb": statistics.median(peaks)}))
+
+
+def measure(name, rows, repeat):
+    cmd = [sys.executable, "-m", "src.benchmarks.bench_suite",
+           "--child", name, "--sizes", str(rows), "--repeat", str(repeat)]
+    out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def git_commit():
+    """(short hash, dirty) of the working tree, ("unknown", True) outside git."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", True
+
+
+def load_results(path=RESULTS_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def save_results(records, path=RESULTS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def baseline_records(history, host, commit, baseline=None):
+    """Latest record per (function, rows) of the baseline commit on this host."""
+    history = [r for r in history if r["host"] == host]
+    if baseline is None:
+        # most recently recorded commit other than the current one
+        previous = [r["commit"] for r in history if r["commit"] != commit]
+        if not previous:
+            return {}
+        baseline = previous[-1]
+    return {(r["function"], r["rows"]): r for r in history if r["commit"].startswith(baseline)}
+
+
+def compare(record, base, threshold):
+    """Flags for one record against its baseline ("" if none)."""
+    if base is None:
+        return ""
+    flags = []
+    if record["rows_per_s"] < base["rows_per_s"] * (1 - threshold):
+        flags.append("SLOWER")
+    if record["peak_mb"] > max(base["peak_mb"], 1.0) * (1 + threshold):
+        flags.append("MORE MEMORY")
+    return " ".join(flags)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--functions", nargs="+", choices=list(FUNCTIONS), default=list(FUNCTIONS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", help="commit to compare with (default: previous recorded one)")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="relative slowdown / memory growth flagged as a regression")
+    parser.add_argument("--no-save", action="store_true", help="do not append to the history")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--child", choices=list(FUNCTIONS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_one(args.child, args.sizes[0], args.repeat)
+        return
+
+    commit, dirty = git_commit()
+    host = socket.gethostname()
+    base = baseline_records(load_results(), host, commit, args.baseline)
+    base_commit = next(iter(base.values()))["commit"] if base else "-"
+    print(f"commit {commit}{' (dirty)' if dirty else ''} vs baseline {base_commit}, host {host}")
+    print(f"{'function':32} {'rows':>9} {'rows/s':>11} {'base rows/s':>12} "
+          f"{'peak MB':>8} {'base MB':>8}  flags")
+
+    records, regressions = [], 0
+    for rows in args.sizes:
+        for name in args.functions:
+            result = measure(name, rows, args.repeat)
+            record = {"commit": commit, "dirty": dirty, "host": host,
+                      "date": datetime.now().isoformat(timespec="seconds"),
+                      "function": name, "rows": rows, "repeat": args.repeat, **result}
+            records.append(record)
+            previous = base.get((name, rows))
+            flags = compare(record, previous, args.threshold)
+            regressions += bool(flags)
+            print(f"{name:32} {rows:>9} {record['rows_per_s']:>11,.0f} "
+                  f"{previous['rows_per_s'] if previous else float('nan'):>12,.0f} "
+                  f"{record['peak_mb']:>8.1f} {previous['peak_mb'] if previous else float('nan'):>8.1f}  "
+                  f"{flags}")
+
+    if not args.no_save:
+        save_results(records)
+    if regressions:
+        print(f"\n{regressions} regression(s) beyond {args.threshold:.0%} against {base_commit}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Typed standard frames benchmark: all-object text vs typed columns.
+
+For each source, maps --rows tiled raw rows and merges them with a previous
+output of the same size, as a full clean does: the former way
+(map_to_standard(typed=False), object strings everywhere, then concat +
+drop_duplicates) and the typed way (typed=True, then merge_new_rows). Each
+variant runs in its own subprocess so the peak RSS is its own; both the peak
+and the size of the final frame are reported per 100k rows.
+
+    python -m src.benchmarks.bench_typed_frames --rows 200000
+"""
+import sys
+import argparse
+import resource
+import subprocess
+import psutil
+import pandas as pd
+from src.cleaning.engine import map_to_standard
+from src.cleaning.cleaned_io import merge_new_rows, to_typed, use_system_memory_pool
+from src.cleaning.keejobs_cleaning import KEEJOB_SPEC
+from src.cleaning.emploisTunisie_cleaning import EMPLOITUNISIE_SPEC
+from src.cleaning.optioncarrier_cleaning import OPTIONCARRIERE_SPEC
+from src.benchmarks.bench_cleaning_engine import sample_keejob, sample_emploitunisie, sample_optioncarriere, tile
+
+SOURCES = {
+    "keejob": (sample_keejob, KEEJOB_SPEC),
+    "emploitunisie": (sample_emploitunisie, EMPLOITUNISIE_SPEC),
+    "optioncarriere": (sample_optioncarriere, OPTIONCARRIERE_SPEC),
+}
+
+
+def run_one(source, rows, typed):
+    """Measure in this process; prints "peak_MB frame_MB"."""
+    use_system_memory_pool()  # comme les cleaners
+    sample, spec = SOURCES[source]
+    df_raw = tile(sample(), rows)
+    base = psutil.Process().memory_info().rss
+
+    df_new = map_to_standard(df_raw, spec, typed=typed)
+    df_old = df_new.copy()
+    if typed:
+        df_final = to_typed(merge_new_rows(df_old, df_new))
+    else:
+        df_final = pd.concat([df_old, df_new], ignore_index=True).drop_duplicates(subset=["job_id"])
+    del df_old, df_new
+
+    # ru_maxrss est en Ko sous Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 - base
+    frame = df_final.memory_usage(deep=True).sum()
+    print(f"{peak / 1e6:.1f} {frame / 1e6:.1f}")
+
+
+def measure(source, rows, typed):
+    cmd = [sys.executable, "-m", "src.benchmarks.bench_typed_frames",
+           "--child", source, "--rows", str(rows)] + (["--typed"] if typed else [])
+    out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+    peak, frame = map(float, out.split()[-2:])
+    return peak, frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--child", choices=list(SOURCES), help=argparse.SUPPRESS)
+    parser.add_argument("--typed", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_one(args.child, args.rows, args.typed)
+        return
+
+    per = 100_000 / args.rows
+    print(f"MB per 100k rows ({args.rows} rows mapped)")
+    print(f"{'source':16} {'peak obj':>9} {'peak typed':>11} {'frame obj':>10} {'frame typed':>12}")
+    for source in SOURCES:
+        peak_obj, frame_obj = measure(source, args.rows, typed=False)
+        peak_typed, frame_typed = measure(source, args.rows, typed=True)
+        print(f"{source:16} {peak_obj * per:>9.1f} {peak_typed * per:>11.1f} "
+              f"{frame_obj * per:>10.1f} {frame_typed * per:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
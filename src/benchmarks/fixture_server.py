@@ -0,0 +1,157 @@
+"""
+Local HTTP server of detail page fixtures, for offline scraper benchmarks.
+
+Each page is rendered from one synthetic raw row (synthetic.py) with the
+markup the site's parser reads (same tags, classes and labels as the live
+pages), so the record parsed back from page n must equal row n. Pages are
+served at /<source>/<n> over keep-alive HTTP/1.1, gzipped when asked, after
+`latency` seconds of simulated server time. A robots.txt with `crawl_delay`
+is served when one is given, and `error_rate` of the answers are 503s.
+Pages carry an ETag and answer 304 to a matching If-None-Match, as the
+page cache expects from a revalidating server.
+
+    with FixtureServer(pages=100, latency=0.2) as server:
+        url = server.url("keejob", 0)
+"""
+import gzip
+import hashlib
+import time
+import random
+import threading
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.benchmarks import synthetic
+
+
+def _text(value):
+    return value is not None and value == value and str(value) != ""
+
+
+def _page(title, body):
+    return (f'<!DOCTYPE html><html lang="fr"><head><meta charset="utf-8">'
+            f"<title>{escape(title)}</title><script>window.dataLayer = [];</script>"
+            f"</head><body><header><nav><a href=\"/\">Accueil</a></nav></header>"
+            f"<main>{body}</main><footer><p>Mentions légales</p></footer></body></html>")
+
+
+def keejob_page(row):
+    blocks = [("Date de publication", "p", "date_publication"), ("Type de contrat", "span", "contract_type"),
+              ("Lieu de travail", "p", "location"), ("Expérience requise", "p", "experience"),
+              ("Niveau d'études", "p", "study_level"), ("Salaire proposé", "span", "salary"),
+              ("Disponibilité", "p", "availability")]
+    info = "".join(f"<div><h3>{escape(label)}</h3><{tag}>{escape(row[column])}</{tag}></div>"
+                   for label, tag, column in blocks if _text(row[column]))
+    sector = f"<p><span>Secteur:</span> {escape(row['sector'])}</p>" if _text(row["sector"]) else ""
+    return _page(row["title"], (
+        f'<div class="card"><h1>{escape(row["title"])}</h1>{sector}</div>'
+        f'<div class="p-6 space-y-4">{info}</div>'
+        f'<div class="prose"><p>{escape(row["description"])}</p></div>'))
+
+
+def emploitunisie_page(row):
+    criteria = [("Secteur d'activité", "sector"), ("Type de contrat", "contract_type"),
+                ("Région", "region"), ("Ville", "city"), ("Niveau d'expérience", "experience"),
+                ("Niveau d'études", "study_level"), ("Travail à distance", "remote"),
+                ("Salaire", "salary")]
+    items = "".join(f"<li>{escape(label)} : <span>{escape(row[column])}</span></li>"
+                    for label, column in criteria if _text(row[column]))
+    skills = ""
+    if _text(row["skills"]):
+        skills = "".join(f"<li>{escape(s.strip())}</li>" for s in row["skills"].split(","))
+        skills = f'<ul class="skills">{skills}</ul>'
+    return _page(row["title"], (
+        f'<h1>{escape(row["title"])}</h1>'
+        f'<div class="job-description"><p>{escape(row["description"])}</p></div>'
+        f'<div class="job-qualifications"><p>Profil recherché</p></div>'
+        f'<ul class="arrow-list">{items}</ul>{skills}'))
+
+
+def optioncarriere_page(row):
+    details = "".join(f"<li>{escape(row[c])}</li>" for c in ("location", "contract", "work_type"))
+    return _page(row["title"], (
+        f'<article id="job"><header><h1>{escape(row["title"])}</h1>'
+        f'<p class="company">{escape(row["company"])}</p>'
+        f'<ul class="details">{details}</ul>'
+        f'<span class="badge badge-icon">{escape(row["posted_relative"])}</span></header>'
+        f'<section class="content"><p>{escape(row["raw_content"])}</p></section></article>'))
+
+
+RENDERERS = {
+    "keejob": keejob_page,
+    "emploitunisie": emploitunisie_page,
+    "optioncarriere": optioncarriere_page,
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        if self.path == "/robots.txt":
+            if server.crawl_delay is None:
+                return self.answer(404, b"")
+            robots = f"User-agent: *\nCrawl-delay: {server.crawl_delay}\nDisallow: /private/\n"
+            return self.answer(200, robots.encode(), "text/plain")
+
+        try:
+            source, n = self.path.strip("/").split("/")
+            body = server.pages[source][int(n) % len(server.pages[source])]
+        except (KeyError, ValueError):
+            return self.answer(404, b"")
+        time.sleep(server.latency)
+        if server.error_rate and random.random() < server.error_rate:
+            return self.answer(503, b"", headers={"Retry-After": "0"})
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        server.served[self.path] = server.served.get(self.path, 0) + 1
+        if self.headers.get("If-None-Match") == etag:
+            return self.answer(304, b"", headers={"ETag": etag})
+        self.answer(200, body, "text/html; charset=utf-8", headers={"ETag": etag})
+
+    def answer(self, status, body, content_type="text/html", headers=None):
+        if body and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=5)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FixtureServer:
+    """Fixture server in a background thread, for the duration of a `with` block."""
+
+    def __init__(self, pages=100, latency=0.0, crawl_delay=None, error_rate=0.0, seed=0):
+        self.rows = {source: synthetic.generate(source, pages, seed) for source in RENDERERS}
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.pages = {source: [RENDERERS[source](row).encode("utf-8") for row in rows.to_dict("records")]
+                            for source, rows in self.rows.items()}
+        self.httpd.latency = latency
+        self.httpd.crawl_delay = crawl_delay
+        self.httpd.error_rate = error_rate
+        # path -> page answers (200 or 304)
+        self.httpd.served = {}
+
+    def url(self, source, n):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/{source}/{n}"
+
+    def row(self, source, n):
+        """Raw row page n of `source` was rendered from."""
+        rows = self.rows[source]
+        return rows.iloc[n % len(rows)].to_dict()
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,115 @@
+"""
+Detail page fixture recorder: real pages saved for the offline parser harness.
+
+Takes --pages detail links per source from the cleaned CSVs (offers already
+scraped) and reads each one through fetch.fetch_page, from the page cache
+only with --from-cache (page_cache.py), else over HTTP. Pages that have the
+parser's ready selector are written to src/Data/fixtures/<source>/:
+NNN.html, the page as the parsers read it, and expected.json, its URL and
+the record the current parser extracts from it. Review expected.json
+before committing it: tests/test_parsers.py and bench_parsers.py check
+every later parser against it. After an intended parser change, --update
+rewrites expected.json from the recorded pages, without the network.
+
+    python -m src.benchmarks.record_fixtures --pages 20
+    python -m src.benchmarks.record_fixtures --update
+"""
+import os
+import json
+import argparse
+import lxml.html
+import pandas as pd
+from src.scrapers import fetch, page_cache
+from src.scrapers.seen import CLEANED
+from src.scrapers import keejobs, emploisTunisie, optioncarrier
+
+FIXTURE_DIR = "src/Data/fixtures"
+
+# source: (parse(html, url) -> record, ready selector)
+HTML_PARSERS = {
+    "keejob": (keejobs.details_from_html, keejobs.DETAIL_READY),
+    "emploitunisie": (emploisTunisie.details_from_html, emploisTunisie.DETAIL_READY),
+    "optioncarriere": (optioncarrier.detail_from_html, optioncarrier.DETAIL_READY),
+}
+
+
+def expected_path(source):
+    return os.path.join(FIXTURE_DIR, source, "expected.json")
+
+
+def load_fixtures(source):
+    """[{"file", "url", "html", "record"}] recorded for a source, [] when there are none."""
+    try:
+        with open(expected_path(source), encoding="utf-8") as f:
+            fixtures = json.load(f)
+    except FileNotFoundError:
+        return []
+    for fixture in fixtures:
+        with open(os.path.join(FIXTURE_DIR, source, fixture["file"]), encoding="utf-8") as f:
+            fixture["html"] = f.read()
+    return fixtures
+
+
+def save_expected(source, fixtures):
+    with open(expected_path(source), "w", encoding="utf-8") as f:
+        json.dump([{k: fixture[k] for k in ("file", "url", "record")} for fixture in fixtures],
+                  f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def detail_links(source, pages):
+    df = pd.read_csv(CLEANED[source], encoding="utf-8-sig", dtype=str, usecols=["detail_link"])
+    return df["detail_link"].dropna().drop_duplicates().head(pages).tolist()
+
+
+def record(source, pages):
+    parse, ready = HTML_PARSERS[source]
+    os.makedirs(os.path.join(FIXTURE_DIR, source), exist_ok=True)
+    fixtures = []
+    for url in detail_links(source, pages):
+        page = fetch.fetch_page(url)
+        if not fetch.is_ready(page, ready):
+            print(f"[record] {url}: no {ready!r} in the HTML, not recorded")
+            continue
+        html = lxml.html.tostring(page.node, encoding="unicode", doctype="<!DOCTYPE html>")
+        fixture = {"file": f"{len(fixtures):03d}.html", "url": url, "html": html}
+        with open(os.path.join(FIXTURE_DIR, source, fixture["file"]), "w", encoding="utf-8") as f:
+            f.write(html)
+        fixture["record"] = parse(html, url)
+        fixtures.append(fixture)
+    save_expected(source, fixtures)
+    print(f"[record] {source}: {len(fixtures)} pages in {os.path.join(FIXTURE_DIR, source)}")
+
+
+def update(source):
+    parse, _ = HTML_PARSERS[source]
+    fixtures = load_fixtures(source)
+    changed = 0
+    for fixture in fixtures:
+        parsed = parse(fixture["html"], fixture["url"])
+        changed += parsed != fixture["record"]
+        fixture["record"] = parsed
+    if fixtures:
+        save_expected(source, fixtures)
+    print(f"[record] {source}: {changed}/{len(fixtures)} expected records changed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=20, help="detail pages recorded per source")
+    parser.add_argument("--sources", nargs="+", choices=list(HTML_PARSERS), default=list(HTML_PARSERS))
+    parser.add_argument("--from-cache", action="store_true", help="read the pages from the page cache only")
+    parser.add_argument("--update", action="store_true",
+                        help="re-parse the recorded pages and rewrite expected.json")
+    args = parser.parse_args()
+
+    page_cache.configure(offline_only=args.from_cache)
+    for source in args.sources:
+        if args.update:
+            update(source)
+        else:
+            record(source, args.pages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+Synthetic raw data for the three sources, at any size.
+
+Every value is drawn from the scraped samples in src/Data (titles,
+companies, sectors, locations, description vocabulary and length
+distribution per source) and written in the raw format of each scraper:
+French dates on Keejob ("30 novembre 2025"), dd.mm.yyyy on EmploiTunisie,
+"Il y a N heures" on OptionCarriere, whose offers mostly start with the
+structured header the extract patterns read ("Date de publication :",
+"Domaine :", "Niveau :"...), and the salary formats parse_salary handles ("3500 - 4000
+TND / Mois", "< 1000 DT", "('1200', '1500')", "Salaire : 2000dt"...).
+Links are unique and each description ends with a row reference, so free
+text stays distinct per row as it is in real scrapes.
+
+Rows are generated in chunks of CHUNK_ROWS, so 10M rows can be written
+without holding them in memory:
+
+    python -m src.benchmarks.synthetic --rows 1000000 --out /tmp/synthetic
+"""
+import os
+import argparse
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from src.cleaning.engine.locations import load_gazetteer
+
+CHUNK_ROWS = 100_000
+
+# Distinct descriptions drawn per source before row references are appended
+DESCRIPTION_POOL = 5000
+
+BASE_DATE = pd.Timestamp("2025-11-30 20:00:00")
+# Publication dates spread over this many days before BASE_DATE
+DATE_SPREAD_DAYS = 60
+
+MONTHS_FR = ["janvier", "février", "mars", "avril", "mai", "juin", "juillet",
+             "août", "septembre", "octobre", "novembre", "décembre"]
+
+RAW_FILES = {
+    "keejob": "job_keejobs.csv",
+    "emploitunisie": "job_emploisTunisie.csv",
+    "optioncarriere": "jobs_optioncarriere.csv",
+}
+
+
+@lru_cache(maxsize=None)
+def samples():
+    """Sample frames per source, read once."""
+    keejob = pd.read_csv("src/Data/rawData/job_keejobs.csv", encoding="utf-8-sig", dtype=str)
+    optioncarriere = pd.read_csv("src/Data/rawData/jobs_optioncarriere.csv", encoding="utf-8-sig",
+                                 engine="python", escapechar="\\", on_bad_lines="skip", dtype=str)
+    # pas de brut versionné pour EmploiTunisie : on repart du fichier nettoyé
+    emploitunisie = pd.read_csv("src/Data/cleanedData/job_emploisTunisie_cleaned.csv",
+                                encoding="utf-8-sig", dtype=str)
+    return {"keejob": keejob, "emploitunisie": emploitunisie, "optioncarriere": optioncarriere}
+
+
+def values(series):
+    return series.dropna().unique()
+
+
+@lru_cache(maxsize=None)
+def places():
+    """(city, region) pairs of the Tunisian gazetteer entries."""
+    return [(p.name, p.region) for p, _ in load_gazetteer() if p.kind == "city" and p.country == "TN"]
+
+
+@lru_cache(maxsize=None)
+def description_pool(source, seed):
+    """DESCRIPTION_POOL texts with the word count distribution of the source sample."""
+    rng = np.random.default_rng(seed)
+    texts = samples()[source]["raw_content" if source == "optioncarriere" else "description"].dropna()
+    vocab = np.array(sorted({w for t in texts for w in t.split()}))
+    lengths = rng.choice(texts.str.split().str.len().to_numpy(), DESCRIPTION_POOL)
+    return [" ".join(rng.choice(vocab, n)) for n in lengths]
+
+
+def pick(rng, pool, n, missing=0.0):
+    """n draws from pool, a `missing` share of them None."""
+    out = np.asarray(pool, dtype=object)[rng.integers(0, len(pool), n)]
+    if missing:
+        out[rng.random(n) < missing] = None
+    return out
+
+
+def descriptions(rng, source, seed, start, n):
+    pool = description_pool(source, seed)
+    return [f"{pool[k]} Réf. {start + i}" for i, k in enumerate(rng.integers(0, len(pool), n))]
+
+
+def publication_dates(rng, n):
+    return BASE_DATE.normalize() - pd.to_timedelta(rng.integers(0, DATE_SPREAD_DAYS, n), unit="D")
+
+
+def scraped_at(rng, n):
+    return (BASE_DATE + pd.to_timedelta(rng.integers(0, 3600, n), unit="s")).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def salaries(rng, n, formats):
+    """Salary strings in the given formats (None = no salary), drawn uniformly."""
+    low = rng.integers(6, 40, n) * 100
+    high = low + rng.integers(1, 10, n) * 100
+    out = np.empty(n, dtype=object)
+    choice = rng.integers(0, len(formats), n)
+    for k, fmt in enumerate(formats):
+        rows = np.flatnonzero(choice == k)
+        out[rows] = [None if fmt is None else fmt.format(low=low[i], high=high[i]) for i in rows]
+    return out
+
+
+def keejob_rows(rng, seed, start, n):
+    s = samples()["keejob"]
+    dates = publication_dates(rng, n)
+    city_region = pick(rng, places(), n)
+    return pd.DataFrame({
+        "title": pick(rng, values(s["title"]), n),
+        "detail_link": [f"https://www.keejob.com/offres-emploi/{start + i}/synthetic/" for i in range(n)],
+        "sector": pick(rng, values(s["sector"]), n),
+        "contract_type": pick(rng, values(s["contract_type"]), n, missing=0.2),
+        "date_publication": [f"{d.day} {MONTHS_FR[d.month - 1]} {d.year}" for d in dates],
+        "location": [f"{c}, {r}, Tunisie" for c, r in city_region],
+        "salary": salaries(rng, n, [None, None, None, "{low} - {high} TND / Mois"]),
+        "study_level": pick(rng, values(s["study_level"]), n),
+        "experience": pick(rng, values(s["experience"]), n),
+        "availability": pick(rng, values(s["availability"]), n),
+        "description": descriptions(rng, "keejob", seed, start, n),
+        "source": "keejob",
+        "scraped_at": scraped_at(rng, n),
+    })
+
+
+def emploitunisie_rows(rng, seed, start, n):
+    s = samples()["emploitunisie"]
+    city_region = pick(rng, places(), n)
+    titles = pick(rng, values(s["title"]), n)
+    return pd.DataFrame({
+        # le titre se termine par " - <ville>" sur le site
+        "title": [f"{t} - {c}" for t, (c, _) in zip(titles, city_region)],
+        "detail_link": [f"https://www.emploitunisie.com/offre-emploi-tunisie/synthetic-{start + i}"
+                        for i in range(n)],
+        "company": pick(rng, values(s["company"]), n),
+        "date_publication": publication_dates(rng, n).strftime("%d.%m.%Y"),
+        "sector": pick(rng, values(s["sector"]), n),
+        "contract_type": pick(rng, values(s["contract_type"]), n),
+        "location": None,
+        "region": [r for _, r in city_region],
+        "city": [c for c, _ in city_region],
+        "salary": salaries(rng, n, [None, None, "{low} - {high} DT", "< {low} DT", "> {high} DT",
+                                    "{low} DT", "('{low}', '{high}')"]),
+        "study_level": pick(rng, values(s["study_level"]), n),
+        "experience": pick(rng, values(s["experience"]), n),
+        "remote": pick(rng, values(s["availability"]), n, missing=0.3),
+        "description": descriptions(rng, "emploitunisie", seed, start, n),
+        "skills": pick(rng, values(s["skills"]), n, missing=0.2),
+        "source": "emploitunisie",
+        "scraped_at": scraped_at(rng, n),
+    })
+
+
+def optioncarriere_rows(rng, seed, start, n):
+    s = samples()["optioncarriere"]
+    city_region = pick(rng, places(), n)
+    companies = pick(rng, values(s["company"]), n)
+    dates = publication_dates(rng, n).strftime("%d/%m/%Y")
+    # offres relayées de l'ANETI : en-tête structuré (date, domaine, niveau...)
+    structured = rng.random(n) < 0.8
+    sectors = pick(rng, values(samples()["emploitunisie"]["sector"]), n)
+    levels = pick(rng, values(samples()["keejob"]["study_level"]), n)
+    years = rng.integers(0, 11, n)
+    salary = salaries(rng, n, [None, None, None, "Salaire : {low}dt net", "{low} a {high} dt"])
+    content = []
+    for i, text in enumerate(descriptions(rng, "optioncarriere", seed, start, n)):
+        header = ""
+        if structured[i]:
+            header = (f"Référence : {start + i}/2025 Date de publication : {dates[i]} "
+                      f"Entreprise : {companies[i]} Domaine : {sectors[i]} Niveau : {levels[i]} "
+                      f"Profession à exercer : Lieu de travail : {city_region[i][0].upper()} "
+                      f"Expérience souhaitée : {years[i]} an ")
+        content.append(header + text + (f" {salary[i]}" if salary[i] else ""))
+    return pd.DataFrame({
+        "title": pick(rng, values(s["title"]), n),
+        "company": companies,
+        "location": [f"{c}, {r}" if c != r else c for c, r in city_region],
+        "contract": pick(rng, values(s["contract"]), n),
+        "work_type": pick(rng, values(s["work_type"]), n),
+        "posted_relative": [f"Il y a {k} heures" if k < 24 else f"Il y a {k // 24} jours"
+                            for k in rng.integers(1, 24 * 30, n)],
+        "raw_content": content,
+        "detail_link": [f"https://www.optioncarriere.tn/jobad/synthetic{start + i:012d}" for i in range(n)],
+        "scraped_at": scraped_at(rng, n),
+    })
+
+
+GENERATORS = {
+    "keejob": keejob_rows,
+    "emploitunisie": emploitunisie_rows,
+    "optioncarriere": optioncarriere_rows,
+}
+
+
+def generate(source, rows, seed=0, start=0):
+    """Raw DataFrame of `rows` synthetic rows for one source (rows start..start+rows-1)."""
+    rng = np.random.default_rng([seed, start])
+    return GENERATORS[source](rng, seed, start, rows)
+
+
+def iter_chunks(source, rows, seed=0, chunk_rows=CHUNK_ROWS):
+    for start in range(0, rows, chunk_rows):
+        yield generate(source, min(chunk_rows, rows - start), seed, start)
+
+
+def write_raw(source, rows, out_dir, seed=0, chunk_rows=CHUNK_ROWS):
+    """Writes the raw CSV of one source chunk by chunk; returns its path."""
+    path = os.path.join(out_dir, RAW_FILES[source])
+    for k, chunk in enumerate(iter_chunks(source, rows, seed, chunk_rows)):
+        chunk.to_csv(path, mode="w" if k == 0 else "a", header=k == 0, index=False,
+                     encoding="utf-8-sig" if k == 0 else "utf-8")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000, help="rows per source")
+    parser.add_argument("--out", default="src/Data/synthetic")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sources", nargs="+", choices=list(GENERATORS), default=list(GENERATORS))
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    for source in args.sources:
+        path = write_raw(source, args.rows, args.out, args.seed)
+        print(f"{source:16} {args.rows:>10} rows -> {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
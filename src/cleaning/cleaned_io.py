@@ -0,0 +1,284 @@
+import os
+import glob
+import uuid
+import shutil
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+# ============================================================================
+# FORMAT D'ÉCHANGE DES DONNÉES NETTOYÉES
+# ============================================================================
+# Les cleaners écrivent du Parquet typé (dates, nombres, colonnes à faible
+# cardinalité encodées en dictionnaire) que le loader lit directement par
+# batchs Arrow ; le CSV reste un export optionnel pour la lecture humaine.
+
+STANDARD_COLUMNS = [
+    "title", "detail_link", "company", "date_publication",
+    "sector", "contract_type", "study_level", "experience", "availability",
+    "location", "region", "city", "country",
+    "salary_min", "salary_max",
+    "description", "skills",
+    "source", "scraped_at", "job_id"
+]
+
+DICTIONARY_COLUMNS = [
+    "sector", "contract_type", "study_level", "experience", "availability",
+    "region", "city", "country", "source"
+]
+DATE_COLUMNS = ["date_publication"]
+DATETIME_COLUMNS = ["scraped_at"]
+NUMERIC_COLUMNS = ["salary_min", "salary_max"]
+
+DICT_STRING = pa.dictionary(pa.int32(), pa.string())
+
+PARQUET_SCHEMA = pa.schema([
+    (col,
+     pa.date32() if col in DATE_COLUMNS
+     else pa.timestamp("s") if col in DATETIME_COLUMNS
+     else pa.float64() if col in NUMERIC_COLUMNS
+     else DICT_STRING if col in DICTIONARY_COLUMNS
+     else pa.string())
+    for col in STANDARD_COLUMNS
+])
+
+# Types pandas du format standard, appliqués dès la sortie des mappers :
+# catégories pour les colonnes à faible cardinalité, chaînes Arrow pour le
+# texte libre, entiers nullables pour les salaires, datetime pour les dates
+TEXT_DTYPE = pd.StringDtype("pyarrow")
+
+# Le CSV reste écrit par défaut à côté du Parquet
+EXPORT_CSV = True
+
+# Mode incrémental : seules les lignes brutes jamais vues sont mappées, puis
+# ajoutées en fichiers "part" à côté du Parquet principal ; au-delà de
+# MAX_PARTS parts, compact_cleaned() réécrit le tout en un seul fichier.
+INCREMENTAL = True
+MAX_PARTS = 24
+
+
+def use_system_memory_pool():
+    """
+    Fait passer les buffers Arrow par malloc, comme les objets pandas : la
+    mémoire libérée par le mapping est réutilisée au lieu de gonfler un
+    second pool. Réglage global du processus : appelé par les points
+    d'entrée des cleaners, pas à l'import.
+    """
+    pa.set_memory_pool(pa.system_memory_pool())
+
+
+def parquet_path_for(csv_path):
+    """Chemin Parquet associé à un chemin de fichier nettoyé .csv."""
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+
+def parts_dir_for(csv_path):
+    """Répertoire des fichiers Parquet ajoutés en mode incrémental."""
+    return os.path.splitext(csv_path)[0] + ".parts"
+
+
+def ids_path_for(csv_path):
+    """Index des job_id déjà nettoyés : UUID binaires de 16 octets bout à bout."""
+    return os.path.splitext(csv_path)[0] + ".ids"
+
+
+def cleaned_parquet_files(parquet_path):
+    """Parquet principal suivi des parts ajoutées, dans l'ordre d'écriture."""
+    files = [parquet_path] if os.path.exists(parquet_path) else []
+    return files + sorted(glob.glob(os.path.join(parts_dir_for(parquet_path), "part-*.parquet")))
+
+
+def _id_bytes(job_ids):
+    return b"".join(uuid.UUID(str(j)).bytes for j in job_ids)
+
+
+def load_known_ids(output_path):
+    """job_id déjà présents dans la sortie (set d'octets), None si pas d'index."""
+    path = ids_path_for(output_path)
+    if not os.path.exists(path) or not os.path.exists(parquet_path_for(output_path)):
+        return None
+    with open(path, "rb") as f:
+        data = f.read()
+    return {data[i:i + 16] for i in range(0, len(data), 16)}
+
+
+def text_column(series):
+    """Colonne typée ou non en texte, "" pour les valeurs manquantes."""
+    if is_datetime64_any_dtype(series):
+        fmt = "%Y-%m-%d" if series.name in DATE_COLUMNS else "%Y-%m-%d %H:%M:%S"
+        return series.dt.strftime(fmt).astype(object).where(series.notna(), "")
+    return series.astype(object).where(series.notna(), "").astype(str)
+
+
+def _nullable(text):
+    """Texte -> chaînes/catégories nullables : "" devient <NA>."""
+    return text.where(text != "")
+
+
+def _nullable_number(series):
+    num = pd.to_numeric(series if is_numeric_dtype(series) else text_column(series),
+                        errors="coerce").astype("Float64")
+    # salaires entiers en Int64, Float64 seulement s'il reste des décimales
+    return num.astype("Int64") if (num.dropna() % 1 == 0).all() else num
+
+
+def to_typed(df, copy=True):
+    """
+    DataFrame au format standard typé (catégories, chaînes Arrow, Int64,
+    datetime), valeurs vides en <NA>. Accepte du texte brut comme des colonnes
+    déjà typées. copy=False vide `df` colonne par colonne pendant la
+    conversion, pour ne pas garder les deux versions en mémoire.
+    """
+    typed = {}
+    for col in STANDARD_COLUMNS:
+        if col not in df.columns:
+            s = pd.Series("", index=df.index, dtype=object)
+        else:
+            s = df[col] if copy else df.pop(col)
+        if col in DATE_COLUMNS or col in DATETIME_COLUMNS:
+            if not is_datetime64_any_dtype(s):
+                fmt = "%Y-%m-%d" if col in DATE_COLUMNS else "%Y-%m-%d %H:%M:%S"
+                s = pd.to_datetime(text_column(s), format=fmt, errors="coerce")
+        elif col in NUMERIC_COLUMNS:
+            s = _nullable_number(s)
+        elif col in DICTIONARY_COLUMNS:
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                if "" in s.cat.categories:
+                    s = s.cat.remove_categories([""])
+            else:
+                s = _nullable(text_column(s)).astype("category")
+        elif s.dtype != TEXT_DTYPE:
+            s = _nullable(text_column(s)).astype(TEXT_DTYPE)
+        typed[col] = s
+    return pd.DataFrame(typed, index=df.index)
+
+
+def merge_new_rows(df_old, df_new):
+    """
+    Équivalent de concat([df_old, df_new]).drop_duplicates("job_id") : seules
+    les lignes de df_new sont filtrées. Les deux côtés sont mis au format
+    typé avant la concaténation (mêmes types, mêmes catégories), si bien
+    qu'une colonne vide d'un côté ne change pas le type du résultat.
+    """
+    if df_old.empty:
+        return df_new[~df_new["job_id"].duplicated()]
+    if df_old["job_id"].duplicated().any():
+        df_old = df_old[~df_old["job_id"].duplicated()]
+    keep = ~df_new["job_id"].duplicated() & ~df_new["job_id"].isin(df_old["job_id"])
+    if not keep.any():
+        return df_old.reset_index(drop=True)
+    df_old, df_new = to_typed(df_old), to_typed(df_new[keep])
+    for col in DICTIONARY_COLUMNS:
+        categories = df_old[col].cat.categories.union(df_new[col].cat.categories)
+        df_old[col] = df_old[col].cat.set_categories(categories)
+        df_new[col] = df_new[col].cat.set_categories(categories)
+    return pd.concat([df_old, df_new], ignore_index=True)
+
+
+def to_arrow_table(df):
+    """Convertit un DataFrame au format standard en table Arrow typée."""
+    df = to_typed(df)
+    arrays = []
+    for field in PARQUET_SCHEMA:
+        col = df[field.name]
+        if field.name in DATE_COLUMNS:
+            arrays.append(pa.Array.from_pandas(col, type=pa.timestamp("s")).cast(pa.date32()))
+        elif field.name in DATETIME_COLUMNS:
+            arrays.append(pa.Array.from_pandas(col, type=pa.timestamp("s")))
+        elif field.name in NUMERIC_COLUMNS:
+            arrays.append(pa.array(col.astype("Float64"), type=pa.float64()))
+        else:
+            arrays.append(pa.array(col, from_pandas=True).cast(field.type))
+    return pa.Table.from_arrays(arrays, schema=PARQUET_SCHEMA)
+
+
+def write_cleaned(df, output_path, export_csv=EXPORT_CSV):
+    """
+    Écrit les données nettoyées en Parquet (format d'échange avec le loader)
+    et, si export_csv, en CSV à output_path.
+    """
+    table = to_arrow_table(df)
+    pq.write_table(table, parquet_path_for(output_path), compression="zstd")
+    if export_csv:
+        df.reindex(columns=STANDARD_COLUMNS).to_csv(output_path, index=False, encoding='utf-8-sig')
+    # réécriture complète : les parts sont incluses, l'index repart de zéro
+    shutil.rmtree(parts_dir_for(output_path), ignore_errors=True)
+    with open(ids_path_for(output_path), "wb") as f:
+        f.write(_id_bytes(df["job_id"]))
+
+
+def _csv_header(path):
+    """Colonnes du CSV existant, None s'il n'existe pas ou est vide."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    with open(path, encoding="utf-8-sig") as f:
+        return f.readline().rstrip("\r\n").split(",")
+
+
+def append_cleaned(df, output_path, known, export_csv=EXPORT_CSV):
+    """
+    Ajoute les lignes de df dont le job_id n'est pas dans `known` sans
+    réécrire l'existant : une nouvelle part Parquet, les lignes en fin de CSV
+    et les job_id en fin d'index. Compacte au-delà de MAX_PARTS parts.
+    Renvoie les lignes ajoutées.
+    """
+    keys = pd.Series([uuid.UUID(str(j)).bytes for j in df["job_id"]], index=df.index)
+    df = df[~keys.isin(known) & ~keys.duplicated()]
+    if df.empty:
+        return df
+
+    parts_dir = parts_dir_for(output_path)
+    os.makedirs(parts_dir, exist_ok=True)
+    n = len(glob.glob(os.path.join(parts_dir, "part-*.parquet")))
+    pq.write_table(to_arrow_table(df), os.path.join(parts_dir, f"part-{n:05d}.parquet"),
+                   compression="zstd")
+    # CSV écrit avec d'anciennes colonnes : on ne peut pas y ajouter de lignes
+    outdated = export_csv and _csv_header(output_path) not in (None, STANDARD_COLUMNS)
+    if export_csv and not outdated:
+        if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+            df.reindex(columns=STANDARD_COLUMNS).to_csv(output_path, mode="a", header=False,
+                                                        index=False, encoding="utf-8")
+        else:
+            df.reindex(columns=STANDARD_COLUMNS).to_csv(output_path, index=False, encoding='utf-8-sig')
+    with open(ids_path_for(output_path), "ab") as f:
+        f.write(_id_bytes(df["job_id"]))
+    known.update(keys[df.index])
+
+    if outdated or n + 1 >= MAX_PARTS:
+        compact_cleaned(output_path, export_csv=export_csv)
+    return df
+
+
+def compact_cleaned(output_path, export_csv=EXPORT_CSV):
+    """Réécrit Parquet principal + parts en un seul fichier (sans doublons de job_id)."""
+    df = read_cleaned(output_path)
+    if df.empty:
+        return
+    df = df.drop_duplicates(subset=["job_id"], keep="first")
+    write_cleaned(df, output_path, export_csv=export_csv)
+    print(f"Compaction : {len(df)} lignes réécrites dans {parquet_path_for(output_path)}")
+
+
+def read_cleaned(output_path):
+    """
+    Relit les données nettoyées (Parquet si présent, sinon CSV), typées ;
+    DataFrame vide sinon.
+    """
+    files = cleaned_parquet_files(parquet_path_for(output_path))
+    if files:
+        return to_typed(pd.concat([pq.read_table(f).to_pandas() for f in files], ignore_index=True))
+    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        return to_typed(pd.read_csv(output_path, encoding='utf-8-sig', dtype=str))
+    return pd.DataFrame()
+
+
+def iter_parquet_records(path, batch_size):
+    """
+    Itère sur un fichier Parquet (et ses parts incrémentales) par record
+    batches Arrow, en listes de dicts typés.
+    """
+    for file in cleaned_parquet_files(path):
+        parquet_file = pq.ParquetFile(file)
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield batch.to_pylist()
@@ -0,0 +1,7 @@
+"""
+Moteur de nettoyage commun aux trois sources : opérations vectorisées sur
+colonnes entières et specs déclaratives par source (voir spec.py).
+"""
+from src.cleaning.engine.spec import Col, map_to_standard, job_ids, unseen_rows, now_str
+from src.cleaning.engine.parallel import map_in_chunks, WORKERS, CHUNK_ROWS
+from src.cleaning.engine.memo import cache_report
@@ -0,0 +1,115 @@
+import re
+import unicodedata
+import pandas as pd
+
+# ============================================================================
+# DATES DE PUBLICATION (relatives et absolues)
+# ============================================================================
+# Chaque valeur distincte est classée une seule fois par DATE_RE (un seul
+# passage de regex) ; les dates relatives ("il y a 3 jours", "hier") sont
+# résolues par rapport au scraped_at de la ligne, en vectorisé, et les dates
+# absolues ("30 novembre 2025", "30.11.2025", "2025-11-30") sont converties
+# en bloc par pd.to_datetime(format=...). Les valeurs non reconnues sont
+# rendues telles quelles, comme avant.
+
+MONTHS = {
+    "jan": 1, "fev": 2, "mar": 3, "avr": 4, "mai": 5, "juin": 6,
+    "juil": 7, "aou": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# Durée d'une unité relative en secondes (mois et années approchés)
+UNIT_SECONDS = {
+    "minutes": 60, "hours": 3600, "days": 86400, "weeks": 7 * 86400,
+    "months": 30 * 86400, "years": 365 * 86400,
+}
+
+# Mots valant 1 ("il y a une heure", "an hour ago")
+ONE = {"un", "une", "a", "an"}
+
+# Sur le texte normalisé (minuscules sans accents). Le match le plus à
+# gauche l'emporte : "30 novembre 2025" n'est pas lu comme une durée.
+DATE_RE = re.compile(
+    r"(?P<today>aujourd|today|\bnow\b|instant)"
+    r"|(?P<before_yesterday>avant[- ]hier)"
+    r"|(?P<yesterday>\bhier\b|yesterday)"
+    r"|\b(?P<amount>\d+|une?|an?)\+?\s*(?:"
+    r"(?P<minutes>minutes?|mins?|mn)|(?P<hours>heures?|hours?|h)"
+    r"|(?P<days>jours?|days?|j)|(?P<weeks>semaines?|weeks?|sem)"
+    r"|(?P<months>mois|months?)|(?P<years>ans?|annees?|years?))\b"
+    r"|\b(?P<day>\d{1,2})(?:er)?\s+(?P<month_name>janv(?:ier)?|fevr?(?:ier)?|mars"
+    r"|avr(?:il)?|mai|juin|juil(?:let)?|aout|sept?(?:embre)?|oct(?:obre)?"
+    r"|nov(?:embre)?|dec(?:embre)?)\.?\s+(?P<year>\d{4})\b"
+    r"|\b(?P<dmy_day>\d{1,2})[./-](?P<dmy_month>\d{1,2})[./-](?P<dmy_year>\d{4})\b"
+    r"|\b(?P<iso_year>\d{4})[./-](?P<iso_month>\d{1,2})[./-](?P<iso_day>\d{1,2})\b"
+)
+
+
+def normalize(text):
+    """Minuscules sans accents ("Décembre" -> "decembre")."""
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii")
+    return text.lower().strip()
+
+
+def month_number(name):
+    """Numéro du mois d'un nom ou d'une abréviation normalisés ("juil." -> 7)."""
+    return MONTHS.get(name[:4] if name.startswith("jui") else name[:3])
+
+
+def reference_times(reference, index):
+    """Instants de référence (scraped_at) ; maintenant si absent ou illisible."""
+    now = pd.Timestamp.now().floor("s")
+    if reference is None:
+        return pd.Series(now, index=index)
+    ref = pd.to_datetime(reference.where(reference.notna(), None), format="ISO8601",
+                         errors="coerce")
+    return pd.Series(ref.to_numpy(), index=index).fillna(now)
+
+
+def classify(values):
+    """
+    Classe des valeurs distinctes (texte) : DataFrame avec `offset`
+    (secondes avant scraped_at, NaN si non relative) et `absolute`
+    (datetime64, NaT si non absolue).
+    """
+    found = values.map(normalize).str.extract(DATE_RE)
+
+    amount = found["amount"].where(~found["amount"].isin(ONE), "1")
+    amount = pd.to_numeric(amount, errors="coerce")
+    offset = pd.Series(float("nan"), index=values.index)
+    for unit, seconds in UNIT_SECONDS.items():
+        offset = offset.where(found[unit].isna(), amount * seconds)
+    offset = offset.where(found["today"].isna(), 0.0)
+    offset = offset.where(found["yesterday"].isna(), 86400.0)
+    offset = offset.where(found["before_yesterday"].isna(), 2 * 86400.0)
+
+    # "string" : les NA se propagent dans la concaténation
+    found = found.astype("string")
+    month = found["month_name"].dropna().map(month_number).astype("string").reindex(values.index)
+    year = found["year"].fillna(found["dmy_year"]).fillna(found["iso_year"])
+    month = month.fillna(found["dmy_month"]).fillna(found["iso_month"])
+    day = found["day"].fillna(found["dmy_day"]).fillna(found["iso_day"])
+    ymd = year + "-" + month.str.zfill(2) + "-" + day.str.zfill(2)
+    absolute = pd.to_datetime(ymd, format="%Y-%m-%d", errors="coerce")
+
+    return pd.DataFrame({"offset": offset, "absolute": absolute}, index=values.index)
+
+
+def parse_dates(text, reference=None):
+    """
+    Series de texte -> YYYY-MM-DD. `reference` : Series des scraped_at des
+    mêmes lignes, pour les dates relatives (maintenant si None). Les valeurs
+    non reconnues restent telles quelles, "" reste "".
+    """
+    codes, uniques = pd.factorize(text)
+    parts = classify(pd.Series(uniques, dtype=object))
+    offset = pd.Series(parts["offset"].to_numpy()[codes], index=text.index)
+    absolute = pd.Series(parts["absolute"].to_numpy()[codes], index=text.index)
+
+    relative = offset.notna()
+    if relative.any():
+        ref = reference_times(reference, text.index)
+        resolved = ref[relative] - pd.to_timedelta(offset[relative], unit="s")
+        absolute = absolute.where(~relative, resolved)
+
+    out = absolute.dt.strftime("%Y-%m-%d")
+    return out.where(absolute.notna(), text)
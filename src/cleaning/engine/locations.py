@@ -0,0 +1,117 @@
+import csv
+import re
+from functools import lru_cache
+from src.cleaning.engine.skills import tokenize
+
+# ============================================================================
+# GAZETTEER DES LIEUX
+# ============================================================================
+# Une ligne par lieu dans GAZETTEER_PATH : nom canonique, type (city, region
+# ou country), région (gouvernorat pour la Tunisie) et code pays ISO, plus des
+# alias séparés par "|" ("La Marsa" <- "marsa|el marsa"). Les noms et alias
+# sont indexés une fois en dict {n-gramme de tokens normalisés : lieu} ; chaque
+# segment d'une localisation est ensuite parcouru token par token avec une
+# recherche O(1) par n-gramme (plus long alias d'abord).
+#
+# "Tunis", "Tunis, Tunisie", "Grand Tunis" donnent ainsi tous la région Tunis
+# et le pays TN. Une localisation sans aucun lieu connu garde l'ancien
+# découpage (ville = premier segment, région = dernier) et un pays vide.
+
+GAZETTEER_PATH = "src/Data/reference/locations.csv"
+
+# Un nom partagé par une ville et sa région (chef-lieu) désigne la ville
+KIND_PRIORITY = {"city": 0, "region": 1, "country": 2}
+
+
+class Place:
+    __slots__ = ("name", "kind", "region", "country")
+
+    def __init__(self, name, kind, region, country):
+        self.name = name
+        self.kind = kind
+        self.region = region
+        self.country = country
+
+
+def load_gazetteer(path=GAZETTEER_PATH):
+    """Liste [(Place, [alias])] dans l'ordre du fichier."""
+    with open(path, encoding="utf-8") as f:
+        return [(Place(row["name"], row["kind"], row["region"], row["country"]),
+                 [row["name"]] + [a for a in row["aliases"].split("|") if a.strip()])
+                for row in csv.DictReader(f)]
+
+
+def _split_location(text):
+    """Ancien découpage (city, region) sur les virgules, sans "Tunisie" final."""
+    text = re.sub(r',?\s*Tunisie\s*$', '', text.strip(), flags=re.IGNORECASE)
+    parts = [p.strip() for p in text.split(",")]
+    if len(parts) >= 2 and parts[-1] != parts[0]:
+        return parts[0], parts[-1]
+    return parts[0], ""
+
+
+class Gazetteer:
+    """Index n-gramme de tokens -> lieu, construit une fois pour tout le fichier."""
+
+    def __init__(self, places):
+        self.lookup = {}
+        self.first_tokens = set()
+        self.max_ngram = 1
+        for place, aliases in sorted(places, key=lambda p: KIND_PRIORITY[p[0].kind]):
+            for alias in aliases:
+                tokens = tuple(tokenize(alias))
+                if not tokens:
+                    continue
+                self.lookup.setdefault(tokens, place)
+                self.first_tokens.add(tokens[0])
+                self.max_ngram = max(self.max_ngram, len(tokens))
+
+    def __len__(self):
+        return len(set(map(id, self.lookup.values())))
+
+    def find(self, text):
+        """Lieux cités dans `text`, dans l'ordre du texte."""
+        tokens = tokenize(text)
+        found = []
+        i, n_tokens = 0, len(tokens)
+        while i < n_tokens:
+            if tokens[i] not in self.first_tokens:
+                i += 1
+                continue
+            for n in range(min(self.max_ngram, n_tokens - i), 0, -1):
+                place = self.lookup.get(tuple(tokens[i:i + n]))
+                if place is not None:
+                    found.append(place)
+                    i += n
+                    break
+            else:
+                i += 1
+        return found
+
+    def locate(self, text):
+        """
+        (city, region, country) canoniques d'une localisation. La ville vient
+        du premier segment ; région et pays du premier segment qui les donne.
+        """
+        segments = [s.strip() for s in str(text).split(",")]
+        matches = [self.find(s) for s in segments]
+        if not any(matches):
+            city, region = _split_location(str(text))
+            return city, region, ""
+
+        first = matches[0]
+        if not first:
+            city = segments[0]  # lieu inconnu gardé tel quel
+        else:
+            city = next((p.name for p in first if p.kind == "city"), "")
+        # un segment qui liste plusieurs régions ("Ariana - Beja - ...") n'en désigne aucune
+        regions = [{p.region for p in m if p.region} for m in matches]
+        region = next((r.pop() for r in regions if len(r) == 1), "")
+        country = next((p.country for m in matches for p in m if p.country), "")
+        return city, region, country
+
+
+@lru_cache(maxsize=None)
+def default_gazetteer():
+    """Gazetteer livré, chargé au premier appel."""
+    return Gazetteer(load_gazetteer())
@@ -0,0 +1,74 @@
+import pandas as pd
+from functools import lru_cache
+from src.cleaning.engine import vector
+
+# ============================================================================
+# MÉMOÏSATION DES PARSEURS
+# ============================================================================
+# Les colonnes à faible cardinalité (secteur, contrat, niveau, expérience,
+# lieu, date...) sont parsées une fois par valeur distincte puis redéployées
+# sur les lignes ; les champs de texte libre passent par un cache LRU borné.
+# Le taux de réussite du cache est relevé par colonne (attrs["cache_stats"]).
+
+# Colonnes standard de texte libre : pas de dédoublonnage global
+FREE_TEXT_COLUMNS = {"title", "detail_link", "description", "skills"}
+FREE_TEXT_CACHE = 10_000
+
+# Opérations dont la version "vectorisée" reste un apply ligne par ligne
+ROW_WISE_OPS = {"list", "date", "skills"}
+
+
+def memo_mode(op, target, src):
+    """"unique", "lru" ou None selon l'opération et la colonne cible."""
+    if isinstance(src, list) or op in ("raw", "const"):
+        return None
+    if target in FREE_TEXT_COLUMNS:
+        return "lru" if op in ROW_WISE_OPS else None
+    return "unique"
+
+
+def apply_unique(fn, series):
+    """
+    fn (Series -> Series ou DataFrame) appliquée aux valeurs distinctes de
+    series puis redéployée ligne par ligne. Renvoie (résultat, nb de calculs).
+    """
+    codes, uniques = pd.factorize(vector.as_text(series))
+    result = fn(pd.Series(uniques, dtype=object))
+    if isinstance(result, pd.DataFrame):
+        result = result.iloc[codes]
+        result.index = series.index
+        return result, len(uniques)
+    return pd.Series(result.to_numpy()[codes], index=series.index, dtype=object), len(uniques)
+
+
+def apply_lru(fn, series, maxsize=FREE_TEXT_CACHE):
+    """fn (valeur -> valeur) derrière un cache LRU borné. Renvoie (résultat, nb de calculs)."""
+    cached = lru_cache(maxsize=maxsize)(fn)
+    result = vector.as_text(series).map(cached)
+    return result, cached.cache_info().misses
+
+
+def record(stats, key, rows, computed):
+    if stats is None:
+        return
+    total = stats.setdefault(key, [0, 0])
+    total[0] += rows
+    total[1] += computed
+
+
+def merge_stats(frames):
+    """Cumule les attrs["cache_stats"] de plusieurs résultats (mapping par blocs)."""
+    stats = {}
+    for df in frames:
+        for key, (rows, computed) in df.attrs.get("cache_stats", {}).items():
+            record(stats, key, rows, computed)
+    return stats
+
+
+def cache_report(stats):
+    """Taux de réussite du cache par colonne, une ligne par colonne."""
+    lines = ["Cache des parseurs (réussite par colonne) :"]
+    for key, (rows, computed) in stats.items():
+        rate = (rows - computed) / rows * 100 if rows else 0.0
+        lines.append(f"  - {key:34}: {rate:5.1f}% ({computed}/{rows} calculs)")
+    return "\n".join(lines)
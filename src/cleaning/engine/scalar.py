@@ -0,0 +1,170 @@
+import re
+import unicodedata
+import pandas as pd
+from datetime import datetime, timedelta
+from src.cleaning.engine import dates
+from src.cleaning.engine.skills import default_matcher
+from src.cleaning.engine.locations import default_gazetteer
+
+# ============================================================================
+# FONCTIONS DE RÉFÉRENCE (ligne par ligne)
+# ============================================================================
+# Version unique des utilitaires autrefois copiés dans chaque cleaner. Le
+# moteur s'en sert en mode `vectorized=False` (référence et benchmark) ; le
+# chemin normal passe par les opérations vectorisées de vector.py.
+
+def is_empty(value):
+    return value is None or pd.isna(value) or str(value).strip() == ""
+
+
+def clean_text(text, drop=None):
+    """Nettoyage de texte : accents, espaces multiples, strip ; `drop` : regex à retirer."""
+    if is_empty(text):
+        return ""
+    text = str(text)
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("utf-8")
+    text = re.sub(r"\s+", " ", text).strip()
+    if drop:
+        text = re.sub(drop, "", text).strip()
+    return text
+
+
+def clean_list_or_text(text, limit=3):
+    """Nettoie les listes ou textes multi-valeurs."""
+    if is_empty(text):
+        return ""
+
+    text = str(text).strip()
+    text = re.sub(r"[\[\]'\"]", "", text)  # Remove brackets and quotes
+
+    items = re.split(r'[,/;]', text)
+    items = [clean_text(item) for item in items if item.strip()]
+
+    seen = set()
+    unique_items = []
+    for item in items:
+        if item and item.lower() not in seen:
+            seen.add(item.lower())
+            unique_items.append(item)
+            if len(unique_items) >= limit:
+                break
+
+    return ", ".join(unique_items) if unique_items else ""
+
+
+def parse_relative_date(relative_str, reference=None):
+    """
+    Convertit dates relatives ou absolues en YYYY-MM-DD (texte d'origine si
+    inconnu). Les dates relatives sont résolues par rapport à `reference`
+    (scraped_at de la ligne, maintenant si vide ou illisible).
+    """
+    if is_empty(relative_str):
+        return ""
+
+    match = dates.DATE_RE.search(dates.normalize(relative_str))
+    if match is None:
+        return str(relative_str)
+    found = match.groupdict()
+
+    # Dates relatives
+    try:
+        ref = datetime.fromisoformat(str(reference))
+    except ValueError:
+        ref = datetime.now()
+    if found["today"]:
+        return ref.strftime("%Y-%m-%d")
+    if found["yesterday"]:
+        return (ref - timedelta(days=1)).strftime("%Y-%m-%d")
+    if found["before_yesterday"]:
+        return (ref - timedelta(days=2)).strftime("%Y-%m-%d")
+    if found["amount"]:
+        num = 1 if found["amount"] in dates.ONE else int(found["amount"])
+        unit = next(u for u in dates.UNIT_SECONDS if found[u])
+        return (ref - timedelta(seconds=num * dates.UNIT_SECONDS[unit])).strftime("%Y-%m-%d")
+
+    # Dates absolues (mois en lettres ou numériques)
+    if found["month_name"]:
+        day, month, year = found["day"], dates.month_number(found["month_name"]), found["year"]
+    elif found["dmy_year"]:
+        day, month, year = found["dmy_day"], found["dmy_month"], found["dmy_year"]
+    else:
+        day, month, year = found["iso_day"], found["iso_month"], found["iso_year"]
+    try:
+        return datetime(int(year), int(month), int(day)).strftime("%Y-%m-%d")
+    except ValueError:
+        return str(relative_str)
+
+
+def _to_int_str(value):
+    try:
+        return str(int(value))
+    except ValueError:
+        return ""
+
+
+def parse_salary(salary_str):
+    """Parse le salaire et retourne (salary_min, salary_max) en texte ("" si absent)."""
+    if is_empty(salary_str):
+        return "", ""
+
+    salary_str = str(salary_str)
+
+    # Tuple format
+    if salary_str.startswith("("):
+        matches = re.findall(r"'(\d+)'", salary_str)
+        if len(matches) == 1:
+            return _to_int_str(matches[0]), _to_int_str(matches[0])
+        if len(matches) >= 2:
+            return _to_int_str(matches[0]), _to_int_str(matches[1])
+
+    salary_str = salary_str.replace("TND", "").replace("DT", "").replace("dt", "")
+    salary_str = re.sub(r"\s", "", salary_str).replace(".", "")
+
+    # "<X" : plafond seulement, ">X" : plancher seulement
+    if salary_str.startswith("<"):
+        return "", _to_int_str(salary_str[1:])
+    if salary_str.startswith(">"):
+        return _to_int_str(salary_str[1:]), ""
+
+    # Range ("3500-4000/Mois" compris)
+    if "-" in salary_str:
+        match = re.match(r"(\d+)-(\d+)", salary_str)
+        if match:
+            return _to_int_str(match.group(1)), _to_int_str(match.group(2))
+        return "", ""
+
+    # Single value
+    val = _to_int_str(salary_str)
+    return val, val
+
+
+def extract_location_parts(location_str):
+    """Extrait (city, region, country) canoniques depuis location (cf. locations.py)."""
+    if is_empty(location_str):
+        return "", "", ""
+    return default_gazetteer().locate(location_str)
+
+
+def extract_skills_from_description(description):
+    """Extrait les compétences depuis la description (taxonomie de skills.py)."""
+    if is_empty(description):
+        return ""
+    return default_matcher().extract(description)
+
+
+def extract_first(text, patterns, groups=1):
+    """
+    Premier match parmi `patterns` (insensible à la casse) ; "" ou tuple de ""
+    sinon. Avec groups=2, un pattern à un seul groupe donne (x, x).
+    """
+    empty = "" if groups == 1 else ("",) * groups
+    if is_empty(text):
+        return empty
+    for pattern in patterns:
+        match = re.search(pattern, str(text), re.IGNORECASE)
+        if match:
+            if groups == 1:
+                return match.group(1)
+            found = match.groups()
+            return tuple(found[i] if i < len(found) else found[0] for i in range(groups))
+    return empty
@@ -0,0 +1,96 @@
+import csv
+import re
+import unicodedata
+from functools import lru_cache
+
+# ============================================================================
+# TAXONOMIE DES COMPÉTENCES
+# ============================================================================
+# Une ligne par compétence dans TAXONOMY_PATH : nom canonique + formes reconnues
+# (synonymes séparés par "|", ex. "javascript" <- "js|ecmascript|es6"). Le nom
+# canonique n'est reconnu que s'il figure lui-même parmi les synonymes, ce qui
+# permet d'écarter les formes ambiguës ("c", "go").
+#
+# SkillMatcher compile la taxonomie une seule fois en table de n-grammes de
+# tokens : chaque description est découpée en tokens puis parcourue une seule
+# fois (plus long synonyme d'abord), quel que soit le nombre de compétences.
+
+TAXONOMY_PATH = "src/Data/reference/skills.csv"
+MAX_SKILLS = 8
+
+# "c++", "c#", "node.js", "asp.net" restent des tokens entiers ; "/", "-" et
+# l'apostrophe séparent ("pl/sql" -> "pl sql", "d'equipe" -> "d equipe")
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+
+def normalize(text):
+    """Minuscules sans accents, comme clean_text."""
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii")
+    return text.lower()
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(normalize(text))
+
+
+def load_taxonomy(path=TAXONOMY_PATH):
+    """Liste [(compétence, [synonymes])] dans l'ordre du fichier."""
+    with open(path, encoding="utf-8") as f:
+        return [(row["skill"], [s for s in row["synonyms"].split("|") if s.strip()])
+                for row in csv.DictReader(f)]
+
+
+class SkillMatcher:
+    """Table synonyme -> compétence, compilée une fois pour toute la taxonomie."""
+
+    def __init__(self, taxonomy, max_skills=MAX_SKILLS):
+        self.skills = []
+        self.lookup = {}        # n-gramme de tokens -> rang de la compétence
+        self.first_tokens = set()
+        self.max_ngram = 1
+        self.max_skills = max_skills
+        for skill, synonyms in taxonomy:
+            rank = len(self.skills)
+            self.skills.append(skill)
+            for synonym in synonyms:
+                tokens = tuple(tokenize(synonym))
+                if not tokens:
+                    continue
+                # premier arrivé gagne : l'ordre du fichier tranche les doublons
+                self.lookup.setdefault(tokens, rank)
+                self.first_tokens.add(tokens[0])
+                self.max_ngram = max(self.max_ngram, len(tokens))
+
+    def __len__(self):
+        return len(self.skills)
+
+    def find(self, text):
+        """Rangs des compétences présentes dans `text` (ordre de la taxonomie)."""
+        tokens = tokenize(text)
+        found = set()
+        i, n_tokens = 0, len(tokens)
+        while i < n_tokens:
+            if tokens[i] not in self.first_tokens:
+                i += 1
+                continue
+            # plus long synonyme d'abord ("gestion de projet" avant "gestion")
+            for n in range(min(self.max_ngram, n_tokens - i), 0, -1):
+                rank = self.lookup.get(tuple(tokens[i:i + n]))
+                if rank is not None:
+                    found.add(rank)
+                    i += n
+                    break
+            else:
+                i += 1
+        return sorted(found)
+
+    def extract(self, text):
+        """Compétences reconnues, séparées par ", " ("" si aucune)."""
+        ranks = self.find(text)[:self.max_skills]
+        return ", ".join(self.skills[r] for r in ranks)
+
+
+@lru_cache(maxsize=None)
+def default_matcher():
+    """Matcher de la taxonomie livrée, chargé au premier appel."""
+    return SkillMatcher(load_taxonomy())
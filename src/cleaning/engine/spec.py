@@ -0,0 +1,233 @@
+import pandas as pd
+from datetime import datetime
+from src.identity import job_key
+from src.cleaning.cleaned_io import STANDARD_COLUMNS, text_column, to_typed
+from src.cleaning.engine import scalar, vector, memo
+
+# ============================================================================
+# SPÉCIFICATIONS DÉCLARATIVES DES COLONNES
+# ============================================================================
+# Chaque source décrit son mapping vers le format standard comme un dict
+# {colonne standard (ou tuple de colonnes) : Col(...)} ; map_to_standard()
+# l'exécute colonne par colonne, en vectorisé par défaut.
+
+
+class Col:
+    """
+    Déclaration d'une colonne standard.
+
+    op       : opération à appliquer (clé de OPS, ou "const")
+    source   : colonne brute en entrée (tuple de colonnes pour "join", et
+               (date, scraped_at) pour "date")
+    mapped   : lire `source` dans les colonnes standard déjà produites
+    part     : pour une opération à plusieurs sorties, n'en garder qu'une
+    then     : opération appliquée ensuite au résultat (ex. "date" après "extract")
+    max_len  : tronque le résultat
+    template : met en forme les valeurs non vides (ex. "{} ans")
+    fallback : Col utilisée pour les lignes restées vides
+    default  : valeur (ou fonction sans argument) des lignes toujours vides
+    options  : paramètres passés à l'opération (limit, patterns, groups, drop, sep)
+    """
+
+    def __init__(self, op, source=None, mapped=False, part=None, then=None,
+                 max_len=None, template=None, fallback=None, default="", **options):
+        self.op = op
+        self.source = source
+        self.mapped = mapped
+        self.part = part
+        self.then = then
+        self.max_len = max_len
+        self.template = template
+        self.fallback = fallback
+        self.default = default
+        self.options = options
+
+
+def _join_vector(columns, sep=", "):
+    out = vector.as_text(columns[0])
+    for col in columns[1:]:
+        col = vector.as_text(col)
+        both = (out != "") & (col != "")
+        out = (out + sep).where(both, out) + col
+    return out
+
+
+def _join_scalar(values, sep=", "):
+    return sep.join(str(v) for v in values if not scalar.is_empty(v))
+
+
+def _date_vector(src):
+    # ("date_publication", "scraped_at") : dates relatives résolues par ligne
+    if isinstance(src, list):
+        return vector.parse_dates(src[0], reference=src[1])
+    return vector.parse_dates(src)
+
+
+def _date_scalar(values):
+    if isinstance(values, tuple):
+        return scalar.parse_relative_date(*values)
+    return scalar.parse_relative_date(values)
+
+
+def _raw_vector(series):
+    return vector.as_text(series)
+
+
+def _raw_scalar(value):
+    return "" if scalar.is_empty(value) else str(value)
+
+
+# nom -> (fonction vectorisée, fonction ligne par ligne, nombre de sorties)
+OPS = {
+    "raw": (_raw_vector, _raw_scalar, 1),
+    "text": (vector.clean_text, scalar.clean_text, 1),
+    "list": (vector.clean_list, scalar.clean_list_or_text, 1),
+    "date": (_date_vector, _date_scalar, 1),
+    "salary": (vector.parse_salary, scalar.parse_salary, 2),
+    "location": (vector.location_parts, scalar.extract_location_parts, 3),
+    "skills": (vector.extract_skills, scalar.extract_skills_from_description, 1),
+    "extract": (vector.extract_first, scalar.extract_first, None),
+    "join": (_join_vector, _join_scalar, 1),
+}
+
+
+def _outputs(col):
+    n = OPS[col.op][2] if col.op in OPS else 1
+    if n is None:
+        n = col.options.get("groups", 1)
+    return 1 if col.part is not None else n
+
+
+def _source(col, df_raw, df):
+    frame = df if col.mapped else df_raw
+    if isinstance(col.source, tuple):
+        if not all(c in frame.columns for c in col.source):
+            return None
+        return [frame[c] for c in col.source]
+    if col.source is None or col.source not in frame.columns:
+        return None
+    return frame[col.source]
+
+
+def _run_op(op, src, options, vectorized, index, target=None, stats=None):
+    vec_fn, scalar_fn, _ = OPS[op]
+    if vectorized:
+        # mémoïsation : valeurs distinctes ou cache LRU (cf. memo.py)
+        mode = memo.memo_mode(op, target, src)
+        if mode == "unique":
+            result, computed = memo.apply_unique(lambda s: vec_fn(s, **options), src)
+        elif mode == "lru":
+            result, computed = memo.apply_lru(lambda v: scalar_fn(v, **options), src)
+        else:
+            return vec_fn(src, **options)
+        memo.record(stats, f"{target} [{op}]", len(src), computed)
+        return result
+    if isinstance(src, list):
+        rows = zip(*(s.tolist() for s in src))
+        return pd.Series([scalar_fn(values, **options) for values in rows], index=index)
+    return src.apply(lambda v: scalar_fn(v, **options))
+
+
+def _empty(n, index):
+    if n == 1:
+        return pd.Series("", index=index, dtype=object)
+    return pd.DataFrame({i: "" for i in range(n)}, index=index)
+
+
+def compute(col, df_raw, df, vectorized=True, target=None, stats=None):
+    """
+    Évalue une Col : Series (une sortie) ou DataFrame (colonnes 0..n-1).
+    `target` (colonne standard) choisit la mémoïsation, `stats` cumule les
+    calculs effectués par colonne.
+    """
+    index = df_raw.index
+    n = _outputs(col)
+    src = _source(col, df_raw, df)
+
+    if col.op == "const" or src is None:
+        result = _empty(n, index)
+    else:
+        result = _run_op(col.op, src, col.options, vectorized, index, target, stats)
+        if not isinstance(result, pd.DataFrame) and (n > 1 or col.part is not None):
+            # fonctions ligne par ligne à plusieurs sorties : Series de tuples
+            width = OPS[col.op][2] or col.options.get("groups", 1)
+            result = pd.DataFrame(result.tolist(), index=index, columns=range(width))
+        if col.part is not None:
+            result = result[col.part]
+
+    if n == 1:
+        if col.then:
+            result = _run_op(col.then, result, {}, vectorized, index, target, stats)
+        if col.max_len:
+            result = result.str[:col.max_len]
+        if col.template:
+            prefix, _, suffix = col.template.partition("{}")
+            result = result.where(result == "", prefix + result + suffix)
+        if col.fallback is not None:
+            fallback = compute(col.fallback, df_raw, df, vectorized, target, stats)
+            result = result.where(result != "", fallback)
+        default = col.default() if callable(col.default) else col.default
+        if default != "":
+            result = result.where(result != "", default)
+    elif col.fallback is not None:
+        empty = (result == "").all(axis=1)
+        if empty.any():
+            fallback = compute(col.fallback, df_raw, df, vectorized, target, stats)
+            result.loc[empty] = fallback.loc[empty].values
+
+    return result
+
+
+def now_str():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def job_ids(df):
+    """job_id canonique de chaque ligne (cf. src/identity.py)."""
+    cols = [text_column(df[c]).tolist() if c in df.columns else [""] * len(df)
+            for c in ("detail_link", "title", "company", "source", "date_publication")]
+    return pd.Series([str(job_key(*values)) for values in zip(*cols)], index=df.index, dtype=object)
+
+
+def unseen_rows(df_raw, known):
+    """
+    Lignes brutes dont le job_id n'est pas dans `known` (octets des UUID).
+    L'identifiant ne dépend que du lien quand il y en a un, on le calcule donc
+    avant le mapping ; les lignes sans lien sont gardées (vérifiées après).
+    """
+    if "detail_link" not in df_raw.columns:
+        return df_raw
+    # sans lien, job_key() rend une clé aléatoire : jamais connue, donc gardée
+    seen = pd.Series([job_key(link).bytes in known for link in df_raw["detail_link"].tolist()],
+                     index=df_raw.index)
+    return df_raw[~seen]
+
+
+def map_to_standard(df_raw, spec, vectorized=True, typed=True):
+    """
+    Applique une spec de source à un DataFrame brut et renvoie le DataFrame
+    au format standard (STANDARD_COLUMNS), job_id compris, typé par
+    to_typed() (typed=False : tout en texte, "" pour les vides).
+
+    vectorized=False applique les fonctions de référence ligne par ligne
+    (comportement des anciens map_*_to_standard), pour comparaison. Le
+    chemin vectorisé mémoïse les parseurs et relève le taux de réussite du
+    cache par colonne dans df.attrs["cache_stats"].
+    """
+    df = pd.DataFrame(index=df_raw.index)
+    stats = {}
+    for target, col in spec.items():
+        name = "/".join(target) if isinstance(target, tuple) else target
+        result = compute(col, df_raw, df, vectorized, name, stats)
+        if isinstance(target, tuple):
+            for i, name in enumerate(target):
+                df[name] = result[i]
+        else:
+            df[target] = result
+    df["job_id"] = job_ids(df)
+    if typed:
+        df = to_typed(df, copy=False)
+    else:
+        df = df.reindex(columns=STANDARD_COLUMNS, fill_value="")
+    df.attrs["cache_stats"] = stats
+    return df
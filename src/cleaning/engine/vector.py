@@ -0,0 +1,106 @@
+import re
+import pandas as pd
+from src.cleaning.engine import scalar, dates
+from src.cleaning.engine.skills import default_matcher
+from src.cleaning.engine.locations import default_gazetteer
+
+# ============================================================================
+# OPÉRATIONS VECTORISÉES (colonne entière)
+# ============================================================================
+# Équivalents des fonctions de scalar.py sur des Series, via les méthodes
+# .str de pandas (normalize, replace/extract regex) au lieu d'un apply par
+# ligne. Toutes prennent et rendent des Series de texte ("" = vide).
+
+def as_text(series):
+    """Series de texte, valeurs manquantes -> ""."""
+    return series.where(series.notna(), "").astype(str)
+
+
+def clean_text(series, drop=None):
+    """Accents, espaces multiples, strip ; `drop` : regex à retirer (cf. scalar.clean_text)."""
+    s = as_text(series)
+    s = s.str.normalize("NFKD").str.encode("ascii", "ignore").str.decode("ascii")
+    s = s.str.replace(r"\s+", " ", regex=True).str.strip()
+    if drop:
+        s = s.str.replace(drop, "", regex=True).str.strip()
+    return s
+
+
+def clean_list(series, limit=3):
+    """Listes multi-valeurs : pas de forme vectorielle simple, appliqué par ligne."""
+    return as_text(series).apply(scalar.clean_list_or_text, limit=limit)
+
+
+def parse_dates(series, reference=None):
+    """
+    Dates relatives/absolues -> YYYY-MM-DD, chaque valeur distincte classée
+    une fois ; `reference` : scraped_at des lignes (cf. dates.py).
+    """
+    return dates.parse_dates(as_text(series), reference)
+
+
+def _int_text(series):
+    """Texte numérique -> entier sans zéros initiaux, "" sinon."""
+    num = pd.to_numeric(series, errors="coerce").astype("Int64")
+    return num.astype(str).where(num.notna(), "")
+
+
+def parse_salary(series):
+    """Salaire -> DataFrame (salary_min, salary_max) (cf. scalar.parse_salary)."""
+    raw = as_text(series)
+
+    # Tuple format "('1200', '1500')" ; groupes extraits en "string" : les
+    # NA se complètent par fillna sans downcast d'un tableau object
+    tup = raw.str.extract(r"^\('(\d+)'(?:[^']*'(\d+)')?").astype("string")
+    tup[1] = tup[1].fillna(tup[0])
+
+    s = raw.str.replace(r"TND|DT|dt|\s|\.", "", regex=True)
+    lt = s.str.extract(r"^<(\d+)$")[0].astype("string")
+    gt = s.str.extract(r"^>(\d+)$")[0].astype("string")
+    rng = s.str.extract(r"^(\d+)-(\d+)").astype("string")
+    single = s.str.extract(r"^(\d+)$")[0].astype("string")
+
+    # "<X" n'a pas de plancher, ">X" pas de plafond
+    low = tup[0].fillna(gt).fillna(rng[0]).fillna(single)
+    high = tup[1].fillna(lt).fillna(rng[1]).fillna(single)
+    return pd.DataFrame({0: _int_text(low), 1: _int_text(high)}, index=series.index)
+
+
+def location_parts(series):
+    """
+    Location -> DataFrame (city, region, country) canoniques, via l'index du
+    gazetteer (cf. locations.Gazetteer) ; valeurs distinctes une seule fois.
+    """
+    s = as_text(series)
+    codes, uniques = pd.factorize(s)
+    gazetteer = default_gazetteer()
+    parts = [gazetteer.locate(v) if v.strip() else ("", "", "") for v in uniques]
+    out = pd.DataFrame(parts, columns=range(3), dtype=object).reindex(range(len(uniques)))
+    out = out.iloc[codes].fillna("")
+    out.index = series.index
+    return out
+
+
+def extract_skills(series):
+    """
+    Compétences reconnues dans la description, séparées par ", ". Un seul
+    passage par description pour toute la taxonomie (cf. skills.SkillMatcher).
+    """
+    matcher = default_matcher()
+    return as_text(series).map(matcher.extract)
+
+
+def extract_first(series, patterns, groups=1):
+    """Premier pattern qui matche, par ligne (cf. scalar.extract_first)."""
+    s = as_text(series)
+    out = pd.DataFrame(index=series.index, columns=range(groups), dtype=object)
+    for pattern in patterns:
+        found = s.str.extract(pattern, flags=re.IGNORECASE)
+        # un pattern à un seul groupe donne (x, x)
+        found = pd.concat([found.iloc[:, min(i, found.shape[1] - 1)] for i in range(groups)], axis=1)
+        found.columns = range(groups)
+        # on ne remplit que les lignes encore sans match
+        todo = out[0].isna() & found[0].notna()
+        out.loc[todo] = found.loc[todo]
+    out = out.fillna("")
+    return out[0] if groups == 1 else out
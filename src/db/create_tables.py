@@ -1,6 +1,49 @@
+from sqlalchemy import text, inspect, Uuid
 from src.db.db_session import Base,engine
 from src.db.models import Job
+from src.identity import job_key
 
-# Create all tables based on models
+# create_all does not add columns to existing tables
+UPGRADES = [
+    "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS content_hash VARCHAR(32)",
+    "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS country VARCHAR(2)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_city ON jobs (city)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_country ON jobs (country)",
+]
+
+def upgrade_job_id_to_uuid(conn):
+    """Re-key a jobs table created with the old String(255) job_id."""
+    job_id_col = next(c for c in inspect(conn).get_columns("jobs") if c["name"] == "job_id")
+    if isinstance(job_id_col["type"], Uuid) or str(job_id_col["type"]).upper() == "UUID":
+        return
+    print("Converting jobs.job_id to canonical UUID keys...")
+    conn.execute(text("ALTER TABLE jobs ADD COLUMN job_key uuid"))
+    rows = conn.execute(text(
+        "SELECT id, detail_link, title, company, source, date_publication FROM jobs"
+    )).all()
+    conn.execute(
+        text("UPDATE jobs SET job_key = :key WHERE id = :id"),
+        [{"id": r.id, "key": job_key(r.detail_link, r.title, r.company, r.source,
+                                     r.date_publication.isoformat() if r.date_publication else "")}
+         for r in rows]
+    )
+    # rows that were the same offer under two old ids: keep the first one
+    conn.execute(text(
+        "DELETE FROM jobs a USING jobs b WHERE a.job_key = b.job_key AND a.id > b.id"
+    ))
+    conn.execute(text("ALTER TABLE jobs DROP COLUMN job_id"))
+    conn.execute(text("ALTER TABLE jobs RENAME COLUMN job_key TO job_id"))
+    conn.execute(text("ALTER TABLE jobs ALTER COLUMN job_id SET NOT NULL"))
+    conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_jobs_job_id ON jobs (job_id)"))
+
+# Bring an existing jobs table up to date first: job_clusters references
+# jobs.job_id as a uuid and cannot be created against the old VARCHAR key
+with engine.begin() as conn:
+    Job.__table__.create(bind=conn, checkfirst=True)
+    for stmt in UPGRADES:
+        conn.execute(text(stmt))
+    upgrade_job_id_to_uuid(conn)
+
+# Create the other tables based on models
 Base.metadata.create_all(bind=engine)
 print("All tables created successfully (if they did not exist).")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Date, DateTime, Float, Text
+from sqlalchemy import Column, String, Integer, Date, DateTime, Float, Text, Uuid, Boolean, ForeignKey
 from sqlalchemy.sql import func
 from .db_session import Base
 
@@ -6,7 +6,8 @@ class Job(Base):
     __tablename__ = "jobs"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    job_id = Column(String(255), unique=True, index=True, nullable=False)
+    # canonical 128-bit key from src/identity.py (native uuid in PostgreSQL)
+    job_id = Column(Uuid(as_uuid=True), unique=True, index=True, nullable=False)
     source = Column(String, nullable=False)
     title = Column(String)
     detail_link = Column(String)
@@ -18,12 +19,53 @@ class Job(Base):
     experience = Column(String)
     availability = Column(Text)
     location = Column(String)
+    # canonical names / ISO country code from the cleaning gazetteer
     region = Column(String)
-    city = Column(String)
+    city = Column(String, index=True)
+    country = Column(String(2), index=True)
     salary_min = Column(Float, nullable=True)
     salary_max = Column(Float, nullable=True)
     description = Column(Text)
     skills = Column(Text)
+
+    # blake2b of the cleaned content fields, lets the loader skip unchanged rows
+    content_hash = Column(String(32), nullable=True)
     
     # stores timestamps automatically
     scraped_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=True)
+
+
+class LoadRun(Base):
+    """One row per loader run, to track load throughput over time."""
+    __tablename__ = "load_runs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    finished_at = Column(DateTime(timezone=True))
+    duration_s = Column(Float)
+    status = Column(String(16))
+    files = Column(Integer)
+    rows_read = Column(Integer)
+    rows_per_sec = Column(Float)
+    inserted = Column(Integer)
+    updated = Column(Integer)
+    unchanged = Column(Integer)
+    duplicate = Column(Integer)
+    rejected = Column(Integer)
+    read_s = Column(Float)
+    convert_s = Column(Float)
+    insert_s = Column(Float)
+    commit_s = Column(Float)
+    error = Column(Text)
+
+
+class JobCluster(Base):
+    """Near-duplicate cluster membership, rebuilt by src/loadDB/dedup.py."""
+    __tablename__ = "job_clusters"
+
+    job_id = Column(Uuid(as_uuid=True), ForeignKey("jobs.job_id", ondelete="CASCADE"), primary_key=True)
+    # job_id of the canonical job of the cluster
+    cluster_id = Column(Uuid(as_uuid=True), index=True, nullable=False)
+    is_canonical = Column(Boolean, nullable=False, default=False)
+    # estimated Jaccard similarity with the canonical job
+    similarity = Column(Float)
@@ -0,0 +1,89 @@
+"""
+Canonical job identity shared by the scrapers, the cleaners and the loader.
+
+A job is identified by a 128-bit uuid5 of its normalized detail link, so the
+same offer gets the same key at every stage of the pipeline and the `jobs`
+table can index it as a native UUID instead of a long string.
+"""
+import re
+import uuid
+import unicodedata
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote
+
+# Namespace of all job keys; changing it re-keys every job
+JOB_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://github.com/EmnaWalha99/Job-Portal/jobs")
+
+# Query parameters that never change the offer a link points to
+TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid)$", re.IGNORECASE)
+
+
+def _is_blank(value):
+    # NaN is the only value not equal to itself
+    return value is None or value != value or str(value).strip() == ""
+
+
+def _fold(text):
+    """Lowercase and strip accents so encoded and decoded links compare equal."""
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def canonical_url(url):
+    """
+    Normalize a detail link: decode %-escapes, fold accents and case, ignore
+    scheme, "www.", fragment, tracking parameters and trailing slashes.
+    Returns "" for empty input.
+    """
+    if _is_blank(url):
+        return ""
+    parts = urlsplit(_fold(unquote(str(url))))
+    host = parts.netloc
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not TRACKING_PARAMS.match(k)
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("https" if host else "", host, path, urlencode(query), ""))
+
+
+def job_key(detail_link, title="", company="", source="", date_publication=""):
+    """
+    Canonical 128-bit key of a job.
+
+    Uses the detail link when there is one; otherwise falls back to the
+    title/company/source/date of the offer. A job with none of these gets
+    a random key, as it cannot be recognized again anyway.
+    """
+    url = canonical_url(detail_link)
+    if url:
+        return uuid.uuid5(JOB_NAMESPACE, url)
+    fields = [title, company, source, date_publication]
+    name = "|".join("" if _is_blank(f) else _fold(f) for f in fields)
+    if not name.strip("|"):
+        return uuid.uuid4()
+    return uuid.uuid5(JOB_NAMESPACE, name)
+
+
+def job_key_from_row(row):
+    """job_key() for a pandas row or a plain dict."""
+    return job_key(
+        row.get("detail_link"),
+        row.get("title"),
+        row.get("company"),
+        row.get("source"),
+        row.get("date_publication"),
+    )
+
+
+def parse_job_key(value):
+    """Return value as a UUID if it already is a job key, else None."""
+    if isinstance(value, uuid.UUID):
+        return value
+    if _is_blank(value):
+        return None
+    try:
+        return uuid.UUID(str(value).strip())
+    except ValueError:
+        return None
@@ -0,0 +1,139 @@
+"""
+Near-duplicate detection across sources, run after the loader.
+
+The same offer is often posted on several job boards under different links,
+so job_id (one per link) cannot catch it. This stage streams the jobs table,
+computes MinHash signatures of title + company + description, finds candidate
+pairs with LSH (see minhash.py) and rebuilds job_clusters: one row per job in
+a cluster of two or more, pointing to the canonical job of its cluster. The
+API hides the non-canonical jobs by default.
+"""
+import time
+import numpy as np
+from sqlalchemy import select, delete, insert
+from sqlalchemy.orm import sessionmaker
+from src.db.db_session import engine
+from src.db.models import Job, JobCluster
+from src.loadDB import minhash
+
+Session = sessionmaker(bind=engine)
+
+# Rows fetched per round trip / inserted per statement
+CHUNK_SIZE = 5000
+
+# Only link jobs from different boards; near-identical offers on one board
+# are usually distinct openings (same role, other city)
+CROSS_SOURCE_ONLY = True
+
+# The most complete job of a cluster (most of these filled) is canonical
+COMPLETENESS_FIELDS = [
+    "company", "date_publication", "sector", "contract_type", "study_level",
+    "experience", "city", "salary_min", "description", "skills"
+]
+
+COLUMNS = [Job.id, Job.job_id, Job.source, Job.title] + [
+    getattr(Job, f) for f in COMPLETENESS_FIELDS
+]
+
+
+def job_text(title, company, description):
+    return " ".join(x for x in (title, company, description) if x)
+
+
+def completeness(row):
+    return sum(1 for f in COMPLETENESS_FIELDS if row[f] not in (None, ""))
+
+
+def signatures_from_rows(rows, meta):
+    """Append rows to meta and return their MinHash signatures."""
+    shingle_sets = []
+    for row in rows:
+        meta["id"].append(row["id"])
+        meta["job_id"].append(row["job_id"])
+        meta["source"].append(row["source"])
+        meta["completeness"].append(completeness(row))
+        shingle_sets.append(minhash.shingles(job_text(row["title"], row["company"], row["description"])))
+    return minhash.signatures(shingle_sets)
+
+
+def read_jobs(session):
+    """Stream the jobs table; only ids and signatures stay in memory."""
+    meta = {"id": [], "job_id": [], "source": [], "completeness": []}
+    sigs = [np.empty((0, minhash.NUM_PERM), dtype=np.uint32)]
+    result = session.execute(select(*COLUMNS).execution_options(yield_per=CHUNK_SIZE))
+    for rows in result.mappings().partitions():
+        sigs.append(signatures_from_rows(rows, meta))
+    return meta, np.vstack(sigs)
+
+
+def find_clusters(meta, sig):
+    """
+    Cluster rows (dicts for job_clusters) and the number of LSH candidate
+    pairs before filtering.
+    """
+    sources = np.array(meta["source"], dtype=object)
+    valid = (sig != minhash.EMPTY).any(axis=1)
+    pairs = minhash.candidate_pairs(sig, valid)
+    n_candidates = len(pairs)
+    if CROSS_SOURCE_ONLY:
+        pairs = pairs[sources[pairs[:, 0]] != sources[pairs[:, 1]]]
+    pairs = minhash.similar_pairs(sig, pairs)
+
+    labels = minhash.cluster_labels(len(sig), pairs)
+    members = np.flatnonzero(np.bincount(labels, minlength=len(labels))[labels] > 1)
+
+    # canonical job: most complete first, then oldest row
+    ids = np.array(meta["id"])
+    filled = np.array(meta["completeness"])
+    members = members[np.lexsort((ids[members], -filled[members], labels[members]))]
+    canonical = {}
+    for m in members:
+        canonical.setdefault(labels[m], m)
+
+    # components chain pairs (a~b and b~c with a, c far apart): a job stays
+    # in its cluster only when it is similar to the canonical job itself
+    leaders = np.array([canonical[labels[m]] for m in members], dtype=np.int64)
+    sims = minhash.similarity(sig, members, leaders) if len(members) else np.empty(0)
+    kept = sims >= minhash.THRESHOLD
+    sizes = np.bincount(labels[members[kept]], minlength=len(labels))
+    kept &= sizes[labels[members]] > 1
+
+    rows = []
+    for m, c, sim in zip(members[kept], leaders[kept], sims[kept]):
+        rows.append({
+            "job_id": meta["job_id"][m],
+            "cluster_id": meta["job_id"][c],
+            "is_canonical": bool(m == c),
+            "similarity": float(sim),
+        })
+    return rows, n_candidates
+
+
+def save_clusters(session, rows):
+    """Replace the content of job_clusters in one transaction."""
+    session.execute(delete(JobCluster))
+    for i in range(0, len(rows), CHUNK_SIZE):
+        session.execute(insert(JobCluster), rows[i:i + CHUNK_SIZE])
+    session.commit()
+
+
+def main():
+    start = time.perf_counter()
+    session = Session()
+    try:
+        meta, sig = read_jobs(session)
+        rows, n_candidates = find_clusters(meta, sig)
+        save_clusters(session, rows)
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    clusters = sum(r["is_canonical"] for r in rows)
+    print(f"[dedup] {len(sig)} jobs, {n_candidates} candidate pairs, {clusters} clusters, "
+          f"{len(rows) - clusters} duplicates hidden ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
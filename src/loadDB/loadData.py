@@ -1,16 +1,34 @@
 import os
-import uuid
+import hashlib
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, date
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
 from src.db.db_session import engine
-from src.db.models import Job
+from src.db.models import Job, LoadRun
+from src.identity import job_key_from_row, parse_job_key
+from src.loadDB.run_report import RunReport
+from src.cleaning.cleaned_io import parquet_path_for, iter_parquet_records
 
 # Initialize session factory
 Session = sessionmaker(bind=engine)
 
-# List of cleaned CSV files
+# Rows per chunk in streaming mode (one commit per chunk)
+CHUNK_SIZE = 5000
+
+# Cleaned fields that define a posting's content; scraped_at changes on every
+# scrape and job_id is the key, so neither takes part in the hash
+HASHED_FIELDS = [
+    "source", "title", "detail_link", "company", "date_publication",
+    "sector", "contract_type", "study_level", "experience", "availability",
+    "location", "region", "city", "country", "salary_min", "salary_max",
+    "description", "skills"
+]
+
+# List of cleaned CSV files (the Parquet file next to each one is loaded
+# instead when it exists)
 csv_files = [
     "src/Data/cleanedData/jobs_optioncarriere_cleaned.csv",
     "src/Data/cleanedData/job_emploisTunisie_cleaned.csv",
@@ -22,6 +40,10 @@ def safe_str(x):
 
 def parse_date(date_str):
     """Parse a YYYY-MM-DD string to a Python date or return None for empty/invalid strings."""
+    if isinstance(date_str, datetime):
+        return date_str.date()
+    if isinstance(date_str, date):
+        return date_str
     if not date_str or str(date_str).strip() == "":
         return None
     try:
@@ -31,6 +53,8 @@ def parse_date(date_str):
 
 def parse_datetime(datetime_str):
     """Parse a YYYY-MM-DD HH:MM:SS string to a Python datetime or return None."""
+    if isinstance(datetime_str, datetime):
+        return datetime_str
     if not datetime_str or str(datetime_str).strip() == "":
         return None
     try:
@@ -39,22 +63,21 @@ def parse_datetime(datetime_str):
         return None
 
 def make_job_id_from_row(row):
-    # Prefer existing job_id column when present and non-empty
-    if "job_id" in row.index and safe_str(row.get("job_id")).strip():
-        return safe_str(row.get("job_id")).strip()
-    # Fallback: deterministic uuid5 based on link/title/company/date
-    key = "|".join([
-        safe_str(row.get("detail_link", "")).strip(),
-        safe_str(row.get("title", "")).strip(),
-        safe_str(row.get("company", "")).strip(),
-        safe_str(row.get("date_publication", "")).strip()
-    ])
-    # If key is empty, still generate a unique id from random uuid
-    if not key.strip():
-        return f"uid-{uuid.uuid4().hex}"
-    return uuid.uuid5(uuid.NAMESPACE_URL, key).hex
+    # Prefer the cleaner's job_id when it is already a canonical key
+    job_id = parse_job_key(row.get("job_id"))
+    if job_id is not None:
+        return job_id
+    # Older cleaned files carry link-derived strings: re-key from the row
+    return job_key_from_row(row)
 
 def to_nullable_number(x):
+    if x is None or x == "":
+        return None
+    # typed (Parquet) values skip the text parsing below
+    if isinstance(x, (int, float)):
+        if x != x:
+            return None
+        return int(x) if float(x).is_integer() else float(x)
     try:
         v = pd.to_numeric(x, errors="coerce")
         if pd.isna(v):
@@ -65,69 +88,230 @@ def to_nullable_number(x):
     except Exception:
         return None
 
-def load_csv_to_db(file_path, session):
+def compute_content_hash(values):
+    """Stable 128-bit hex digest of the cleaned content fields of a job."""
+    h = hashlib.blake2b(digest_size=16)
+    for field in HASHED_FIELDS:
+        v = values.get(field)
+        h.update(("" if v is None else str(v)).encode("utf-8"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+def row_to_job_values(row, job_id):
+    """Convert a cleaned row (pandas Series or plain dict) to jobs column values."""
+    values = {
+        "job_id": job_id,
+        "source": safe_str(row.get('source', '')),
+        "title": safe_str(row.get('title', '')),
+        "detail_link": safe_str(row.get('detail_link', '')),
+        "company": safe_str(row.get('company', '')),
+        "date_publication": parse_date(row.get('date_publication', '')),
+        "sector": safe_str(row.get('sector', '')),
+        "contract_type": safe_str(row.get('contract_type', '')),
+        "study_level": safe_str(row.get('study_level', '')),
+        "experience": safe_str(row.get('experience', '')),
+        "availability": safe_str(row.get('availability', '')),
+        "location": safe_str(row.get('location', '')),
+        "region": safe_str(row.get('region', '')),
+        "city": safe_str(row.get('city', '')),
+        "country": safe_str(row.get('country', '')),
+        "salary_min": to_nullable_number(row.get('salary_min', None)),
+        "salary_max": to_nullable_number(row.get('salary_max', None)),
+        "description": safe_str(row.get('description', '')),
+        "skills": safe_str(row.get('skills', '')),
+        "scraped_at": parse_datetime(row.get('scraped_at', None))
+    }
+    values["content_hash"] = compute_content_hash(values)
+    return values
+
+def row_to_job(row, job_id):
+    """Build a Job from a cleaned row (pandas Series or plain dict)."""
+    return Job(**row_to_job_values(row, job_id))
+
+def validate_row(row):
+    """Return why a cleaned row cannot be loaded, or None if it is fine."""
+    if not safe_str(row.get("source", "")).strip():
+        return "missing source"
+    if not safe_str(row.get("title", "")).strip() and not safe_str(row.get("detail_link", "")).strip():
+        return "missing title and detail_link"
+    return None
+
+def convert_records(records, report):
+    """Convert cleaned records to jobs values; bad rows go to the report's reject file."""
+    rows = []
+    for row in records:
+        reason = validate_row(row)
+        if reason is None:
+            try:
+                rows.append(row_to_job_values(row, make_job_id_from_row(row)))
+                continue
+            except Exception as e:
+                reason = f"conversion error: {e}"
+        report.reject(row, reason)
+    return rows
+
+def upsert_jobs(session, rows):
+    """
+    Insert new jobs and update existing ones only when their content changed.
+
+    Uses INSERT ... ON CONFLICT (job_id) DO UPDATE ... WHERE the stored
+    content_hash differs, so unchanged rows cost no write at all. Rows
+    written are returned with (xmax = 0) telling inserts from updates;
+    every row not returned was unchanged.
+    """
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0, "duplicate": 0}
+    if not rows:
+        return counts
+
+    # ON CONFLICT cannot touch the same row twice in one statement
+    unique_rows = list({r["job_id"]: r for r in rows}.values())
+    counts["duplicate"] = len(rows) - len(unique_rows)
+    rows = unique_rows
+
+    stmt = pg_insert(Job.__table__)
+    update_cols = {
+        c.name: stmt.excluded[c.name]
+        for c in Job.__table__.columns
+        if c.name not in ("id", "job_id")
+    }
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Job.__table__.c.job_id],
+        set_=update_cols,
+        # IS DISTINCT FROM (rather than <>) so rows loaded before the
+        # content_hash column existed (NULL hash) get refreshed once
+        where=Job.__table__.c.content_hash.is_distinct_from(stmt.excluded.content_hash),
+    ).returning(literal_column("(xmax = 0)").label("inserted"))
+
+    written = session.execute(stmt, rows).all()
+    counts["inserted"] = sum(1 for r in written if r.inserted)
+    counts["updated"] = len(written) - counts["inserted"]
+    counts["unchanged"] = len(rows) - len(written)
+    return counts
+
+def is_loadable(file_path):
     if not os.path.exists(file_path):
         print(f"[load] file not found: {file_path}")
-        return 0
+        return False
     if os.path.getsize(file_path) == 0:
         print(f"[load] file empty: {file_path}")
-        return 0
-
-    df = pd.read_csv(file_path, encoding="utf-8-sig", dtype=str).fillna("")
-    added = 0
-
-    for _, row in df.iterrows():
-        job_id = make_job_id_from_row(row)
-
-        # skip if already in DB
-        if session.query(Job).filter_by(job_id=job_id).first():
-            continue
-
-        job = Job(
-            job_id=job_id,
-            source=safe_str(row.get('source', '')),
-            title=safe_str(row.get('title', '')),
-            detail_link=safe_str(row.get('detail_link', '')),
-            company=safe_str(row.get('company', '')),
-            date_publication=parse_date(row.get('date_publication', '')),
-            sector=safe_str(row.get('sector', '')),
-            contract_type=safe_str(row.get('contract_type', '')),
-            study_level=safe_str(row.get('study_level', '')),
-            experience=safe_str(row.get('experience', '')),
-            availability=safe_str(row.get('availability', '')),
-            location=safe_str(row.get('location', '')),
-            region=safe_str(row.get('region', '')),
-            city=safe_str(row.get('city', '')),
-            salary_min=to_nullable_number(row.get('salary_min', None)),
-            salary_max=to_nullable_number(row.get('salary_max', None)),
-            description=safe_str(row.get('description', '')),
-            skills=safe_str(row.get('skills', '')),
-            scraped_at=parse_datetime(row.get('scraped_at', None))
-        )
-
-        session.add(job)
-        added += 1
-
-    return added
-
-def main():
+        return False
+    return True
+
+def load_records(records, session, report):
+    """Convert, upsert and commit one batch of cleaned records."""
+    report.rows_read += len(records)
+    with report.phase("convert"):
+        rows = convert_records(records, report)
+    with report.phase("insert"):
+        report.add(upsert_jobs(session, rows))
+    with report.phase("commit"):
+        session.commit()
+        session.expunge_all()
+
+def load_csv_to_db(file_path, session, report):
+    if not is_loadable(file_path):
+        return report
+
+    with report.phase("read"):
+        records = pd.read_csv(file_path, encoding="utf-8-sig", dtype=str).fillna("").to_dict("records")
+    load_records(records, session, report)
+    return report
+
+def load_csv_to_db_streaming(file_path, session, report, chunksize=CHUNK_SIZE):
+    """
+    Stream a cleaned CSV into the DB with bounded memory.
+
+    The file is read `chunksize` rows at a time; each chunk is upserted
+    in one statement and committed, so memory does not grow with the
+    file size.
+    """
+    if not is_loadable(file_path):
+        return report
+
+    reader = iter(pd.read_csv(file_path, encoding="utf-8-sig", dtype=str, chunksize=chunksize))
+
+    while True:
+        with report.phase("read"):
+            chunk = next(reader, None)
+            if chunk is None:
+                break
+            records = chunk.fillna("").to_dict("records")
+            del chunk
+        load_records(records, session, report)
+        del records
+
+    return report
+
+def load_parquet_to_db(file_path, session, report, chunksize=CHUNK_SIZE):
+    """
+    Load a cleaned Parquet file batch by batch.
+
+    Arrow record batches already carry typed dates, timestamps and
+    numbers, so rows go to the upsert without re-parsing CSV text.
+    """
+    if not is_loadable(file_path):
+        return report
+
+    batches = iter_parquet_records(file_path, chunksize)
+
+    while True:
+        with report.phase("read"):
+            records = next(batches, None)
+        if records is None:
+            break
+        load_records(records, session, report)
+        del records
+
+    return report
+
+def resolve_cleaned_file(csv_path):
+    """Prefer the typed Parquet output of a cleaner over its CSV export."""
+    parquet_path = parquet_path_for(csv_path)
+    return parquet_path if os.path.exists(parquet_path) else csv_path
+
+def load_file(file_path, session, report, stream=True, chunksize=CHUNK_SIZE):
+    if file_path.endswith(".parquet"):
+        return load_parquet_to_db(file_path, session, report, chunksize=chunksize)
+    if stream:
+        return load_csv_to_db_streaming(file_path, session, report, chunksize=chunksize)
+    return load_csv_to_db(file_path, session, report)
+
+def save_run(run):
+    """Persist the run summary in load_runs (own session, so it survives failed files)."""
     session = Session()
-    total_added = 0
     try:
-        for file in csv_files:
-            added = load_csv_to_db(file, session)
-            print(f"[load] {added} rows added from {file}")
-            total_added += added
+        session.add(LoadRun(**run.to_row()))
         session.commit()
-    except IntegrityError as e:
-        session.rollback()
-        print("[error] IntegrityError:", str(e))
     except Exception as e:
         session.rollback()
-        print("[error] Exception:", str(e))
+        print("[error] could not save load run summary:", str(e))
     finally:
         session.close()
-    print(f"All CSVs processed. Total rows added: {total_added}")
+
+def main(stream=True, chunksize=CHUNK_SIZE):
+    session = Session()
+    run = RunReport()
+    try:
+        for csv_file in csv_files:
+            file = resolve_cleaned_file(csv_file)
+            report = run.new_file(file)
+            try:
+                load_file(file, session, report, stream=stream, chunksize=chunksize)
+            except IntegrityError as e:
+                session.rollback()
+                report.error = f"IntegrityError: {e}"
+            except Exception as e:
+                session.rollback()
+                report.error = f"{type(e).__name__}: {e}"
+            print(report.summary())
+    finally:
+        session.close()
+        run.finish()
+
+    save_run(run)
+    print(f"All CSVs processed ({run.status}). Total: {run.total('inserted')} inserted, "
+          f"{run.total('updated')} updated, {run.total('unchanged')} unchanged, "
+          f"{run.total('duplicate')} duplicate, {run.total('rejected')} rejected")
 
 if __name__ == "__main__":
     main()
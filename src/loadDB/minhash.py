@@ -0,0 +1,131 @@
+"""
+MinHash signatures and LSH banding for near-duplicate job detection.
+
+Documents are reduced to sets of hashed word shingles; MinHash runs on whole
+batches of shingles with NumPy (one multiply-shift hash per permutation and a
+min-reduce per document), and LSH finds candidate pairs by sorting band keys,
+so the cost grows with the number of documents, not with the number of pairs.
+"""
+import re
+import zlib
+import unicodedata
+import numpy as np
+
+NUM_PERM = 128
+# 16 bands of 8 rows: pairs become candidates from a Jaccard of ~(1/16)^(1/8) = 0.71
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+# Estimated Jaccard a candidate pair needs to be kept
+THRESHOLD = 0.7
+# Members of a bucket paired with each member (all of them below this size)
+BUCKET_SPAN = 64
+# Shingles hashed at once (NUM_PERM x this many uint64 in memory)
+MAX_SHINGLES_PER_BATCH = 50_000
+
+_rng = np.random.default_rng(20240601)
+# odd multipliers for multiply-shift hashing; uint64 arithmetic wraps
+_A = _rng.integers(1, 2**63, NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2**63, NUM_PERM, dtype=np.uint64)
+_BAND_MIX = _rng.integers(1, 2**63, ROWS, dtype=np.uint64) | np.uint64(1)
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+EMPTY = np.iinfo(np.uint32).max
+
+
+def normalize(text):
+    text = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii")
+    return text.lower()
+
+
+def shingles(text):
+    """Unique uint32 hashes of the word SHINGLE_SIZE-grams of text."""
+    words = WORD_RE.findall(normalize(text))
+    if len(words) <= SHINGLE_SIZE:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    hashes = np.fromiter((zlib.crc32(g.encode()) for g in grams), dtype=np.uint32, count=len(grams))
+    return np.unique(hashes)
+
+
+def signatures(shingle_sets):
+    """
+    MinHash signatures of a list of shingle arrays, shape (n, NUM_PERM) uint32.
+    Documents without shingles keep a row of EMPTY and must not be bucketed.
+    """
+    n = len(shingle_sets)
+    sig = np.full((n, NUM_PERM), EMPTY, dtype=np.uint32)
+    lengths = np.array([len(s) for s in shingle_sets], dtype=np.int64)
+    start = 0
+    while start < n:
+        # next batch of documents holding at most MAX_SHINGLES_PER_BATCH shingles
+        end, total = start + 1, lengths[start]
+        while end < n and total + lengths[end] <= MAX_SHINGLES_PER_BATCH:
+            total += lengths[end]
+            end += 1
+        batch_lengths = lengths[start:end]
+        filled = batch_lengths > 0
+        if total:
+            x = np.concatenate(shingle_sets[start:end]).astype(np.uint64)
+            hashed = ((x[:, None] * _A + _B) >> np.uint64(32)).astype(np.uint32)
+            offsets = np.cumsum(batch_lengths) - batch_lengths
+            sig[start:end][filled] = np.minimum.reduceat(hashed, offsets[filled], axis=0)
+        start = end
+    return sig
+
+
+def similarity(sig, i, j):
+    """Estimated Jaccard of documents i and j (arrays of indices allowed)."""
+    return (sig[i] == sig[j]).mean(axis=-1)
+
+
+def candidate_pairs(sig, valid):
+    """
+    Index pairs (i, j), i < j, sharing an LSH bucket in at least one band.
+    Every member of a bucket is paired with the BUCKET_SPAN members after it,
+    so all pairs of a bucket are candidates unless it is larger than that
+    (a popular offer reposted many times), and the number of pairs stays
+    linear in the number of documents.
+    """
+    idx = np.flatnonzero(valid)
+    if len(idx) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = []
+    for band in range(BANDS):
+        rows = sig[idx, band * ROWS:(band + 1) * ROWS].astype(np.uint64)
+        keys = (rows * _BAND_MIX).sum(axis=1)
+        order = np.argsort(keys, kind="stable")
+        keys, members = keys[order], idx[order]
+        for d in range(1, BUCKET_SPAN + 1):
+            same = keys[d:] == keys[:-d]
+            if not same.any():
+                break
+            pairs.append(np.stack([members[:-d][same], members[d:][same]], axis=1))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def similar_pairs(sig, pairs, threshold=THRESHOLD):
+    """The candidate pairs whose estimated Jaccard reaches the threshold."""
+    if len(pairs) == 0:
+        return pairs
+    return pairs[similarity(sig, pairs[:, 0], pairs[:, 1]) >= threshold]
+
+
+def cluster_labels(n, pairs):
+    """Connected components of the pairs (union-find); label = smallest index."""
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs.tolist():
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+    return np.array([find(i) for i in range(n)], dtype=np.int64)
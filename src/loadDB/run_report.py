@@ -0,0 +1,129 @@
+import os
+import csv
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+PHASES = ["read", "convert", "insert", "commit"]
+COUNTS = ["inserted", "updated", "unchanged", "duplicate", "rejected"]
+
+
+def rejects_path_for(file_path):
+    """Sidecar file receiving the rejected rows of a cleaned file."""
+    return os.path.splitext(file_path)[0] + ".rejects.csv"
+
+
+class FileReport:
+    """Phase timings, row counts and rejected rows of one loaded file."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.rejects_path = rejects_path_for(file_path)
+        self.timings = {p: 0.0 for p in PHASES}
+        self.counts = {c: 0 for c in COUNTS}
+        self.rows_read = 0
+        self.error = None
+        self._rejects_file = None
+        self._rejects_writer = None
+        # stale rejects from a previous run would be misleading
+        if os.path.exists(self.rejects_path):
+            os.remove(self.rejects_path)
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+
+    def add(self, counts):
+        for k, v in counts.items():
+            self.counts[k] += v
+
+    def reject(self, row, reason):
+        """Count a row as rejected and append it with its reason to the sidecar file."""
+        self.counts["rejected"] += 1
+        if self._rejects_writer is None:
+            self._rejects_file = open(self.rejects_path, "w", newline="", encoding="utf-8-sig")
+            self._rejects_writer = csv.DictWriter(
+                self._rejects_file,
+                fieldnames=list(row.keys()) + ["reject_reason"],
+                extrasaction="ignore"
+            )
+            self._rejects_writer.writeheader()
+        self._rejects_writer.writerow({**row, "reject_reason": reason})
+
+    def close(self):
+        if self._rejects_file is not None:
+            self._rejects_file.close()
+            self._rejects_file = None
+
+    @property
+    def elapsed(self):
+        return sum(self.timings.values())
+
+    @property
+    def rows_per_sec(self):
+        return self.rows_read / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self):
+        timings = " ".join(f"{p}={self.timings[p]:.2f}s" for p in PHASES)
+        counts = ", ".join(f"{self.counts[c]} {c}" for c in COUNTS)
+        line = f"[load] {self.file_path}: {self.rows_read} rows ({counts}) | {timings} | {self.rows_per_sec:.0f} rows/s"
+        if self.counts["rejected"]:
+            line += f"\n[load]   rejected rows written to {self.rejects_path}"
+        if self.error:
+            line += f"\n[error] {self.file_path}: {self.error}"
+        return line
+
+
+class RunReport:
+    """Aggregates the FileReports of one loader run into a load_runs row."""
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.finished_at = None
+        self.files = []
+
+    def new_file(self, file_path):
+        report = FileReport(file_path)
+        self.files.append(report)
+        return report
+
+    def finish(self):
+        self.finished_at = datetime.now()
+        for report in self.files:
+            report.close()
+
+    def total(self, key):
+        if key == "rows_read":
+            return sum(r.rows_read for r in self.files)
+        if key in PHASES:
+            return sum(r.timings[key] for r in self.files)
+        return sum(r.counts[key] for r in self.files)
+
+    @property
+    def status(self):
+        failed = sum(1 for r in self.files if r.error)
+        if not failed:
+            return "success"
+        return "failed" if failed == len(self.files) else "partial"
+
+    def to_row(self):
+        """Column values of the load_runs summary row."""
+        duration = (self.finished_at - self.started_at).total_seconds()
+        rows_read = self.total("rows_read")
+        errors = [f"{r.file_path}: {r.error}" for r in self.files if r.error]
+        return dict(
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            duration_s=duration,
+            files=len(self.files),
+            rows_read=rows_read,
+            rows_per_sec=rows_read / duration if duration > 0 else 0.0,
+            **{c: self.total(c) for c in COUNTS},
+            **{f"{p}_s": self.total(p) for p in PHASES},
+            status=self.status,
+            error="\n".join(errors) or None,
+        )
@@ -128,17 +128,17 @@ async def run_scrapers(scraper_duration=120):
     scrapers = [
         run_cmd_with_timeout(
             "Scraper Emplois Tunisie",
-            "python src/scrapers/emploisTunisie.py",
+            "python -m src.scrapers.emploisTunisie",
             max_duration=scraper_duration
         ),
         run_cmd_with_timeout(
             "Scraper Kee Jobs",
-            "python src/scrapers/keejobs.py",
+            "python -m src.scrapers.keejobs",
             max_duration=scraper_duration
         ),
         run_cmd_with_timeout(
             "Scraper Option Carriere",
-            "python src/scrapers/optioncarrier.py",
+            "python -m src.scrapers.optioncarrier",
             max_duration=scraper_duration
         )
     ]
@@ -160,17 +160,17 @@ async def run_cleaners():
     cleaners = [
         run_cmd_with_timeout(
             "Cleaning Emplois Tunisie",
-            "python src/cleaning/emploisTunisie_cleaning.py",
+            "python -m src.cleaning.emploisTunisie_cleaning",
             max_duration=300
         ),
         run_cmd_with_timeout(
             "Cleaning Kee Jobs",
-            "python src/cleaning/keejobs_cleaning.py",
+            "python -m src.cleaning.keejobs_cleaning",
             max_duration=300
         ),
         run_cmd_with_timeout(
             "Cleaning Option Carriere",
-            "python src/cleaning/optioncarrier_cleaning.py",
+            "python -m src.cleaning.optioncarrier_cleaning",
             max_duration=300
         ),
     ]
@@ -192,7 +192,7 @@ async def load_to_db():
     print("\nLoading data to DB...")
     success = await run_cmd_with_timeout(
         "Load to DB",
-        "python src/loadDB/loadData.py",
+        "python -m src.loadDB.loadData",
         max_duration=600
     )
     
@@ -203,6 +203,23 @@ async def load_to_db():
     
     return success
 
+async def dedup_jobs():
+    """Cluster near-duplicate jobs across sources."""
+    print("\n" + "="*80)
+    print("STAGE 4: DEDUPLICATION")
+    print("="*80)
+    
+    success = await run_cmd_with_timeout(
+        "Dedup jobs",
+        "python -m src.loadDB.dedup",
+        max_duration=600
+    )
+    
+    if not success:
+        print("\nDeduplication failed, previous clusters kept")
+    
+    return success
+
 async def run_pipeline(scraper_duration=120):
     """Main pipeline with automatic scraper timeout."""
     print("\n" + "="*80)
@@ -228,6 +245,10 @@ async def run_pipeline(scraper_duration=120):
         # Stage 3: Load to DB
         db_success = await load_to_db()
         
+        # Stage 4: Near-duplicates across sources
+        if db_success:
+            await dedup_jobs()
+        
         # Summary
         end_time = datetime.now()
         duration = end_time - start_time
@@ -0,0 +1,87 @@
+"""
+Lean headless Chrome profile shared by every scraping driver.
+
+The parsers only read the DOM, so the browser does not need to download or
+render what the job sites load around it: images, fonts, stylesheets,
+media and third-party trackers are blocked (the image content setting,
+then Network.setBlockedURLs over CDP for every tab), Chrome runs headless
+with a small window, no extensions, no GPU and no background networking.
+
+The scrapers' list-page driver and the driver pool both come from
+new_driver(); bench_profile.py measures the bytes and load time saved.
+"""
+from functools import lru_cache
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from src.scrapers.waits import PAGE_LOAD_STRATEGY
+
+WINDOW_SIZE = "1280,800"
+
+# URL patterns never requested (Network.setBlockedURLs syntax, * = wildcard)
+BLOCKED_URLS = [
+    # images, fonts, stylesheets, media
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*.css", "*.mp4", "*.webm", "*.mp3",
+    # analytics, ads and social trackers
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*",
+    "*facebook.net*", "*connect.facebook.*", "*hotjar.com*", "*clarity.ms*",
+    "*linkedin.com/px*", "*snap.licdn.com*", "*tiktok.com/i18n/pixel*", "*criteo.*",
+    "*taboola.com*", "*outbrain.com*", "*onesignal.com*",
+]
+
+ARGUMENTS = [
+    "--headless=new",
+    f"--window-size={WINDOW_SIZE}",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-notifications",
+    "--mute-audio",
+    "--no-first-run",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-blink-features=AutomationControlled",
+]
+
+PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+
+@lru_cache(maxsize=None)
+def chromedriver_path():
+    """Driver binary, resolved once per process rather than once per driver."""
+    return ChromeDriverManager().install()
+
+
+def chrome_options(lean=True):
+    """Options of a scraping driver; lean=False keeps a plain headless Chrome (benchmark baseline)."""
+    options = webdriver.ChromeOptions()
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+    options.add_experimental_option("excludeSwitches", ["enable-automation", "disable-infobars"])
+    if not lean:
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={WINDOW_SIZE}")
+        return options
+    for argument in ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option("prefs", PREFS)
+    return options
+
+
+def block_resources(driver):
+    """Blocks BLOCKED_URLS in the driver's current tab (CDP settings are per tab)."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+
+
+def new_driver(lean=True, options=None):
+    """Chrome with the scraping profile, resources already blocked in its first tab."""
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options or chrome_options(lean))
+    if lean:
+        block_resources(driver)
+    return driver
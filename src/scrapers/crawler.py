@@ -0,0 +1,256 @@
+"""
+Concurrent detail page crawler (asyncio), polite per host.
+
+A list page gives a batch of detail URLs. They are fetched over HTTP by at
+most `concurrency` workers, with at most `per_host` requests in flight per
+host and at least `delay` seconds between two request starts on a host
+(raised to the robots.txt Crawl-delay). Network errors, 429 and 5xx are
+retried with jittered exponential backoff, and Retry-After pauses the host.
+Downloads run in threads on the pooled session of fetch.py, each page is
+parsed in the thread that downloaded it, and its record is yielded as soon
+as it is ready, so the scraper writes rows while the rest of the batch is
+still in flight.
+
+A page whose HTML lacks the `ready` selector, or that still fails after
+the retries, is yielded with a None record: the scraper loads it in the
+browser. URLs disallowed by robots.txt are skipped. Pages fresh in the
+page cache (page_cache.py) are parsed without any request, stale ones are
+revalidated with a conditional request; offline, only the cache is read.
+"""
+import queue
+import random
+import asyncio
+import threading
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+import requests
+from src.scrapers import fetch, page_cache
+
+CONCURRENCY = 8
+PER_HOST = 4
+# Seconds between two request starts on one host
+DELAY = 0.5
+
+RETRIES = 3
+# First backoff in seconds, doubled at each retry, +/- 50% jitter
+BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# Yielded by visit() for URLs robots.txt disallows
+SKIPPED = object()
+
+
+@lru_cache(maxsize=None)
+def robots_for(scheme, host):
+    """RobotFileParser of a host, read once; allows everything when robots.txt is missing."""
+    robots = RobotFileParser(f"{scheme}://{host}/robots.txt")
+    try:
+        response = fetch.http_session(retries=0).get(robots.url, timeout=fetch.TIMEOUT)
+    except requests.RequestException:
+        response = None
+    if response is None or response.status_code >= 400:
+        robots.allow_all = True
+    else:
+        robots.parse(response.text.splitlines())
+    return robots
+
+
+class Host:
+    """Politeness state of one host: in-flight slots, request spacing, robots.txt."""
+
+    def __init__(self, per_host, delay, robots=None):
+        self.slots = asyncio.Semaphore(per_host)
+        self.robots = robots
+        crawl_delay = robots.crawl_delay(fetch.USER_AGENT) if robots is not None else None
+        self.delay = max(delay, float(crawl_delay or 0))
+        self.next_start = 0.0
+
+    async def turn(self):
+        """Waits until the next request may start on this host."""
+        now = asyncio.get_running_loop().time()
+        start = max(now, self.next_start)
+        self.next_start = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def pause(self, seconds):
+        """No request starts on this host for `seconds` (Retry-After)."""
+        until = asyncio.get_running_loop().time() + seconds
+        self.next_start = max(self.next_start, until)
+
+
+def retry_after(response):
+    """Retry-After of a response in seconds, None if absent or given as a date."""
+    value = response.headers.get("Retry-After", "") if response is not None else ""
+    return float(value) if value.strip().isdigit() else None
+
+
+class Crawler:
+    """
+    parse(page) -> record, run on each page fetched over HTTP that has the
+    `ready` CSS selector (page: fetch.Element, read like a WebDriver).
+    """
+
+    def __init__(self, parse, ready, concurrency=CONCURRENCY, per_host=PER_HOST, delay=DELAY,
+                 retries=RETRIES, backoff=BACKOFF, robots=True):
+        self.parse = parse
+        self.ready = ready
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.delay = delay
+        self.retries = retries
+        self.backoff = backoff
+        self.robots = robots
+        self.session = fetch.http_session(retries=0, pool_size=max(per_host, fetch.POOL_SIZE))
+        self.hosts = {}
+        self.retried = 0
+        self.executor = None
+
+    async def host(self, url):
+        parts = urlsplit(url)
+        if parts.netloc not in self.hosts:
+            # one robots.txt read even when several workers reach a new host together
+            self.hosts[parts.netloc] = asyncio.ensure_future(self._new_host(parts.scheme, parts.netloc))
+        return await self.hosts[parts.netloc]
+
+    async def _new_host(self, scheme, netloc):
+        robots = await self.in_thread(robots_for, scheme, netloc) if self.robots else None
+        return Host(self.per_host, self.delay, robots)
+
+    async def in_thread(self, fn, *args, **kwargs):
+        # own pool: asyncio's default one is capped at cpu + 4 threads
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args, **kwargs))
+
+    def backoff_delay(self, attempt, response):
+        wait = min(MAX_BACKOFF, self.backoff * 2 ** attempt) * random.uniform(0.5, 1.5)
+        return max(wait, retry_after(response) or 0)
+
+    async def download(self, host, url, headers=None):
+        """Response of url, retried on errors; None when every attempt failed."""
+        for attempt in range(self.retries + 1):
+            response = None
+            async with host.slots:
+                await host.turn()
+                try:
+                    response = await self.in_thread(self.session.get, url, headers=headers,
+                                                    timeout=fetch.TIMEOUT)
+                except requests.RequestException as e:
+                    error = e
+                else:
+                    if response.status_code not in RETRY_STATUS:
+                        return response
+                    error = f"HTTP {response.status_code}"
+            if attempt == self.retries:
+                break
+            if retry_after(response):
+                host.pause(retry_after(response))
+            self.retried += 1
+            await asyncio.sleep(self.backoff_delay(attempt, response))
+        print(f"[crawler] {url}: gave up after {self.retries + 1} attempts ({error})")
+        return None
+
+    def read(self, url, page):
+        """(has the ready selector, record) of a parsed page, in a worker thread."""
+        if not fetch.is_ready(page, self.ready):
+            return False, None
+        try:
+            return True, self.parse(page)
+        except Exception as e:
+            print(f"[crawler] {url}: parse error: {e}")
+            return False, None
+
+    def read_response(self, url, response, entry):
+        return self.read(url, fetch.response_page(url, "detail", response, entry))
+
+    async def visit(self, url):
+        """Record of one URL, None if it needs the browser, SKIPPED if disallowed."""
+        page, entry = await self.in_thread(fetch.from_cache, url, "detail")
+        if page is not None or page_cache.offline:
+            ok, record = await self.in_thread(self.read, url, page)
+            if page is not None:
+                fetch.count_http(url, ok)
+            return record
+        host = await self.host(url)
+        if host.robots is not None and not host.robots.can_fetch(fetch.USER_AGENT, url):
+            print(f"[crawler] {url}: disallowed by robots.txt")
+            return SKIPPED
+        if not fetch.http_enabled(urlsplit(url).netloc):
+            return None
+        response = await self.download(host, url, page_cache.validators(entry))
+        if response is None:
+            ok, record = False, None
+        else:
+            ok, record = await self.in_thread(self.read_response, url, response, entry)
+        fetch.count_http(url, ok)
+        return record
+
+    async def crawl(self, urls):
+        """Yields (url, record) in completion order; record is None when the page needs the browser."""
+        urls = list(urls)
+        pending = iter(urls)
+        done = asyncio.Queue()
+
+        async def worker():
+            for url in pending:  # shared iterator: each URL is taken once
+                try:
+                    result = await self.visit(url)
+                except Exception as e:
+                    print(f"[crawler] {url}: {e}")
+                    result = None
+                await done.put((url, result))
+
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(urls)))]
+        try:
+            for _ in urls:
+                url, result = await done.get()
+                if result is not SKIPPED:
+                    yield url, result
+            await asyncio.gather(*workers)
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def crawl(urls, parse, ready, **options):
+    """
+    Crawler.crawl for the synchronous Selenium scrapers: the event loop runs
+    in a thread and (url, record) pairs are yielded here as they complete.
+    """
+    results = queue.Queue()
+    finished = object()
+
+    async def produce():
+        try:
+            async for item in Crawler(parse, ready, **options).crawl(urls):
+                results.put(item)
+        finally:
+            results.put(finished)
+
+    thread = threading.Thread(target=asyncio.run, args=(produce(),), daemon=True)
+    thread.start()
+    while (item := results.get()) is not finished:
+        yield item
+    thread.join()
+
+
+def crawl_with_browser(urls, parse, ready, pool, **options):
+    """
+    crawl(), then the pages that need JavaScript through `pool`
+    (driver_pool.DriverPool): yields (url, record) for every URL, record
+    None only when the browser failed too (or, offline, when the page is
+    not in the cache).
+    """
+    needs_browser = []
+    for url, record in crawl(urls, parse, ready, **options):
+        if record is None:
+            needs_browser.append(url)
+        else:
+            yield url, record
+    if page_cache.offline:
+        yield from ((url, None) for url in needs_browser)
+        return
+    yield from pool.map(lambda driver, url: parse(fetch.browser_page(driver, url, ready)), needs_browser)
@@ -0,0 +1,213 @@
+"""
+Pool of headless Chrome workers for the detail pages that need JavaScript.
+
+Most detail pages are read over HTTP (fetch.py, crawler.py); the few whose
+HTML lacks the expected content go through this pool instead of the
+scraper's single driver. Each of the `size` workers is a thread owning one
+headless Chrome; tasks are taken from a shared queue, so a slow page only
+holds its own worker, and each task runs in a fresh tab that is closed
+afterwards. Before each task the worker checks its driver still answers;
+a driver that does not, or that has served `max_pages` pages, or whose
+Chrome processes use more than `max_memory_mb`, is replaced. Drivers are
+shut down with driver.quit() then kill_process_tree, so no renderer
+outlives the pool.
+
+Chrome starts on the first task, so a run where every page is read over
+HTTP never launches a browser. The default size is capped by the CPU count:
+one loading Chrome keeps about one core busy. Drivers use the lean
+profile of browser_profile.py.
+"""
+import os
+import queue
+import threading
+import psutil
+from selenium.common.exceptions import WebDriverException
+from src.main_pipeline import kill_process_tree
+from src.scrapers.browser_profile import new_driver, block_resources
+
+MAX_SIZE = max(1, os.cpu_count() or 1)
+POOL_SIZE = min(4, MAX_SIZE)
+
+# A driver is replaced after this many pages or above this memory
+MAX_PAGES = 50
+MAX_MEMORY_MB = 1500
+
+
+# ---------------- DRIVERS ----------------
+
+def driver_pid(driver):
+    """pid of the chromedriver process (parent of the Chrome ones), None if unknown."""
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
+
+
+def tree_memory_mb(pid):
+    """RSS of a process and all its children, in MB."""
+    try:
+        parent = psutil.Process(pid)
+        processes = [parent] + parent.children(recursive=True)
+    except psutil.Error:
+        return 0.0
+    total = 0
+    for p in processes:
+        try:
+            total += p.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / 1e6
+
+
+def quit_driver(driver):
+    pid = driver_pid(driver)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    if pid is not None:
+        kill_process_tree(pid)
+
+
+# ---------------- WORKERS ----------------
+
+class Worker:
+    """One thread, one Chrome; replaces its driver when it is unhealthy or worn."""
+
+    def __init__(self, pool, number):
+        self.pool = pool
+        self.number = number
+        self.driver = None
+        self.home = None
+        self.pages = 0
+        self.thread = threading.Thread(target=self.run, name=f"chrome-{number}", daemon=True)
+
+    def start_driver(self):
+        self.driver = self.pool.make_driver()
+        self.home = self.driver.current_window_handle
+        self.pages = 0
+        self.pool.count("started")
+
+    def stop_driver(self):
+        if self.driver is not None:
+            quit_driver(self.driver)
+            self.driver = None
+
+    def healthy(self):
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except WebDriverException:
+            return False
+
+    def worn(self):
+        if self.pages >= self.pool.max_pages:
+            return True
+        pid = driver_pid(self.driver)
+        return pid is not None and tree_memory_mb(pid) > self.pool.max_memory_mb
+
+    def ready_driver(self):
+        """A driver fit for the next task, replaced first if needed."""
+        if self.driver is not None and (self.worn() or not self.healthy()):
+            self.stop_driver()
+            self.pool.count("recycled")
+        if self.driver is None:
+            self.start_driver()
+        return self.driver
+
+    def run_in_tab(self, fn, url):
+        driver = self.ready_driver()
+        driver.switch_to.new_window("tab")
+        try:
+            if self.pool.prepare_tab is not None:
+                self.pool.prepare_tab(driver)
+            return fn(driver, url)
+        finally:
+            self.pages += 1
+            try:
+                driver.close()
+                driver.switch_to.window(self.home)
+            except WebDriverException:
+                pass  # health check before the next task
+
+    def run(self):
+        while True:
+            task = self.pool.tasks.get()
+            if task is None:
+                break
+            fn, url = task
+            result = None
+            for attempt in range(2):  # one retry on a fresh driver if Chrome crashed
+                try:
+                    result = self.run_in_tab(fn, url)
+                    break
+                except WebDriverException as e:
+                    print(f"[pool] chrome-{self.number} {url}: {str(e).splitlines()[0]}")
+                    self.stop_driver()
+                    self.pool.count("crashed")
+                except Exception as e:
+                    print(f"[pool] chrome-{self.number} {url}: {e}")
+                    break
+            self.pool.results.put((url, result))
+        self.stop_driver()
+
+
+class DriverPool:
+    """
+    fn(driver, url) -> record, run for each URL on one of `size` headless
+    Chrome workers:
+
+        with DriverPool() as pool:
+            for url, record in pool.map(scrape_in_browser, urls):
+                ...
+    """
+
+    def __init__(self, size=POOL_SIZE, make_driver=new_driver, prepare_tab=block_resources,
+                 max_pages=MAX_PAGES, max_memory_mb=MAX_MEMORY_MB):
+        self.size = max(1, min(size, MAX_SIZE))
+        self.make_driver = make_driver
+        # run in each new tab before its task (resource blocking is per tab)
+        self.prepare_tab = prepare_tab
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.tasks = queue.Queue()
+        self.results = queue.Queue()
+        self.workers = []
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def count(self, event):
+        with self.lock:
+            self.stats[event] = self.stats.get(event, 0) + 1
+
+    def start(self):
+        if not self.workers:
+            self.workers = [Worker(self, n) for n in range(self.size)]
+            for worker in self.workers:
+                worker.thread.start()
+
+    def map(self, fn, urls):
+        """Yields (url, record) as pages complete; record is None when the page failed."""
+        urls = list(urls)
+        if not urls:
+            return
+        self.start()
+        for url in urls:
+            self.tasks.put((fn, url))
+        for _ in urls:
+            yield self.results.get()
+
+    def close(self):
+        for _ in self.workers:
+            self.tasks.put(None)
+        for worker in self.workers:
+            worker.thread.join(timeout=30)
+            worker.stop_driver()  # worker stuck on a page: its driver is killed anyway
+        self.workers = []
+        if self.stats:
+            print("[pool] " + ", ".join(f"{n} {event}" for event, n in sorted(self.stats.items())))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,44 +1,94 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import os
 import csv
 from datetime import datetime
-from selenium.common.exceptions import NoSuchElementException
+from src.scrapers.fetch import open_list_page, page_from_html, report, in_browser, extract
+from src.scrapers.crawler import crawl_with_browser
+from src.scrapers.driver_pool import DriverPool
+from src.scrapers.browser_profile import new_driver
+from src.scrapers.waits import click_if_present
+from src.scrapers.seen import SeenIndex
+from src.scrapers.frontier import plan_from_args
+from src.scrapers import page_cache
+
+# Chrome n'est lancé qu'à l'exécution du script (voir __main__) : driver pour les
+# pages de liste, pool de Chrome headless pour les pages de détail en JavaScript
+driver = None
+pool = None
+# offres déjà collectées (src/Data/seen), chargées au lancement
+seen = None
+# mode incrémental ou backfill : jusqu'où paginer (voir frontier.py)
+plan = None
 
-options = webdriver.ChromeOptions()
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_argument("--start-maximized")
-options.add_argument("--disable-notifications")
-options.add_experimental_option("excludeSwitches", ["enable-automation", "disable-infobars"])
+BASE_URL = "https://www.emploitunisie.com"
 
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+# Sélecteurs présents quand une page est chargée (attendus au lieu de time.sleep)
+LIST_READY = "div.card.card-job"
+DETAIL_READY = ".job-description"
 
-BASE_URL = "https://www.emploitunisie.com"
+# La bannière de cookies ne s'affiche qu'une fois par session
+cookies_handled = False
 
 
 # ---------------- COOKIE HANDLER ----------------
 
 def deny_cookies():
-    try:
-        time.sleep(1)
-        close_btn = driver.find_element(By.CSS_SELECTOR, "#cookie-consent .close-cookie-consent")
-
-        if close_btn.is_displayed() and close_btn.is_enabled():
-            close_btn.click()
-            print("Cookies denied.")
-            
-    except:
-        pass
+    global cookies_handled
+    if cookies_handled:
+        return
+    cookies_handled = True
+    if click_if_present(driver, "#cookie-consent .close-cookie-consent"):
+        print("Cookies denied.")
 
 
 # ---------------- SCRAPE DETAILS PAGE ----------------
 
-def scrape_details(detail_url):
-    driver.get(detail_url)
-    time.sleep(2)
+# Les mêmes champs que read_details, lus dans Chrome en un seul execute_script
+# (au lieu d'un aller-retour WebDriver par find_element et par .text)
+DETAIL_SCRIPT = r"""
+const details = {
+    sector: null, contract_type: null, location: null, region: null, city: null, salary: null,
+    study_level: null, experience: null, remote: null, description: null, skills: null
+};
+details.description = text(document.querySelector(".job-description"));
+
+// [le critère correspond ?, champ], tous testés comme dans read_details
+const criteria = [
+    [t => t.includes("secteur d´activité") || t.includes("secteur d'activité"), "sector"],
+    [t => t.includes("type de contrat"), "contract_type"],
+    [t => t.startsWith("région"), "region"],
+    [t => t.startsWith("ville"), "city"],
+    [t => t.includes("niveau d'expérience"), "experience"],
+    [t => t.includes("niveau d'études"), "study_level"],
+    [t => t.includes("travail à distance"), "remote"],
+    [t => t.includes("salaire"), "salary"],
+];
+for (const item of document.querySelectorAll("ul.arrow-list > li")) {
+    const t = text(item).toLowerCase();
+    for (const [matches, field] of criteria) {
+        if (matches(t)) details[field] = text(item.querySelector("span"));
+    }
+}
+
+details.skills = Array.from(document.querySelectorAll("ul.skills > li"), text).join(", ");
+return details;
+"""
 
+
+def parse_details(page):
+    """Champs d'une page de détail : un execute_script dans Chrome, sélecteurs lxml pour une page HTTP."""
+    if in_browser(page):
+        return extract(page, DETAIL_SCRIPT)
+    return read_details(page)
+
+
+def details_from_html(html, url=BASE_URL):
+    """Champs d'une page de détail à partir de son HTML seul (fixtures, pages en cache)."""
+    return read_details(page_from_html(html, url))
+
+
+def read_details(page):
+    """Champs d'une page de détail lus élément par élément (fetch.Element, ou le driver)."""
     details = {
         "sector": None,
         "contract_type": None,
@@ -55,21 +105,21 @@ def scrape_details(detail_url):
 
     # ---------- DESCRIPTION ----------
     try:
-        desc_el = driver.find_element(By.CSS_SELECTOR, ".job-description")
+        desc_el = page.find_element(By.CSS_SELECTOR, ".job-description")
         details["description"] = desc_el.text.strip()
     except:
         pass
 
     # ---------- QUALIFICATIONS (optional) ----------
     try:
-        qualif_el = driver.find_element(By.CSS_SELECTOR, ".job-qualifications")
+        qualif_el = page.find_element(By.CSS_SELECTOR, ".job-qualifications")
         # not mandatory but parsed above description anyway
     except:
         pass
 
     # ---------- CRITERIA LIST ----------
     try:
-        criteria_items = driver.find_elements(By.CSS_SELECTOR, "ul.arrow-list > li")
+        criteria_items = page.find_elements(By.CSS_SELECTOR, "ul.arrow-list > li")
 
         for item in criteria_items:
             text = item.text.lower()
@@ -111,7 +161,7 @@ def scrape_details(detail_url):
 
     # ---------- SKILLS ----------
     try:
-        skills = driver.find_elements(By.CSS_SELECTOR, "ul.skills > li")
+        skills = page.find_elements(By.CSS_SELECTOR, "ul.skills > li")
         details["skills"] = ", ".join([s.text for s in skills])
     except:
         pass
@@ -122,12 +172,16 @@ def scrape_details(detail_url):
 # ---------------- SCRAPE LIST PAGE ----------------
 
 def scrape_page(url):
-    driver.get(url)
-    
-    deny_cookies()
+    # copie en cache si elle est récente (ou hors ligne), sinon chargée dans Chrome
+    page = open_list_page(driver, url, LIST_READY)
+    if page is None:
+        print("List page not in the cache.")
+        return []
+    if page is driver:
+        deny_cookies()
     job_listings = []
 
-    jobs = driver.find_elements(By.CSS_SELECTOR, "div.card.card-job")
+    jobs = page.find_elements(By.CSS_SELECTOR, "div.card.card-job")
     print("Jobs found on page:", len(jobs))
 
     for job in jobs:
@@ -155,7 +209,11 @@ csvfilePath = 'src/Data/rawData/job_emploisTunisie.csv'
 def scrape_all_pages():
     base_url = "https://www.emploitunisie.com/recherche-jobs-tunisie"
     
-    with open(csvfilePath, 'w', newline='', encoding='utf-8') as csvfile:
+    # ajout en fin de fichier : les lignes d'un passage non encore nettoyé
+    # restent (leurs clés sont déjà dans l'index des offres vues)
+    os.makedirs(os.path.dirname(csvfilePath), exist_ok=True)
+    file_empty = not os.path.exists(csvfilePath) or os.path.getsize(csvfilePath) == 0
+    with open(csvfilePath, 'a', newline='', encoding='utf-8') as csvfile:
         #source et scraped_at dans les fieldnames
         fieldnames = [
             "title", "detail_link", "company", "date_publication",
@@ -166,20 +224,34 @@ def scrape_all_pages():
         ]
 
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        if file_empty:
+            writer.writeheader()
         page = 1
         
-        while page <= 1:
+        while True:
             print(f"Scraping page {page}...")
-            job_listings = scrape_page(base_url)
+            # la page n est ?page=n-1 (la première n'a pas de paramètre)
+            job_listings = scrape_page(base_url if page == 1 else f"{base_url}?page={page - 1}")
 
             if not job_listings:
                 print("No more jobs found. Exiting.")
+                plan.exhausted()
                 break
 
-            for job in job_listings:
+            # offres déjà collectées : ni page de détail ni ligne CSV
+            listed = len(job_listings)
+            job_listings = seen.unseen(job_listings, link=lambda job: job["detail_link"])
+
+            # pages de détail en parallèle, chaque offre écrite dès que sa page est lue
+            jobs_by_link = {job["detail_link"]: job for job in job_listings}
+            # celles qui ont besoin de JavaScript passent ensuite par le pool de Chrome
+            for link, details in crawl_with_browser(jobs_by_link, parse_details, DETAIL_READY, pool):
+                job = jobs_by_link[link]
                 print(f"Scraping details for: {job['title']}")
-                details = scrape_details(job["detail_link"])
+                if details is None:
+                    # page de détail illisible : pas de ligne, l'offre sera relue au prochain passage
+                    print(f"No details for: {link}, skipped")
+                    continue
                 job.update(details)
                 
                 # source et scraped_at avant d'écrire
@@ -187,9 +259,27 @@ def scrape_all_pages():
                 job["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
                 writer.writerow(job)
+                # ligne sur le disque avant la clé : le pipeline tue le scraper à la fin du temps imparti
+                csvfile.flush()
+                seen.add(link)
 
-            page += 1
-            base_url = base_url + f"?page={page-1}"
+            # pages triées des plus récentes aux plus anciennes : arrêt à la frontière connue
+            page = plan.next_page(page, listed, listed - len(job_listings))
+            if page is None:
+                break
 
-scrape_all_pages()
-driver.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    plan = plan_from_args("emploitunisie")
+    # hors ligne : pages du cache seulement, ni Chrome ni index des offres vues
+    driver = None if page_cache.offline else new_driver()
+    pool = DriverPool()
+    seen = SeenIndex("emploitunisie", enabled=not page_cache.offline)
+    try:
+        scrape_all_pages()
+        report()
+        seen.report()
+    finally:
+        seen.close()
+        pool.close()
+        if driver is not None:
+            driver.quit()
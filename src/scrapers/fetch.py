@@ -0,0 +1,353 @@
+"""
+HTTP-first page fetching shared by the scrapers.
+
+The detail pages of the three sites are server-rendered, so they are
+downloaded with one pooled requests.Session (keep-alive, gzip) and parsed
+with lxml instead of being loaded in Chrome. The parsed page answers the
+subset of the WebDriver API the scrapers use (find_element / find_elements
+by CSS selector, XPath, tag name or id, .text, .get_attribute), so the same
+selectors and extraction code read both. A page only goes through the
+browser when the download fails or the selector the parser waits for is
+missing from the HTML (content rendered by JavaScript, anti-bot page...).
+Pages that do go through the browser are read with one execute_script call
+per page (extract), not one WebDriver command per element and per .text.
+Downloaded and rendered pages go through the on-disk cache of
+page_cache.py when the scraper turned it on.
+"""
+import re
+import threading
+from functools import lru_cache
+from collections import Counter
+from urllib.parse import urlsplit
+import requests
+import lxml.html
+from lxml.cssselect import CSSSelector
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+from src.scrapers import waits, page_cache
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36")
+
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# (connect, read) seconds
+TIMEOUT = (5, 15)
+
+# Keep-alive connections kept per host
+POOL_SIZE = 8
+
+# After this many browser fallbacks in a row on one host, its pages are no
+# longer tried over HTTP (the site needs JavaScript everywhere)
+MAX_MISSES = 5
+
+# Pages opened per host and per way ("http" or "browser")
+stats = Counter()
+_misses = Counter()
+# browser_page runs in the driver pool threads
+_stats_lock = threading.Lock()
+
+
+# ---------------- HTTP CLIENT ----------------
+
+@lru_cache(maxsize=None)
+def http_session(retries=2, pool_size=POOL_SIZE):
+    """
+    Session shared by all the pages of the process, created on first use.
+    `retries`: blocking urllib3 retries on 429/5xx (the crawler passes 0 and
+    retries itself without holding a thread).
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    retries = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def parse_html(content, url, encoding=None):
+    """lxml document of a page, links made absolute as the browser reports them."""
+    parser = lxml.html.HTMLParser(encoding=encoding)
+    root = lxml.html.fromstring(content, base_url=url, parser=parser)
+    root.make_links_absolute(url, handle_failures="ignore")
+    return root
+
+
+# Headers cached with the HTML of a page rendered in Chrome
+RENDERED_HEADERS = {"Content-Type": "text/html; charset=utf-8"}
+
+
+def page_from_response(response):
+    """Parsed page of an HTML 200 response, None for anything else."""
+    content_type = response.headers.get("Content-Type", "")
+    if response.status_code != 200 or "html" not in content_type:
+        return None
+    # without a charset in the header, lxml reads the <meta> one
+    encoding = response.encoding if "charset" in content_type.lower() else None
+    return Element(parse_html(response.content, response.url, encoding))
+
+
+def page_from_html(html, url):
+    """Parsed page of an HTML document (str or bytes) served at url."""
+    return Element(parse_html(html, url))
+
+
+def cached_page(entry):
+    """Parsed page of a page_cache entry."""
+    content_type = entry["headers"].get("Content-Type", "")
+    encoding = None
+    if "charset" in content_type.lower():
+        encoding = requests.utils.get_encoding_from_headers({"content-type": content_type})
+    return Element(parse_html(page_cache.body(entry), entry["base"], encoding))
+
+
+def from_cache(url, kind):
+    """
+    (page, entry): the cached page when it can be read without the network
+    (fresh, or offline mode), else None and the entry to revalidate (None
+    when url is not cached).
+    """
+    entry = page_cache.lookup(url)
+    if page_cache.usable(entry, kind):
+        page_cache.count(kind, "cached")
+        return cached_page(entry), entry
+    if page_cache.offline:
+        page_cache.count(kind, "missing")
+    return None, entry
+
+
+def response_page(url, kind, response, entry=None):
+    """
+    Page of the response to a (conditional) request: the cached one on a
+    304, else parsed from the response and cached when it is an HTML 200.
+    """
+    if response.status_code == 304 and entry is not None:
+        page_cache.count(kind, "revalidated")
+        return cached_page(page_cache.revalidated(entry))
+    page = page_from_response(response)
+    if page is not None and page_cache.store(url, kind, response.content, response.headers, response.url):
+        page_cache.count(kind, "downloaded")
+    return page
+
+
+def fetch_page(url, kind="detail"):
+    """Page downloaded (or read from the cache) and parsed, None if it could not be."""
+    page, entry = from_cache(url, kind)
+    if page is not None or page_cache.offline:
+        return page
+    try:
+        response = http_session().get(url, headers=page_cache.validators(entry), timeout=TIMEOUT)
+    except requests.RequestException as e:
+        print(f"[fetch] {url}: {e}")
+        return None
+    return response_page(url, kind, response, entry)
+
+
+# ---------------- LXML ELEMENTS ----------------
+
+# Elements rendered on their own line(s) by the browser's .text
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4",
+    "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "table", "tr", "ul",
+}
+
+# Source whitespace, rendered as one space (line breaks only come from blocks)
+WHITESPACE = re.compile(r"\s+")
+
+# Never rendered as text
+HIDDEN_TAGS = {"script", "style", "noscript", "template", "head", "title"}
+
+
+def _hidden(node):
+    style = (node.get("style") or "").replace(" ", "").lower()
+    return node.tag in HIDDEN_TAGS or node.get("hidden") is not None or "display:none" in style
+
+
+def element_text(node):
+    """
+    Visible text of an element as WebElement.text gives it: block elements
+    on their own lines, whitespace collapsed, empty lines dropped.
+    """
+    parts = []
+
+    def walk(el):
+        if not isinstance(el.tag, str) or _hidden(el):  # comments, hidden elements
+            return
+        block = el.tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        if el.text:
+            parts.append(WHITESPACE.sub(" ", el.text))
+        for child in el:
+            walk(child)
+            if child.tail:
+                parts.append(WHITESPACE.sub(" ", child.tail))
+        if block:
+            parts.append("\n")
+
+    walk(node)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+@lru_cache(maxsize=256)
+def _css(selector):
+    return CSSSelector(selector)
+
+
+def select(node, by, value):
+    """Descendants of node matching a WebDriver locator."""
+    if by == By.CSS_SELECTOR:
+        found = _css(value)(node)
+    elif by == By.XPATH:
+        found = node.xpath(value)
+    elif by == By.TAG_NAME:
+        found = node.iterdescendants(value)
+    elif by == By.ID:
+        found = node.xpath(".//*[@id=$id]", id=value)
+    elif by == By.CLASS_NAME:
+        found = _css("." + value)(node)
+    else:
+        raise ValueError(f"unsupported locator: {by}")
+    return [el for el in found if el is not node and isinstance(el, lxml.html.HtmlElement)]
+
+
+class Element:
+    """lxml element read through the WebElement methods the scrapers call."""
+
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def text(self):
+        return element_text(self.node)
+
+    def get_attribute(self, name):
+        return self.node.get(name)
+
+    def find_elements(self, by=By.ID, value=None):
+        return [Element(el) for el in select(self.node, by, value)]
+
+    def find_element(self, by=By.ID, value=None):
+        found = select(self.node, by, value)
+        if not found:
+            raise NoSuchElementException(f"no element for {by}={value!r}")
+        return Element(found[0])
+
+
+# ---------------- IN-BROWSER EXTRACTION ----------------
+
+# Prepended to the sites' extraction scripts. text(el): visible text of el,
+# trimmed as WebElement.text gives it, null when el is missing
+SCRIPT_HELPERS = r"""
+const text = el => el ? el.innerText.trim() : null;
+const xpath = expr => document.evaluate(
+    expr, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+"""
+
+
+def in_browser(page):
+    """True when `page` is the driver (page loaded in Chrome), False for an Element parsed over HTTP."""
+    return not isinstance(page, Element)
+
+
+def extract(driver, script):
+    """
+    Runs a site's extraction script in the loaded page and returns the dict
+    it builds: every field of the page in a single WebDriver round trip.
+    """
+    return driver.execute_script(SCRIPT_HELPERS + script)
+
+
+# ---------------- HTTP FIRST, BROWSER FALLBACK ----------------
+
+def http_enabled(host):
+    return _misses[host] < MAX_MISSES
+
+
+def is_ready(page, ready):
+    """True when a page fetched over HTTP has the `ready` CSS selector."""
+    return page is not None and bool(page.find_elements(By.CSS_SELECTOR, ready))
+
+
+def count_http(url, ok):
+    """Counts a page read over HTTP, or one that needs the browser instead."""
+    host = urlsplit(url).netloc
+    if ok:
+        _misses[host] = 0
+        stats[host, "http"] += 1
+        return
+    _misses[host] += 1
+    if _misses[host] == MAX_MISSES:
+        print(f"[fetch] {host}: {MAX_MISSES} pages in a row need the browser, HTTP disabled")
+
+
+def store_rendered(driver, url, kind):
+    """Caches the HTML of the page loaded in `driver`, as rendered by its scripts."""
+    if page_cache.enabled and page_cache.store(url, kind, driver.page_source.encode("utf-8"),
+                                               RENDERED_HEADERS, driver.current_url):
+        page_cache.count(kind, "rendered")
+
+
+def browser_page(driver, url, ready):
+    """Loads url in `driver`, waits for the `ready` CSS selector and returns the driver."""
+    waits.load(driver, url, ready, kind="detail")
+    store_rendered(driver, url, "detail")
+    with _stats_lock:
+        stats[urlsplit(url).netloc, "browser"] += 1
+    return driver
+
+
+def open_page(driver, url, ready):
+    """
+    Page to read with find_element(s): parsed over HTTP when the `ready`
+    CSS selector is in the downloaded HTML, else loaded in `driver` until
+    the selector shows up (the driver itself is returned). Offline, None
+    when the page is not in the cache.
+    """
+    if http_enabled(urlsplit(url).netloc):
+        page = fetch_page(url)
+        ok = is_ready(page, ready)
+        count_http(url, ok)
+        if ok:
+            return page
+    if page_cache.offline:
+        return None
+    return browser_page(driver, url, ready)
+
+
+def open_list_page(driver, url, ready):
+    """
+    List page to read with find_element(s): the cached copy when it is
+    fresh (or offline: None when there is none), else loaded in `driver`
+    until the `ready` CSS selector shows up, cached, and the driver itself
+    returned (`page is driver` tells the two apart).
+    """
+    page, _ = from_cache(url, "list")
+    if page is not None and (page_cache.offline or is_ready(page, ready)):
+        return page
+    if page_cache.offline:
+        return None
+    waits.load(driver, url, ready, kind="list")
+    store_rendered(driver, url, "list")
+    return driver
+
+
+def report():
+    """One line per host: pages parsed over HTTP vs loaded in the browser, then the browser waits."""
+    for host in sorted({h for h, _ in stats}):
+        http, browser = stats[host, "http"], stats[host, "browser"]
+        print(f"[fetch] {host}: {http} pages over HTTP, {browser} in the browser")
+    waits.report()
+    page_cache.report()
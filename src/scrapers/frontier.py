@@ -0,0 +1,169 @@
+"""
+How deep a scraper paginates: incremental runs stop at the known frontier.
+
+The list pages of the three sites are sorted newest first, so once most of
+the listings of a page are already collected (seen.py), the following
+pages only hold older offers. Two modes:
+
+  - incremental (default): stop after the first list page whose share of
+    known listings reaches `threshold`, or after INCREMENTAL_PAGES pages;
+  - backfill: ignore the frontier and go on to BACKFILL_PAGES pages or the
+    last page of the site, to catch what incremental runs missed (runs
+    stopped early, offers pushed down between two runs).
+
+A backfill runs on its own every BACKFILL_EVERY. The schedule is kept in
+src/Data/seen/<source>.backfill: the date of the last complete backfill,
+and the list page an unfinished one reached. The first run is incremental
+and only starts the schedule, so the first backfill comes BACKFILL_EVERY
+later. The pipeline's time limit cuts long backfills short: the next run
+is a backfill again, which reads the newest pages up to the frontier and
+then jumps to the page reached, so the backfill goes on where it stopped
+without leaving the new offers for later. An offline run (page cache
+only) never touches the schedule.
+
+The scrapers take --mode, --threshold and --max-pages, and --offline /
+--no-cache for the page cache (page_cache.py, on by default):
+
+    python -m src.scrapers.keejobs --mode backfill
+"""
+import os
+import json
+import argparse
+from datetime import datetime, timedelta
+from src.scrapers.seen import SEEN_DIR
+from src.scrapers import page_cache
+
+MODES = ("incremental", "backfill")
+
+# Share of known listings on a list page that marks the frontier
+KNOWN_THRESHOLD = 0.8
+
+# Most list pages read per run (incremental: also the first run, index empty)
+INCREMENTAL_PAGES = 10
+BACKFILL_PAGES = 100
+
+BACKFILL_EVERY = timedelta(days=7)
+
+
+def backfill_path(source):
+    return os.path.join(SEEN_DIR, f"{source}.backfill")
+
+
+def load_schedule(source):
+    """
+    {"since": date of the last complete backfill (or of the first run),
+    "page": list page an unfinished backfill reached, or None}; None when
+    the source never ran.
+    """
+    try:
+        with open(backfill_path(source), encoding="utf-8") as f:
+            content = f.read().strip()
+    except OSError:
+        return None
+    try:
+        schedule = json.loads(content)
+        return {"since": datetime.fromisoformat(schedule["since"]), "page": schedule.get("page")}
+    except (ValueError, KeyError, TypeError):
+        pass
+    # older files hold the date alone
+    try:
+        return {"since": datetime.fromisoformat(content), "page": None}
+    except ValueError:
+        return None
+
+
+def save_schedule(source, since, page=None):
+    if page_cache.offline:
+        return
+    os.makedirs(SEEN_DIR, exist_ok=True)
+    tmp = backfill_path(source) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"since": since.isoformat(timespec="seconds"), "page": page}, f)
+    os.replace(tmp, backfill_path(source))
+
+
+def backfill_due(schedule, now=None):
+    """Whether a run is a backfill: one is unfinished, or the last one is BACKFILL_EVERY old."""
+    if schedule is None:
+        return False
+    return schedule["page"] is not None or (now or datetime.now()) - schedule["since"] >= BACKFILL_EVERY
+
+
+class CrawlPlan:
+    """
+    Pagination of one scraper run; after each list page:
+
+        page = plan.next_page(page, listed, known)
+        if page is None:
+            break
+    """
+
+    def __init__(self, source, mode=None, threshold=KNOWN_THRESHOLD, max_pages=None):
+        if mode is not None and mode not in MODES:
+            raise ValueError(f"unknown crawl mode: {mode!r}")
+        self.source = source
+        self.schedule = load_schedule(source)
+        if self.schedule is None:
+            # first run: incremental, the first backfill is due BACKFILL_EVERY later
+            self.schedule = {"since": datetime.now().replace(microsecond=0), "page": None}
+            save_schedule(source, self.schedule["since"])
+        self.mode = mode or ("backfill" if backfill_due(self.schedule) else "incremental")
+        self.threshold = threshold
+        self.max_pages = max_pages or (BACKFILL_PAGES if self.mode == "backfill" else INCREMENTAL_PAGES)
+        # page an unfinished backfill reached, jumped to once the newest pages are known
+        self.resume = self.schedule["page"] if self.mode == "backfill" else None
+        resume = f", resuming at page {self.resume}" if self.resume else ""
+        print(f"[frontier] {source}: {self.mode} crawl, up to {self.max_pages} list pages{resume}")
+
+    def next_page(self, page, listed, known):
+        """
+        List page to read after `page`, which had `listed` listings of
+        which `known` were already collected; None to stop.
+        """
+        if listed == 0:
+            self.exhausted()
+            return None
+        frontier = known / listed >= self.threshold
+        if self.mode == "incremental" and frontier:
+            print(f"[frontier] {self.source}: page {page} is {known}/{listed} known, frontier reached")
+            return None
+        if self.mode == "backfill":
+            if self.resume and page < self.resume:
+                if frontier:
+                    print(f"[frontier] {self.source}: page {page} is {known}/{listed} known, "
+                          f"backfill resumed at page {self.resume}")
+                    return self.resume
+            else:
+                save_schedule(self.source, self.schedule["since"], page)
+        if page >= self.max_pages:
+            print(f"[frontier] {self.source}: stopped at the {self.max_pages} pages limit")
+            if self.mode == "backfill":
+                self.complete()
+            return None
+        return page + 1
+
+    def exhausted(self):
+        """The site has no more list pages."""
+        if self.mode == "backfill":
+            self.complete()
+
+    def complete(self):
+        if page_cache.offline:
+            return
+        save_schedule(self.source, datetime.now())
+        print(f"[frontier] {self.source}: backfill complete")
+
+
+def plan_from_args(source, argv=None):
+    """CrawlPlan of a scraper run from its command line, which also configures the page cache."""
+    parser = argparse.ArgumentParser(description=f"Scrape {source} job offers.")
+    parser.add_argument("--mode", choices=MODES, default=None,
+                        help="incremental or backfill (default: backfill when one is due or unfinished)")
+    parser.add_argument("--threshold", type=float, default=KNOWN_THRESHOLD,
+                        help="share of known listings on a list page that stops an incremental crawl")
+    parser.add_argument("--max-pages", type=int, default=None, help="most list pages read")
+    parser.add_argument("--offline", action="store_true", help="read pages from the page cache only")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the page cache")
+    args = parser.parse_args(argv)
+    page_cache.configure(not args.no_cache, args.offline)
+    return CrawlPlan(source, args.mode, args.threshold, args.max_pages)
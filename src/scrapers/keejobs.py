@@ -1,43 +1,97 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
+import os
 import csv
-from selenium.common.exceptions import NoSuchElementException
 from datetime import datetime
+from src.scrapers.fetch import open_list_page, page_from_html, report, in_browser, extract
+from src.scrapers.crawler import crawl_with_browser
+from src.scrapers.driver_pool import DriverPool
+from src.scrapers.browser_profile import new_driver
+from src.scrapers.waits import click_if_present
+from src.scrapers.seen import SeenIndex
+from src.scrapers.frontier import plan_from_args
+from src.scrapers import page_cache
+
+# Chrome n'est lancé qu'à l'exécution du script (voir __main__) : driver pour les
+# pages de liste, pool de Chrome headless pour les pages de détail en JavaScript
+driver = None
+pool = None
+# offres déjà collectées (src/Data/seen), chargées au lancement
+seen = None
+# mode incrémental ou backfill : jusqu'où paginer (voir frontier.py)
+plan = None
 
-options = webdriver.ChromeOptions()
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_argument("--start-maximized")
-options.add_argument("--disable-notifications")
-options.add_experimental_option("excludeSwitches", ["enable-automation", "disable-infobars"])
+BASE_URL = "https://www.keejob.com"
 
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+# Sélecteurs présents quand une page est chargée (attendus au lieu de time.sleep)
+LIST_READY = "article"
+DETAIL_READY = "div.prose"
 
-BASE_URL = "https://www.keejob.com"
+# La bannière de cookies ne s'affiche qu'une fois par session
+cookies_handled = False
 
 
 # ---------------- COOKIE HANDLER ----------------
 
 def accept_cookies():
-    try:
-        time.sleep(1)
-        accept_btn = driver.find_element(By.ID, "cookieAccept")
-        if accept_btn.is_displayed() and accept_btn.is_enabled():
-            accept_btn.click()
-            print("Cookies accepted.")
-            time.sleep(1)
-    except:
-        pass
+    global cookies_handled
+    if cookies_handled:
+        return
+    cookies_handled = True
+    if click_if_present(driver, "#cookieAccept"):
+        print("Cookies accepted.")
 
 
 # ---------------- SCRAPE DETAILS PAGE ----------------
 
-def scrape_details(detail_url):
-    driver.get(detail_url)
-    time.sleep(2)
-
+# Les mêmes champs que read_details, lus dans Chrome en un seul execute_script
+# (au lieu d'un aller-retour WebDriver par find_element et par .text)
+DETAIL_SCRIPT = r"""
+const details = {
+    sector: null, contract_type: null, date_publication: null, location: null, salary: null,
+    study_level: null, experience: null, availability: null, description: null
+};
+const sector = text(xpath("//p[span[contains(.,'Secteur')]]"));
+if (sector !== null) details.sector = sector.replaceAll("Secteur:", "").trim();
+
+// [libellé, balise de la valeur, champ] ; les valeurs en <span> ont leurs espaces réduits
+const labels = [
+    ["Date de publication", "p", "date_publication"],
+    ["Type de contrat", "span", "contract_type"],
+    ["Lieu de travail", "p", "location"],
+    ["Expérience requise", "p", "experience"],
+    ["Niveau d'études", "p", "study_level"],
+    ["Salaire proposé", "span", "salary"],
+    ["Disponibilité", "p", "availability"],
+];
+for (const block of document.querySelectorAll("div.p-6.space-y-4 > div")) {
+    const label = text(block.querySelector("h3"));
+    if (label === null) continue;
+    const match = labels.find(([name]) => label.includes(name));
+    if (!match) continue;
+    const [, tag, field] = match;
+    const value = text(block.querySelector(tag));
+    if (value !== null) details[field] = tag === "span" ? value.split(/\s+/).join(" ") : value;
+}
+
+details.description = text(document.querySelector("div.prose"));
+return details;
+"""
+
+
+def parse_details(page):
+    """Champs d'une page de détail : un execute_script dans Chrome, sélecteurs lxml pour une page HTTP."""
+    if in_browser(page):
+        return extract(page, DETAIL_SCRIPT)
+    return read_details(page)
+
+
+def details_from_html(html, url=BASE_URL):
+    """Champs d'une page de détail à partir de son HTML seul (fixtures, pages en cache)."""
+    return read_details(page_from_html(html, url))
+
+
+def read_details(page):
+    """Champs d'une page de détail lus élément par élément (fetch.Element, ou le driver)."""
     details = {
         "sector": None,
         "contract_type": None,
@@ -52,14 +106,14 @@ def scrape_details(detail_url):
 
     # --- Sector (dans la carte entreprise) ---
     try:
-        sector_el = driver.find_element(By.XPATH, "//p[span[contains(.,'Secteur')]]")
+        sector_el = page.find_element(By.XPATH, "//p[span[contains(.,'Secteur')]]")
         details["sector"] = sector_el.text.replace("Secteur:", "").strip()
     except:
         pass
 
     # --- Bloc infos (référence, date, contrat, lieu, etc.) ---
     try:
-        info_blocks = driver.find_elements(By.CSS_SELECTOR, "div.p-6.space-y-4 > div")
+        info_blocks = page.find_elements(By.CSS_SELECTOR, "div.p-6.space-y-4 > div")
 
         for block in info_blocks:
             try:
@@ -105,7 +159,7 @@ def scrape_details(detail_url):
 
     # --- Description ---
     try:
-        desc_el = driver.find_element(By.CSS_SELECTOR, "div.prose")
+        desc_el = page.find_element(By.CSS_SELECTOR, "div.prose")
         details["description"] = desc_el.text.strip()
     except:
         pass
@@ -116,13 +170,17 @@ def scrape_details(detail_url):
 # ---------------- SCRAPE LIST PAGE ----------------
 
 def scrape_page(url):
-    driver.get(url)
-    time.sleep(3)
-    accept_cookies()
+    # copie en cache si elle est récente (ou hors ligne), sinon chargée dans Chrome
+    page = open_list_page(driver, url, LIST_READY)
+    if page is None:
+        print("List page not in the cache.")
+        return []
+    if page is driver:
+        accept_cookies()
 
     job_listings = []
 
-    jobs = driver.find_elements(By.CSS_SELECTOR, "article")
+    jobs = page.find_elements(By.CSS_SELECTOR, "article")
     print("Jobs found on page:", len(jobs))
 
     for job in jobs:
@@ -147,7 +205,11 @@ def scrape_all_pages():
     base_url = "https://www.keejob.com/offres-emploi/?page="
     page = 1
 
-    with open(csvfilePath, 'w', newline='', encoding='utf-8') as csvfile:
+    # ajout en fin de fichier : les lignes d'un passage non encore nettoyé
+    # restent (leurs clés sont déjà dans l'index des offres vues)
+    os.makedirs(os.path.dirname(csvfilePath), exist_ok=True)
+    file_empty = not os.path.exists(csvfilePath) or os.path.getsize(csvfilePath) == 0
+    with open(csvfilePath, 'a', newline='', encoding='utf-8') as csvfile:
         fieldnames = [
             "title", "detail_link",
             "sector", "contract_type", "date_publication",
@@ -157,30 +219,61 @@ def scrape_all_pages():
         ]
 
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        if file_empty:
+            writer.writeheader()
 
-        while page<=3 :
+        while True:
             url = base_url + str(page)
             print(f"Scraping page {page}...")
             job_listings = scrape_page(url)
 
             if not job_listings:
                 print("No more jobs found. Exiting.")
+                plan.exhausted()
                 break
 
-            for job in job_listings:
+            # offres déjà collectées : ni page de détail ni ligne CSV
+            listed = len(job_listings)
+            job_listings = seen.unseen(job_listings, link=lambda job: job["detail_link"])
+
+            # pages de détail en parallèle, chaque offre écrite dès que sa page est lue
+            jobs_by_link = {job["detail_link"]: job for job in job_listings}
+            # celles qui ont besoin de JavaScript passent ensuite par le pool de Chrome
+            for link, details in crawl_with_browser(jobs_by_link, parse_details, DETAIL_READY, pool):
+                job = jobs_by_link[link]
                 print(f"   Scraping details for: {job['title']}")
-                details = scrape_details(job["detail_link"])
+                if details is None:
+                    # page de détail illisible : pas de ligne, l'offre sera relue au prochain passage
+                    print(f"   No details for: {link}, skipped")
+                    continue
                 job.update(details)
                 
                 # on ajoute source et scraped_at timestamp
                 job["source"] ="keejob"
                 job["scraped_at"]=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 writer.writerow(job)
+                # ligne sur le disque avant la clé : le pipeline tue le scraper à la fin du temps imparti
+                csvfile.flush()
+                seen.add(link)
 
-            
-            page += 1
-            
+            # pages triées des plus récentes aux plus anciennes : arrêt à la frontière connue
+            page = plan.next_page(page, listed, listed - len(job_listings))
+            if page is None:
+                break
+
+if __name__ == "__main__":
+    plan = plan_from_args("keejob")
+    # hors ligne : pages du cache seulement, ni Chrome ni index des offres vues
+    driver = None if page_cache.offline else new_driver()
+    pool = DriverPool()
+    seen = SeenIndex("keejob", enabled=not page_cache.offline)
+    try:
+        scrape_all_pages()
+        report()
+        seen.report()
+    finally:
+        seen.close()
+        pool.close()
+        if driver is not None:
+            driver.quit()
 
-scrape_all_pages()
-driver.quit()
@@ -1,12 +1,15 @@
-import time
 import csv
 import os
 import sys
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from datetime import datetime
+from src.scrapers.fetch import open_page, open_list_page, page_from_html, report, in_browser, extract
+from src.scrapers.crawler import crawl_with_browser
+from src.scrapers.driver_pool import DriverPool
+from src.scrapers.browser_profile import new_driver
+from src.scrapers.seen import SeenIndex
+from src.scrapers.frontier import plan_from_args
+from src.scrapers import page_cache
 
 # try to force stdout to utf-8 so prints with unicode don't raise on Windows
 if hasattr(sys.stdout, "reconfigure"):
@@ -15,13 +18,21 @@ if hasattr(sys.stdout, "reconfigure"):
     except Exception:
         pass
 
-options = webdriver.ChromeOptions()
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_argument("--start-maximized")
-
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+# Chrome is only started when the script runs (see __main__): one driver for
+# the list pages, a pool of headless ones for detail pages that need JavaScript
+driver = None
+pool = None
+# offers already collected (src/Data/seen), loaded at startup
+seen = None
+# incremental or backfill: how deep to paginate (see frontier.py)
+plan = None
 
 BASE_URL = "https://www.optioncarriere.tn"
+LIST_URL = f"{BASE_URL}/emploi?s=&l=Tunisie&nw=1"
+
+# Selectors present once a page is loaded (waited for instead of time.sleep)
+LIST_READY = "ul.jobs > li article.job"
+DETAIL_READY = "article#job"
 
 CSV_FILE = 'src/Data/rawData/jobs_optioncarriere.csv'
 RAW_COLUMNS = [
@@ -65,100 +76,163 @@ def save_to_csv(job):
         writer.writerow(row)
     print(f"[save_to_csv] appended title='{row.get('title','')}'")
 
-def scrape_detail_page(url):
+# The fields of read_detail_page, read in Chrome with a single execute_script
+# (instead of one WebDriver round trip per find_element and per .text)
+DETAIL_SCRIPT = r"""
+const job = selector => text(document.querySelector("article#job " + selector)) ?? "";
+const items = Array.from(document.querySelectorAll("article#job ul.details li"), text);
+return {
+    title: job("h1"),
+    company: job("p.company"),
+    location: items[0] ?? "",
+    contract: items[1] ?? "",
+    work_type: items[2] ?? "",
+    posted_relative: text(document.querySelector(".badge-icon")) ?? "",
+    raw_content: (text(document.querySelector("section.content")) ?? "").replaceAll("\n", " ").trim(),
+};
+"""
+
+def parse_detail_page(page):
+    """Fields of a detail page: one execute_script in Chrome, lxml selectors for a page read over HTTP"""
+    if in_browser(page):
+        return extract(page, DETAIL_SCRIPT)
+    return read_detail_page(page)
+
+def detail_from_html(html, url=BASE_URL):
+    """Fields of a detail page from its HTML alone (fixtures, cached pages)"""
+    return read_detail_page(page_from_html(html, url))
+
+def read_detail_page(page):
+    """Fields of a detail page read element by element (fetch.Element, or the driver)"""
+    data = {}
+
     try:
-        driver.get(url)
-        time.sleep(2)
+        data["title"] = page.find_element(By.CSS_SELECTOR, "article#job h1").text
+    except:
+        data["title"] = ""
 
-        data = {"detail_link": url}
+    try:
+        data["company"] = page.find_element(By.CSS_SELECTOR, "article#job p.company").text
+    except:
+        data["company"] = ""
 
-        try:
-            data["title"] = driver.find_element(By.CSS_SELECTOR, "article#job h1").text
-        except:
-            data["title"] = ""
+    try:
+        items = page.find_elements(By.CSS_SELECTOR, "article#job ul.details li")
+        data["location"] = items[0].text if len(items) > 0 else ""
+        data["contract"] = items[1].text if len(items) > 1 else ""
+        data["work_type"] = items[2].text if len(items) > 2 else ""
+    except:
+        data["location"] = ""
+        data["contract"] = ""
+        data["work_type"] = ""
 
-        try:
-            data["company"] = driver.find_element(By.CSS_SELECTOR, "article#job p.company").text
-        except:
-            data["company"] = ""
+    try:
+        data["posted_relative"] = page.find_element(By.CSS_SELECTOR, ".badge-icon").text
+    except:
+        data["posted_relative"] = ""
 
-        try:
-            items = driver.find_elements(By.CSS_SELECTOR, "article#job ul.details li")
-            data["location"] = items[0].text if len(items) > 0 else ""
-            data["contract"] = items[1].text if len(items) > 1 else ""
-            data["work_type"] = items[2].text if len(items) > 2 else ""
-        except:
-            data["location"] = ""
-            data["contract"] = ""
-            data["work_type"] = ""
+    try:
+        section = page.find_element(By.CSS_SELECTOR, "section.content")
+        data["raw_content"] = section.text.replace("\n", " ").strip()
+    except:
+        data["raw_content"] = ""
 
-        try:
-            data["posted_relative"] = driver.find_element(By.CSS_SELECTOR, ".badge-icon").text
-        except:
-            data["posted_relative"] = ""
+    return data
 
-        try:
-            section = driver.find_element(By.CSS_SELECTOR, "section.content")
-            data["raw_content"] = section.text.replace("\n", " ").strip()
-        except:
-            data["raw_content"] = ""
+def save_detail(url, data):
+    """Complete a parsed detail page and append it to the CSV"""
+    data["detail_link"] = url
+    data["source"] = "optioncarriere"
+    data["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        data["source"] = "optioncarriere"
-        data["scraped_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # safe print (stdout reconfigured to utf-8 above)
+    print("[scrape_detail_page] extracted:", data.get("title", "")[:100])
 
-        # safe print (stdout reconfigured to utf-8 above)
-        print("[scrape_detail_page] extracted:", data.get("title", "")[:100])
+    save_to_csv(data)
+    return data
 
-        save_to_csv(data)
-        return data
+def scrape_detail_page(url):
+    try:
+        # HTTP first; Chrome only when the offer is not in the downloaded HTML
+        page = open_page(driver, url, ready=DETAIL_READY)
+        return save_detail(url, parse_detail_page(page))
     except Exception as e:
         print("[scrape_detail_page] error:", str(e))
         return None
 
-def scrape_page():
-    jobs = driver.find_elements(By.CSS_SELECTOR, "ul.jobs > li article.job")
+def scrape_page(page):
+    """Reads the new offers of a list page (cached copy or the driver); returns (listings, already known)"""
+    jobs = page.find_elements(By.CSS_SELECTOR, "ul.jobs > li article.job")
     print(f"[scrape_page] found {len(jobs)} jobs on page")
-    for idx, job in enumerate(jobs, start=1):
+    # links read before any detail page is opened: list elements go stale after navigation
+    links = []
+    for job in jobs:
         try:
             link = job.find_element(By.CSS_SELECTOR, "h2 a").get_attribute("href")
         except:
             continue
-
-        if not link.startswith("http"):
-            link = BASE_URL + link
-
-        print(f"[scrape_page] ({idx}/{len(jobs)}) opening: {link}")
-        scrape_detail_page(link)
-
-        # return to list page
-        try:
-            driver.back()
-            time.sleep(1)
-        except:
-            pass
+        if link:
+            links.append(link if link.startswith("http") else BASE_URL + link)
+
+    # offers already collected: no detail page, no CSV row
+    listed = len(links)
+    links = seen.unseen(links)
+
+    # detail pages fetched concurrently, each one saved as soon as it is read;
+    # the list driver stays on the list page (JavaScript pages go to the pool)
+    details = crawl_with_browser(links, parse_detail_page, DETAIL_READY, pool)
+    for idx, (link, data) in enumerate(details, start=1):
+        print(f"[scrape_page] ({idx}/{len(links)}) read: {link}")
+        if data is None:
+            print("[scrape_detail_page] error: no data for", link)
+            continue
+        save_detail(link, data)
+        seen.add(link)
+    return listed, listed - len(links)
 
 if __name__ == "__main__":
+    plan = plan_from_args("optioncarriere")
+    # offline: cached pages only, no Chrome and no seen index
+    driver = None if page_cache.offline else new_driver()
+    pool = DriverPool()
+    seen = SeenIndex("optioncarriere", enabled=not page_cache.offline)
     init_csv()
 
-    driver.get("https://www.optioncarriere.tn/emploi?s=&l=Tunisie&nw=1")
-    time.sleep(3)
-
-    while True:
-        print("\n[scraper] scraping job list page...")
-        scrape_page()
-
-        # next page
-        try:
-            next_button = driver.find_element(By.CSS_SELECTOR, "p.more button.next")
-            next_value = next_button.get_attribute("data-value")
-            next_url = f"{BASE_URL}/emploi?s=&l=Tunisie&nw=1&p={next_value}"
-
+    try:
+        # cached copy when it is fresh (or offline), else loaded in Chrome
+        list_page = open_list_page(driver, LIST_URL, LIST_READY)
+
+        page = 1
+        while True:
+            if list_page is None:
+                print("[scraper] list page not in the cache.")
+                break
+            print(f"\n[scraper] scraping job list page {page}...")
+            listed, known = scrape_page(list_page)
+
+            # next page (its button is missing on the last one)
+            try:
+                next_value = list_page.find_element(By.CSS_SELECTOR, "p.more button.next").get_attribute("data-value")
+            except Exception:
+                print("[scraper] no more pages.")
+                plan.exhausted()
+                break
+
+            # list pages are sorted newest first: stop at the known frontier
+            # (a resumed backfill jumps to the page it reached, p= is the page number)
+            following = plan.next_page(page, listed, known)
+            if following is None:
+                break
+            next_url = f"{LIST_URL}&p={next_value if following == page + 1 else following}"
+            page = following
             print(f"[scraper] next page: {next_url}")
-            driver.get(next_url)
-            time.sleep(2)
-        except Exception:
-            print("[scraper] no more pages.")
-            break
-
-    driver.quit()
+            list_page = open_list_page(driver, next_url, LIST_READY)
+
+        report()
+        seen.report()
+    finally:
+        seen.close()
+        pool.close()
+        if driver is not None:
+            driver.quit()
     print("\n[scraper] finished — data saved in:", os.path.abspath(CSV_FILE))
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+On-disk cache of the pages the scrapers read, with HTTP revalidation.
+
+Each URL has an index entry, src/Data/cache/pages/index/<sha256 of the
+URL>.json: status, response headers, time fetched and the digest of the
+body. Bodies are stored once per content, gzipped, under
+bodies/<digest[:2]>/<digest>.html.gz, so a page that did not change between
+two downloads (or two URLs serving the same HTML) takes no extra space.
+
+An entry younger than the TTL of its page kind (list pages change within
+minutes, detail pages hardly ever) is used without touching the network.
+An older one is revalidated: the request carries If-None-Match /
+If-Modified-Since from its ETag / Last-Modified, and a 304 answer keeps the
+stored body. Pages rendered in Chrome are cached too (their HTML after the
+scripts ran), without validators.
+
+In offline mode only the cache is read, whatever the age of its entries;
+pages that are not in it are missing. Selectors can then be developed and
+the parsers rerun without the network:
+
+    python -m src.scrapers.keejobs --offline
+
+The cache is off unless configure() turns it on (the scrapers do, see
+frontier.plan_from_args); deleting src/Data/cache/ empties it.
+"""
+import os
+import gzip
+import json
+import time
+import hashlib
+import threading
+
+CACHE_DIR = "src/Data/cache/pages"
+
+# Seconds an entry is used without revalidation, per page kind
+TTL = {
+    "list": 15 * 60,
+    "detail": 7 * 24 * 3600,
+}
+
+# Response headers kept with the body
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Date")
+
+enabled = False
+offline = False
+
+# (kind, "cached" / "revalidated" / "downloaded" / "rendered" / "missing") -> pages
+stats = {}
+_lock = threading.Lock()
+
+
+def configure(enable=True, offline_only=False):
+    """Turns the cache on (offline_only: never use the network, implies enable)."""
+    global enabled, offline
+    enabled = enable or offline_only
+    offline = offline_only
+
+
+def count(kind, event):
+    with _lock:
+        stats[kind, event] = stats.get((kind, event), 0) + 1
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _index_path(url):
+    return os.path.join(CACHE_DIR, "index", _sha256(url.encode("utf-8")) + ".json")
+
+
+def _body_path(digest):
+    return os.path.join(CACHE_DIR, "bodies", digest[:2], digest + ".html.gz")
+
+
+def _write(path, data):
+    """Writes to a temporary file then renames it: readers never see half a file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+# ---------------- ENTRIES ----------------
+
+def lookup(url):
+    """Index entry of url, None when it is not cached (or the cache is off)."""
+    if not enabled:
+        return None
+    try:
+        with open(_index_path(url), encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry if os.path.exists(_body_path(entry["digest"])) else None
+
+
+def body(entry):
+    with open(_body_path(entry["digest"]), "rb") as f:
+        return gzip.decompress(f.read())
+
+
+def usable(entry, kind):
+    """True when the entry can be read without the network: fresh, or offline mode."""
+    if entry is None:
+        return False
+    return offline or time.time() - entry["fetched_at"] < TTL.get(kind, 0)
+
+
+def validators(entry):
+    """Conditional request headers of a stale entry."""
+    headers = {}
+    if entry is not None:
+        if entry["headers"].get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+    return headers
+
+
+def store(url, kind, content, headers=None, base=None, status=200):
+    """
+    Caches a page body with its headers (`base`: URL the page was finally
+    served from, after redirects); returns the new entry, None when the
+    cache is off.
+    """
+    if not enabled:
+        return None
+    digest = _sha256(content)
+    if not os.path.exists(_body_path(digest)):
+        _write(_body_path(digest), gzip.compress(content, compresslevel=6))
+    entry = {
+        "url": url,
+        "base": base or url,
+        "kind": kind,
+        "status": status,
+        "headers": {name: headers[name] for name in KEPT_HEADERS if headers and name in headers},
+        "fetched_at": time.time(),
+        "digest": digest,
+    }
+    _write(_index_path(url), json.dumps(entry).encode("utf-8"))
+    return entry
+
+
+def revalidated(entry):
+    """The entry of a 304 answer: same body, fetched again now."""
+    entry = {**entry, "fetched_at": time.time()}
+    _write(_index_path(entry["url"]), json.dumps(entry).encode("utf-8"))
+    return entry
+
+
+def report():
+    """Pages per kind read from the cache, revalidated, downloaded, rendered or missing (offline)."""
+    for kind in sorted({k for k, _ in stats}):
+        events = ", ".join(f"{stats[k, e]} {e}" for k, e in sorted(stats) if k == kind)
+        print(f"[cache] {kind} pages: {events}")
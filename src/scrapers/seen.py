@@ -0,0 +1,160 @@
+"""
+Index of the offers already collected, so the scrapers skip them.
+
+A listing is known when the canonical key of its detail link
+(identity.job_key, the job_id of the cleaners and the loader) is in its
+source's index. The index is a set of 16-byte keys loaded when the scraper
+starts from:
+
+  - the source's key file, src/Data/seen/<source>.keys (one file per
+    source: the scrapers run in parallel processes);
+  - the job_id column of the source's cleaned CSV;
+  - the jobs table, when the database answers.
+
+The file is rewritten with the whole index at load, then every offer read
+is appended to it at once: main_pipeline stops the scrapers by killing
+them, so nothing waits for the end of the run. Known listings are dropped
+from the list page before any detail page is fetched, and report() prints
+the share skipped. Deleting a key file (and passing use_db=False) makes
+the next run read every offer again. An offline run (page cache only)
+uses an empty index that stores nothing, so the parsers reread every
+cached offer.
+"""
+import os
+import pandas as pd
+from src.identity import job_key, parse_job_key
+
+SEEN_DIR = "src/Data/seen"
+
+# Cleaned CSV of each source (scrapers' `source` column value)
+CLEANED = {
+    "keejob": "src/Data/cleanedData/job_keejobs_cleaned.csv",
+    "emploitunisie": "src/Data/cleanedData/job_emploisTunisie_cleaned.csv",
+    "optioncarriere": "src/Data/cleanedData/jobs_optioncarriere_cleaned.csv",
+}
+
+KEY_SIZE = 16
+
+
+def link_key(link):
+    return job_key(link).bytes
+
+
+# ---------------- SOURCES OF KEYS ----------------
+
+def keys_from_file(path):
+    if not os.path.exists(path):
+        return set()
+    with open(path, "rb") as f:
+        data = f.read()
+    return {data[i:i + KEY_SIZE] for i in range(0, len(data) - KEY_SIZE + 1, KEY_SIZE)}
+
+
+def keys_from_csv(path):
+    """Keys of a cleaned CSV: its job_id column, the detail link for rows without one."""
+    if not os.path.exists(path):
+        return set()
+    df = pd.read_csv(path, encoding="utf-8-sig", dtype=str,
+                     usecols=lambda c: c in ("job_id", "detail_link"))
+    keys = set()
+    for row in df.to_dict("records"):
+        key = parse_job_key(row.get("job_id"))
+        if key is not None:
+            keys.add(key.bytes)
+        elif isinstance(row.get("detail_link"), str):
+            keys.add(link_key(row["detail_link"]))
+    return keys
+
+
+def keys_from_db(source):
+    """job_id of the source's rows in the jobs table, empty when the database is not reachable."""
+    # imported here: the scrapers run without a database configured
+    try:
+        from sqlalchemy import select
+        from src.db.db_session import engine
+        from src.db.models import Job
+        with engine.connect() as conn:
+            rows = conn.execute(select(Job.job_id).where(Job.source == source)).scalars()
+            return {key.bytes for key in rows}
+    except Exception as e:
+        print(f"[seen] {source}: jobs table not read ({type(e).__name__})")
+        return set()
+
+
+# ---------------- INDEX ----------------
+
+class SeenIndex:
+    """
+    Offers of one source already collected:
+
+        seen = SeenIndex("keejob")
+        for job in seen.unseen(listings, link=lambda job: job["detail_link"]):
+            ...                         # fetch the detail page, write the row
+            seen.add(job["detail_link"])
+        seen.close()
+    """
+
+    def __init__(self, source, path=None, cleaned=None, use_db=True, enabled=True):
+        self.source = source
+        self.path = path or os.path.join(SEEN_DIR, f"{source}.keys")
+        self.keys = set()
+        self.log = None
+        if enabled:
+            self.keys = keys_from_file(self.path)
+            self.keys |= keys_from_csv(cleaned or CLEANED.get(source, ""))
+            if use_db:
+                self.keys |= keys_from_db(source)
+            self.save()
+            self.log = open(self.path, "ab")
+        self.loaded = len(self.keys)
+        self.listed = 0
+        self.skipped = 0
+        self.added = 0
+
+    def __contains__(self, link):
+        return link_key(link) in self.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    def unseen(self, items, link=lambda item: item):
+        """The items whose detail link is not known yet; counts the ones skipped."""
+        items = list(items)
+        fresh = [item for item in items if link(item) not in self]
+        self.listed += len(items)
+        self.skipped += len(items) - len(fresh)
+        print(f"[seen] {self.source}: {len(items) - len(fresh)}/{len(items)} listings already collected")
+        return fresh
+
+    def add(self, link):
+        """Marks an offer as collected (call once its row is written) and appends it to the file."""
+        key = link_key(link)
+        if key not in self.keys:
+            self.keys.add(key)
+            self.added += 1
+            if self.log is not None:
+                self.log.write(key)
+                self.log.flush()
+
+    def save(self):
+        """
+        Rewrites the key file with the whole index (temporary file then
+        rename, so a crash never truncates it, and a key cut short by a kill
+        is dropped).
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(sorted(self.keys)))
+        os.replace(tmp, self.path)
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+
+    def skip_ratio(self):
+        return self.skipped / self.listed if self.listed else 0.0
+
+    def report(self):
+        print(f"[seen] {self.source}: {self.skipped}/{self.listed} listings already collected "
+              f"({self.skip_ratio():.0%} skipped), {self.added} new, index {self.loaded} -> {len(self)} offers")
@@ -0,0 +1,99 @@
+"""
+Condition-based waits for the pages loaded in Chrome.
+
+A page is ready when the element its parser reads is in the DOM
+(`article`, `div.prose`, `section.content`...), so instead of sleeping a
+fixed 1-3 s the scrapers wait with WebDriverWait for that CSS selector,
+polling every POLL seconds, up to the timeout of the site (TIMEOUTS). The
+drivers use the "eager" page load strategy: driver.get() returns once the
+DOM is parsed, without waiting for images, fonts and third-party scripts.
+
+Every wait is recorded per site and page kind (list, detail, cookies), and
+report() prints how long the scraper actually waited.
+"""
+import time
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+PAGE_LOAD_STRATEGY = "eager"
+
+# Longest wait for a page's selector, per site (seconds)
+TIMEOUTS = {
+    "www.keejob.com": 10,
+    "www.emploitunisie.com": 10,
+    "www.optioncarriere.tn": 15,
+}
+DEFAULT_TIMEOUT = 10
+
+# Cookie banners are not on every page: short wait
+COOKIE_TIMEOUT = 2
+
+POLL = 0.1
+
+# (host, kind) -> [(seconds waited, selector found)]
+waited = defaultdict(list)
+_lock = threading.Lock()
+
+
+def timeout_for(url):
+    return TIMEOUTS.get(urlsplit(url).netloc, DEFAULT_TIMEOUT)
+
+
+def _record(url, kind, seconds, found):
+    with _lock:
+        waited[urlsplit(url).netloc, kind].append((seconds, found))
+
+
+def wait_for(driver, selector, kind="page", timeout=None, condition=EC.presence_of_element_located):
+    """
+    Waits until `condition` holds for the CSS selector; True if it did
+    before the timeout (the site's one by default), False otherwise.
+    """
+    url = driver.current_url
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout or timeout_for(url), poll_frequency=POLL).until(
+            condition((By.CSS_SELECTOR, selector)))
+        found = True
+    except TimeoutException:
+        found = False
+    _record(url, kind, time.perf_counter() - start, found)
+    return found
+
+
+def load(driver, url, selector, kind="page"):
+    """driver.get(url), then waits for the selector; False if it never showed up."""
+    driver.get(url)
+    found = wait_for(driver, selector, kind)
+    if not found:
+        print(f"[wait] {url}: no {selector!r} after {timeout_for(url)} s")
+    return found
+
+
+def click_if_present(driver, selector, kind="cookies", timeout=COOKIE_TIMEOUT):
+    """
+    Clicks the element once it is clickable (cookie banners), then waits
+    for it to disappear. False if it did not show up within `timeout`.
+    """
+    if not wait_for(driver, selector, kind, timeout, EC.element_to_be_clickable):
+        return False
+    try:
+        driver.find_element(By.CSS_SELECTOR, selector).click()
+        wait_for(driver, selector, kind, timeout, EC.invisibility_of_element_located)
+        return True
+    except WebDriverException:
+        return False
+
+
+def report():
+    """Time actually waited per site and page kind."""
+    for (host, kind), waits in sorted(waited.items()):
+        seconds = sorted(s for s, _ in waits)
+        timeouts = sum(not found for _, found in waits)
+        print(f"[wait] {host} {kind}: {len(waits)} waits, mean {sum(seconds) / len(seconds):.2f} s, "
+              f"max {seconds[-1]:.2f} s, {timeouts} timeouts")
@@ -4,10 +4,12 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import sessionmaker
 from db.db_session import engine
-from db.models import Job
+from db.models import Job, JobCluster
 from datetime import datetime
+from uuid import UUID
 
 app = FastAPI(
     title="Job Aggregator API",
@@ -43,6 +45,7 @@ class JobOut(BaseModel):
     location: Optional[str] = None
     region: Optional[str] = None
     city: Optional[str] = None
+    country: Optional[str] = None
     salary_min: Optional[int] = None
     salary_max: Optional[int] = None
     description: Optional[str] = None
@@ -53,12 +56,39 @@ class JobOut(BaseModel):
         from_attributes = True
 
 
+def job_to_dict(job):
+    return {
+        "id": job.id,
+        "job_id": str(job.job_id),
+        "source": job.source,
+        "title": job.title,
+        "detail_link": job.detail_link,
+        "company": job.company,
+        "date_publication": job.date_publication.isoformat() if job.date_publication else None,
+        "sector": job.sector,
+        "contract_type": job.contract_type,
+        "study_level": job.study_level,
+        "experience": job.experience,
+        "availability": job.availability,
+        "location": job.location,
+        "region": job.region,
+        "city": job.city,
+        "country": job.country,
+        "salary_min": job.salary_min,
+        "salary_max": job.salary_max,
+        "description": job.description,
+        "skills": job.skills,
+        "scraped_at": job.scraped_at.isoformat() if job.scraped_at else None
+    }
+
+
 @app.get("/jobs", response_model=List[JobOut])
 def get_jobs(
     search: Optional[str] = Query(None, description="Recherche dans titre, entreprise, compétences"),
-    country: Optional[str] = Query(None, description="Filtrer par pays (ex: France)"),
+    country: Optional[str] = Query(None, description="Filtrer par code pays ISO (ex: TN, FR)"),
     limit: int = Query(50, ge=1, le=200, description="Nombre max d'offres"),
-    offset: int = Query(0, ge=0, description="Pagination")
+    offset: int = Query(0, ge=0, description="Pagination"),
+    collapse_duplicates: bool = Query(True, description="Une seule offre par groupe de doublons inter-sites")
 ):
     session = SessionLocal()
     try:
@@ -75,7 +105,12 @@ def get_jobs(
             )
 
         if country:
-            query = query.filter(Job.country.ilike(f"%{country}%"))
+            query = query.filter(Job.country == country.strip().upper())
+
+        if collapse_duplicates:
+            # masque les doublons non canoniques (table remplie par loadDB/dedup.py)
+            duplicates = select(JobCluster.job_id).where(JobCluster.is_canonical.is_(False))
+            query = query.filter(Job.job_id.not_in(duplicates))
 
         # Tri par date décroissante
         query = query.order_by(Job.date_publication.desc().nulls_last())
@@ -84,31 +119,7 @@ def get_jobs(
         jobs = query.offset(offset).limit(limit).all()
 
         # Conversion en dictionnaires pour la sérialisation
-        jobs_data = []
-        for job in jobs:
-            job_dict = {
-                "id": job.id,
-                "job_id": job.job_id,
-                "source": job.source,
-                "title": job.title,
-                "detail_link": job.detail_link,
-                "company": job.company,
-                "date_publication": job.date_publication.isoformat() if job.date_publication else None,
-                "sector": job.sector,
-                "contract_type": job.contract_type,
-                "study_level": job.study_level,
-                "experience": job.experience,
-                "availability": job.availability,
-                "location": job.location,
-                "region": job.region,
-                "city": job.city,
-                "salary_min": job.salary_min,
-                "salary_max": job.salary_max,
-                "description": job.description,
-                "skills": job.skills,
-                "scraped_at": job.scraped_at.isoformat() if job.scraped_at else None
-            }
-            jobs_data.append(job_dict)
+        jobs_data = [job_to_dict(job) for job in jobs]
 
         print(f"[DEBUG] Returning {len(jobs_data)} jobs out of {total} total")  # Debug
         
@@ -124,6 +135,31 @@ def get_jobs(
         session.close()
 
 
+@app.get("/jobs/{job_id}/duplicates", response_model=List[JobOut])
+def get_job_duplicates(job_id: UUID):
+    """Les autres publications de la même offre (même groupe de doublons)."""
+    session = SessionLocal()
+    try:
+        cluster = select(JobCluster.cluster_id).where(JobCluster.job_id == job_id).correlate(None).scalar_subquery()
+        jobs = (
+            session.query(Job)
+            .join(JobCluster, JobCluster.job_id == Job.job_id)
+            .filter(JobCluster.cluster_id == cluster, Job.job_id != job_id)
+            .order_by(JobCluster.is_canonical.desc(), Job.id)
+            .all()
+        )
+        return [job_to_dict(job) for job in jobs]
+
+    except Exception as e:
+        print(f"[ERROR] {str(e)}")  # Debug
+        return JSONResponse(
+            status_code=500,
+            content={"error": str(e)}
+        )
+    finally:
+        session.close()
+
+
 # Route de test rapide
 @app.get("/")
 def root():
@@ -0,0 +1,33 @@
+"""merge_new_rows on typed cleaned frames."""
+import warnings
+import pandas as pd
+from src.cleaning.cleaned_io import STANDARD_COLUMNS, merge_new_rows, read_cleaned, to_typed
+
+CLEANED = "src/Data/cleanedData/job_keejobs_cleaned.csv"
+
+
+def new_rows(df_old, count):
+    """`count` rows shaped like fresh mapper output: new job_ids, optional columns all empty."""
+    df = df_old.head(count).copy()
+    df["job_id"] = [f"00000000-0000-0000-0000-{n:012d}" for n in range(count)]
+    for col in ("sector", "region", "country", "salary_min", "salary_max", "company"):
+        df[col] = ""
+    return to_typed(df)
+
+
+def test_merge_keeps_types_without_warnings():
+    df_old = read_cleaned(CLEANED)
+    df_new = new_rows(df_old, 5)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        merged = merge_new_rows(df_old, pd.concat([df_new, df_new.head(2)], ignore_index=True))
+    assert len(merged) == len(df_old) + 5
+    assert merged["job_id"].is_unique
+    assert merged.dtypes.to_dict() == to_typed(merged).dtypes.to_dict()
+    assert list(merged.columns) == STANDARD_COLUMNS
+
+
+def test_merge_without_new_rows_returns_the_old_ones():
+    df_old = read_cleaned(CLEANED)
+    merged = merge_new_rows(df_old, df_old.head(3))
+    assert merged["job_id"].tolist() == df_old["job_id"].tolist()
@@ -0,0 +1,60 @@
+"""engine/dates.py against the golden cases of src/Data/reference/dates_golden.csv."""
+import re
+import pandas as pd
+import pytest
+from src.benchmarks.bench_dates import golden_cases
+from src.cleaning.engine import dates
+
+GOLDEN = golden_cases()
+CASES = list(GOLDEN.itertuples(index=False))
+IDS = [f"{case.value!r}@{case.scraped_at}" for case in CASES]
+
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@pytest.mark.parametrize("case", CASES, ids=IDS)
+def test_parse_dates_golden_case(case):
+    parsed = dates.parse_dates(pd.Series([case.value]), reference=pd.Series([case.scraped_at]))
+    assert parsed.iloc[0] == case.expected
+
+
+def test_parse_dates_golden_column():
+    """All cases in one call: each row resolved against its own scraped_at."""
+    parsed = dates.parse_dates(GOLDEN["value"], reference=GOLDEN["scraped_at"])
+    assert parsed.tolist() == GOLDEN["expected"].tolist()
+
+
+@pytest.mark.parametrize("case", CASES, ids=IDS)
+def test_classify_golden_case(case):
+    parts = dates.classify(pd.Series([case.value], dtype=object)).iloc[0]
+    relative, absolute = pd.notna(parts["offset"]), pd.notna(parts["absolute"])
+    if not ISO_DATE.fullmatch(case.expected):
+        # not a date (or an impossible one), kept as is: neither relative nor absolute
+        assert not relative and not absolute
+        return
+    assert relative != absolute
+    if absolute:
+        assert parts["absolute"].strftime("%Y-%m-%d") == case.expected
+    else:
+        # scraped_at, or now when it is missing or unreadable
+        reference = dates.reference_times(pd.Series([case.scraped_at]), pd.RangeIndex(1)).iloc[0]
+        resolved = reference - pd.Timedelta(seconds=parts["offset"])
+        assert resolved.strftime("%Y-%m-%d") == case.expected
+
+
+@pytest.mark.parametrize("value, seconds", [
+    ("Aujourd'hui", 0),
+    ("Hier", 86400),
+    ("Avant-hier", 2 * 86400),
+    ("Il y a 45 minutes", 45 * 60),
+    ("Il y a 18 heures", 18 * 3600),
+    ("Il y a un jour", 86400),
+    ("Il y a 2 semaines", 14 * 86400),
+    ("Il y a 1 mois", 30 * 86400),
+    ("Il y a un an", 365 * 86400),
+    ("an hour ago", 3600),
+])
+def test_classify_relative_offsets(value, seconds):
+    parts = dates.classify(pd.Series([value], dtype=object)).iloc[0]
+    assert parts["offset"] == seconds
+    assert pd.isna(parts["absolute"])
@@ -0,0 +1,53 @@
+"""Backfill schedule of frontier.CrawlPlan across runs."""
+from datetime import datetime
+import pytest
+from src.scrapers import frontier
+
+
+@pytest.fixture(autouse=True)
+def seen_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(frontier, "SEEN_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_first_run_is_incremental_and_starts_the_schedule():
+    plan = frontier.CrawlPlan("keejob")
+    assert plan.mode == "incremental"
+    assert frontier.load_schedule("keejob") == {"since": plan.schedule["since"], "page": None}
+    # within BACKFILL_EVERY of the first run: still incremental
+    assert frontier.CrawlPlan("keejob").mode == "incremental"
+
+
+def test_incremental_run_stops_at_the_frontier():
+    plan = frontier.CrawlPlan("keejob")
+    assert plan.next_page(1, 20, 3) == 2
+    assert plan.next_page(2, 20, 16) is None
+
+
+def test_backfill_due_after_a_week_resumes_where_it_was_cut():
+    frontier.save_schedule("keejob", datetime.now() - frontier.BACKFILL_EVERY)
+    plan = frontier.CrawlPlan("keejob")
+    assert plan.mode == "backfill"
+    # known pages do not stop a backfill; the run is killed after page 3
+    for page in (1, 2, 3):
+        assert plan.next_page(page, 20, 20) == page + 1
+    assert frontier.load_schedule("keejob")["page"] == 3
+
+    # next run: newest pages up to the frontier, then the page reached
+    plan = frontier.CrawlPlan("keejob")
+    assert (plan.mode, plan.resume) == ("backfill", 3)
+    assert plan.next_page(1, 20, 5) == 2
+    assert plan.next_page(2, 20, 18) == 3
+    assert plan.next_page(3, 20, 20) == 4
+    assert plan.next_page(4, 0, 0) is None
+
+    schedule = frontier.load_schedule("keejob")
+    assert schedule["page"] is None
+    assert datetime.now() - schedule["since"] < frontier.BACKFILL_EVERY
+    assert frontier.CrawlPlan("keejob").mode == "incremental"
+
+
+def test_date_only_schedule_files_are_still_read(seen_dir):
+    (seen_dir / "keejob.backfill").write_text("2025-11-01T08:00:00", encoding="utf-8")
+    assert frontier.load_schedule("keejob") == {"since": datetime(2025, 11, 1, 8), "page": None}
+    assert frontier.CrawlPlan("keejob").mode == "backfill"
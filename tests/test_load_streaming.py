@@ -0,0 +1,73 @@
+"""load_csv_to_db_streaming keeps its memory bounded by the chunk size, not the file size."""
+import tracemalloc
+import pandas as pd
+from src.loadDB.loadData import load_csv_to_db_streaming
+from src.loadDB.run_report import FileReport
+
+SAMPLE = "src/Data/cleanedData/job_keejobs_cleaned.csv"
+CHUNK = 250
+SMALL_ROWS = 1_000
+
+# Peak growth allowed for a file 10x larger (the small run's peak is a few MB)
+PEAK_BOUND = 1.25
+
+
+class StubResult:
+    def all(self):
+        return []
+
+
+class StubSession:
+    """Stands in for the Postgres session: counts the rows it is sent, keeps none."""
+
+    def __init__(self):
+        self.rows = 0
+
+    def execute(self, stmt, rows):
+        self.rows += len(rows)
+        return StubResult()
+
+    def commit(self):
+        pass
+
+    def expunge_all(self):
+        pass
+
+
+def write_cleaned_csv(path, rows):
+    """Cleaned CSV of `rows` rows cycled from the Keejob sample, each with its own detail link."""
+    sample = pd.read_csv(SAMPLE, encoding="utf-8-sig", dtype=str).drop(columns=["job_id"])
+    for start in range(0, rows, len(sample)):
+        chunk = sample.head(rows - start).copy()
+        chunk["detail_link"] = chunk["detail_link"] + "?n=" + (chunk.index + start).astype(str)
+        chunk.to_csv(path, mode="a", header=start == 0, index=False, encoding="utf-8-sig" if start == 0 else "utf-8")
+
+
+def streaming_peak(path):
+    session = StubSession()
+    report = FileReport(str(path))
+    tracemalloc.start()
+    try:
+        load_csv_to_db_streaming(str(path), session, report, chunksize=CHUNK)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        report.close()
+    return peak, session.rows, report
+
+
+def test_streaming_peak_does_not_grow_with_file_size(tmp_path):
+    small, large = tmp_path / "small.csv", tmp_path / "large.csv"
+    write_cleaned_csv(small, SMALL_ROWS)
+    write_cleaned_csv(large, 10 * SMALL_ROWS)
+
+    # first run warms up imports and caches, so both measured runs start alike
+    streaming_peak(small)
+    small_peak, small_rows, small_report = streaming_peak(small)
+    large_peak, large_rows, large_report = streaming_peak(large)
+
+    assert (small_rows, large_rows) == (SMALL_ROWS, 10 * SMALL_ROWS)
+    assert small_report.counts["rejected"] == large_report.counts["rejected"] == 0
+    assert large_peak <= PEAK_BOUND * small_peak, (
+        f"peak {large_peak / 1e6:.1f} MB for {10 * SMALL_ROWS} rows vs {small_peak / 1e6:.1f} MB for {SMALL_ROWS}"
+    )
@@ -0,0 +1,41 @@
+"""LSH candidate pairs and cluster verification on hand-built signatures."""
+import numpy as np
+from src.loadDB import dedup, minhash
+
+
+def signatures(*columns_values):
+    """One signature per argument: [(first column, last column + 1, value), ...]."""
+    sig = np.zeros((len(columns_values), minhash.NUM_PERM), dtype=np.uint32)
+    for doc, spans in enumerate(columns_values):
+        for start, end, value in spans:
+            sig[doc, start:end] = value
+    return sig
+
+
+def test_bucket_members_are_paired_with_each_other():
+    # all three share band 0; only documents 1 and 2 agree everywhere else
+    sig = signatures([(0, 8, 1), (8, 128, 5)], [(0, 8, 1), (8, 128, 7)], [(0, 8, 1), (8, 128, 7)])
+    pairs = minhash.candidate_pairs(sig, np.ones(3, dtype=bool))
+    assert {tuple(p) for p in pairs.tolist()} == {(0, 1), (0, 2), (1, 2)}
+    assert minhash.similar_pairs(sig, pairs).tolist() == [[1, 2]]
+
+
+def test_invalid_documents_are_not_bucketed():
+    sig = signatures([(0, 128, 1)], [(0, 128, 1)], [(0, 128, 1)])
+    pairs = minhash.candidate_pairs(sig, np.array([True, False, True]))
+    assert pairs.tolist() == [[0, 2]]
+
+
+def test_chained_jobs_leave_the_cluster():
+    # a~b and b~c (0.75) but a and c only share half their signature
+    sig = signatures([(0, 128, 1)],
+                     [(0, 96, 1), (96, 128, 2)],
+                     [(0, 32, 3), (32, 96, 1), (96, 128, 2)])
+    assert minhash.similarity(sig, 0, 2) == 0.5
+    meta = {"id": [1, 2, 3], "job_id": ["a", "b", "c"],
+            "source": ["keejob", "emploitunisie", "optioncarriere"], "completeness": [9, 5, 5]}
+    rows, _ = dedup.find_clusters(meta, sig)
+    assert {r["job_id"]: (r["cluster_id"], r["is_canonical"]) for r in rows} == {
+        "a": ("a", True), "b": ("a", False),
+    }
+    assert all(r["similarity"] >= minhash.THRESHOLD for r in rows)
@@ -0,0 +1,24 @@
+"""The scrapers' pure detail page parsers against the pages recorded in src/Data/fixtures."""
+import pytest
+
+pytest.importorskip("selenium")
+
+from src.scrapers.fetch import is_ready, page_from_html  # noqa: E402
+from src.benchmarks.record_fixtures import HTML_PARSERS, load_fixtures  # noqa: E402
+
+FIXTURES = [(source, fixture) for source in HTML_PARSERS for fixture in load_fixtures(source)]
+
+
+@pytest.mark.parametrize("source", list(HTML_PARSERS))
+def test_every_source_has_a_recorded_page(source):
+    assert load_fixtures(source), f"no recorded detail page in src/Data/fixtures/{source}"
+
+
+@pytest.mark.parametrize("source, fixture", FIXTURES,
+                         ids=[f"{source}/{fixture['file']}" for source, fixture in FIXTURES])
+def test_parser_matches_expected_record(source, fixture):
+    parse, ready = HTML_PARSERS[source]
+    assert is_ready(page_from_html(fixture["html"], fixture["url"]), ready)
+    record = parse(fixture["html"], fixture["url"])
+    for field, expected in fixture["record"].items():
+        assert record.get(field) == expected, f"{source}/{fixture['file']}: {field}"
@@ -0,0 +1,33 @@
+"""engine.vector.parse_salary on the salary formats of the three sites."""
+import warnings
+import pandas as pd
+from src.cleaning.engine import vector
+
+CASES = [
+    ("('1200', '1500')", "1200", "1500"),
+    ("('900',)", "900", "900"),
+    ("3500 - 4000 TND / Mois", "3500", "4000"),
+    ("< 1000 DT", "", "1000"),
+    (">2000dt", "2000", ""),
+    ("1200", "1200", "1200"),
+    ("Non précisé", "", ""),
+    ("", "", ""),
+    (None, "", ""),
+]
+
+
+def test_parse_salary_without_warnings():
+    values = pd.Series([value for value, _, _ in CASES], dtype=object)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        parsed = vector.parse_salary(values)
+    assert list(zip(parsed[0], parsed[1])) == [(low, high) for _, low, high in CASES]
+
+
+def test_parse_salary_column_without_any_salary():
+    # Keejob pages mostly have none: every extracted group is NA
+    values = pd.Series([None, "", "Non précisé"], dtype=object)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        parsed = vector.parse_salary(values)
+    assert parsed[0].tolist() == parsed[1].tolist() == ["", "", ""]